@@ -20,6 +20,10 @@ class Filepaths:
     REGISTRY_FILE = LOCAL_ENVIRONMENT_DIR.joinpath(Path("registry.json"))
 
     PREP_REQUESTS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("prep_requests_cache")
+    DOI_METADATA_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("doi_metadata_cache.db")
+    PACKAGE_ENDPOINT_REGISTRY_FILE = LOCAL_ENVIRONMENT_DIR / Path(
+        "package_endpoint_registry.json"
+    )
 
 
 class FileSets:
@@ -182,9 +186,14 @@ class LocalIndexFields:
     ID = "id"
     CITATION_KEY = "citation_key"
     BIBTEX = "bibtex"
+    RECORD_JSON = "record_json"
     TEI = "tei"
     DBLP_KEY = "dblp_key"
     TOC_KEY = "toc_key"
+    REPO_SOURCE_PATH = "repo_source_path"
+    HEAD_SHA = "head_sha"
+    RECORDS_BLOB_SHA = "records_blob_sha"
+    SHARED_RECORDS = "shared_records"
 
 
 class FieldValues:
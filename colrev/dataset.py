@@ -2,10 +2,15 @@
 """Functionality for data/records.bib and git repository."""
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import os
+import shutil
 import tempfile
 import time
 import typing
+from copy import deepcopy
 from pathlib import Path
 from random import randint
 
@@ -18,14 +23,16 @@ import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.ops.check
 import colrev.process.operation
+import colrev.process.status
 import colrev.record.record
+import colrev.record.record_history
 import colrev.record.record_id_setter
 import colrev.record.record_prep
+import colrev.writer.bib
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import FileSets
 from colrev.constants import RecordState
-from colrev.writer.write_utils import to_string
 
 # pylint: disable=too-many-public-methods
 
@@ -35,8 +42,16 @@ class Dataset:
 
     _git_repo: git.Repo
 
+    # Note : the cache is stored in the git directory (never committed)
+    RECORDS_HEADER_CACHE_FILE = Path("colrev/records_header_cache.json")
+    RECORDS_HEADER_CACHE_VERSION = 2
+
     def __init__(self, *, review_manager: colrev.review_manager.ReviewManager) -> None:
         self.review_manager = review_manager
+        self._records_header_cache: typing.Optional[dict] = None
+        self._record_history: typing.Optional[
+            colrev.record.record_history.RecordHistory
+        ] = None
 
         try:
             # In most cases, the repo should exist
@@ -82,23 +97,15 @@ class Dataset:
 
         current_origin_states_dict = {}
         if records_string != "":
-            with tempfile.NamedTemporaryFile(
-                mode="wb", delete=False, suffix=".bib"
-            ) as temp_file:
-                temp_file.write(records_string.encode("utf-8"))
-                temp_file_path = Path(temp_file.name)
             bib_loader = colrev.loader.bib.BIBLoader(
-                filename=temp_file_path,
+                file_object=io.StringIO(records_string),
                 logger=self.review_manager.logger,
                 unique_id_field="ID",
             )
+            record_header_items = bib_loader.get_record_header_items()
         else:
-            bib_loader = colrev.loader.bib.BIBLoader(
-                filename=self.review_manager.paths.records,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
-        for record_header_item in bib_loader.get_record_header_items().values():
+            record_header_items = self._get_record_header_items()
+        for record_header_item in record_header_items.values():
             for origin in record_header_item[Fields.ORIGIN]:
                 current_origin_states_dict[origin] = record_header_item[Fields.STATUS]
         return current_origin_states_dict
@@ -139,10 +146,11 @@ class Dataset:
             dict: Records file contents at a specific Git history point, as a dictionary.
         """
 
+        record_history = self.get_record_history()
+        # Note : versions of records that did not change are parsed only once
+        parsed_versions: dict = {}
         reached_target_commit = False  # if no commit_sha provided
-        for current_commit in self._git_repo.iter_commits(
-            paths=self.review_manager.paths.RECORDS_FILE_GIT
-        ):
+        for current_commit in record_history.get_commits():
 
             # Skip all commits before the specified commit_sha, if provided
             if commit_sha and not reached_target_commit:
@@ -151,19 +159,43 @@ class Dataset:
                     continue
                 reached_target_commit = True
 
-            # Read and parse the records file from the current commit
-            filecontents = (
-                current_commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-            ).data_stream.read()
-
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8", "replace"),
-                implementation="bib",
-                logger=self.review_manager.logger,
+            record_hashes = record_history.get_record_hashes(current_commit)
+            new_record_ids = [
+                record_id
+                for record_id, record_hash in record_hashes.items()
+                if record_hash not in parsed_versions
+            ]
+            new_records = (
+                record_history.load_records(current_commit, record_ids=new_record_ids)
+                if new_record_ids
+                else {}
             )
+            parsed_versions = {
+                record_hash: (
+                    parsed_versions[record_hash]
+                    if record_hash in parsed_versions
+                    else new_records.get(record_id)
+                )
+                for record_id, record_hash in record_hashes.items()
+            }
+
+            # Note : copies (the records may be modified by the caller)
+            records_dict = {
+                record_id: deepcopy(parsed_versions[record_hash])
+                for record_id, record_hash in record_hashes.items()
+                if parsed_versions[record_hash] is not None
+            }
             if records_dict:
                 yield records_dict
 
+    def get_record_history(self) -> colrev.record.record_history.RecordHistory:
+        """Get the (indexed) history of the records"""
+        if self._record_history is None:
+            self._record_history = colrev.record.record_history.RecordHistory(
+                review_manager=self.review_manager, git_repo=self._git_repo
+            )
+        return self._record_history
+
     def load_records_dict(
         self,
         *,
@@ -188,12 +220,7 @@ class Dataset:
         if header_only:
             # Note : currently not parsing screening_criteria to settings.ScreeningCriterion
             # to optimize performance
-            bib_loader = colrev.loader.bib.BIBLoader(
-                filename=self.review_manager.paths.records,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
-            return bib_loader.get_record_header_items()
+            return self._get_record_header_items()
 
         if self.review_manager.paths.records.is_file():
 
@@ -208,74 +235,334 @@ class Dataset:
 
         return records_dict
 
+    def _get_records_header_cache_path(self) -> Path:
+        return Path(self._git_repo.git_dir) / self.RECORDS_HEADER_CACHE_FILE
+
+    def _load_records_header_cache(self) -> typing.Optional[dict]:
+        cache = self._records_header_cache
+        if cache is None:
+            try:
+                cache = json.loads(
+                    self._get_records_header_cache_path().read_text(encoding="utf-8")
+                )
+            except (FileNotFoundError, ValueError):
+                cache = None
+            if cache and cache["version"] != self.RECORDS_HEADER_CACHE_VERSION:
+                cache = None
+        return cache
+
+    def _get_current_records_header_cache(self) -> typing.Optional[dict]:
+        """Get the records header cache if it corresponds to the records file"""
+        records_file = self.review_manager.paths.records
+        if not records_file.is_file():
+            return None
+        stat = records_file.stat()
+        cache = self._load_records_header_cache()
+        if cache and (cache["size"], cache["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return cache
+        return None
+
+    @staticmethod
+    def _get_blob_sha(path: Path) -> str:
+        # Note : the file is hashed in chunks (like git hash-object)
+        blob_sha = hashlib.sha1(
+            b"blob %d\0" % path.stat().st_size, usedforsecurity=False
+        )
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                blob_sha.update(chunk)
+        return blob_sha.hexdigest()
+
+    def _get_record_header_items(self) -> dict:
+        """Get the record header items, which are cached (in the git directory)
+        as long as the records file does not change"""
+
+        records_file = self.review_manager.paths.records
+        if not records_file.is_file():
+            return {}
+
+        cache = self._get_current_records_header_cache()
+        if cache:
+            self._records_header_cache = cache
+            return self._record_header_items_from_cache(cache["items"])
+
+        # The blob hash identifies content that did not change
+        # (e.g., when the file was touched or checked out again)
+        stat = records_file.stat()
+        cache = self._load_records_header_cache()
+        blob_sha = self._get_blob_sha(records_file)
+        if not cache or cache["blob_sha"] != blob_sha:
+            bib_loader = colrev.loader.bib.BIBLoader(
+                filename=records_file,
+                logger=self.review_manager.logger,
+                unique_id_field="ID",
+            )
+            cache = {
+                "version": self.RECORDS_HEADER_CACHE_VERSION,
+                "blob_sha": blob_sha,
+                "items": self._record_header_items_to_cache(
+                    bib_loader.get_record_header_items()
+                ),
+            }
+        cache.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        self._store_records_header_cache(cache)
+        return self._record_header_items_from_cache(cache["items"])
+
+    def get_status_aggregate(
+        self, *, recompute: bool = False
+    ) -> colrev.process.status.StatusAggregate:
+        """Get the status aggregate of the records, which is cached with the
+        record header items and updated incrementally by partial saves"""
+
+        record_header_items = self._get_record_header_items()
+        cache = self._records_header_cache
+        if not self.review_manager.paths.records.is_file() or cache is None:
+            return colrev.process.status.StatusAggregate.from_records(
+                record_header_items
+            )
+        if recompute or "status_aggregate" not in cache:
+            cache["status_aggregate"] = (
+                colrev.process.status.StatusAggregate.from_records(
+                    record_header_items
+                ).to_dict()
+            )
+            self._store_records_header_cache(cache)
+        return colrev.process.status.StatusAggregate.from_dict(
+            cache["status_aggregate"]
+        )
+
+    def _store_records_header_cache(self, cache: dict) -> None:
+        self._records_header_cache = cache
+        cache_path = self._get_records_header_cache_path()
+        try:
+            cache_path.parent.mkdir(exist_ok=True, parents=True)
+            cache_path.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError:  # pragma: no cover
+            pass  # e.g., read-only file system
+
+    @staticmethod
+    def _record_header_items_to_cache(record_header_items: dict) -> list:
+        return [
+            {
+                **item,
+                **(
+                    {Fields.STATUS: item[Fields.STATUS].name}
+                    if Fields.STATUS in item
+                    else {}
+                ),
+                **(
+                    {Fields.FILE: str(item[Fields.FILE])} if Fields.FILE in item else {}
+                ),
+            }
+            for item in record_header_items.values()
+        ]
+
+    @staticmethod
+    def _record_header_items_from_cache(cached_items: list) -> dict:
+        record_header_items = {}
+        for cached_item in cached_items:
+            item = dict(cached_item)
+            if Fields.ORIGIN in item:
+                item[Fields.ORIGIN] = list(item[Fields.ORIGIN])
+            if Fields.STATUS in item:
+                item[Fields.STATUS] = RecordState[item[Fields.STATUS]]
+            if Fields.FILE in item:
+                item[Fields.FILE] = Path(item[Fields.FILE])
+            if Fields.MD_PROV in item:
+                item[Fields.MD_PROV] = {
+                    k: dict(v) for k, v in item[Fields.MD_PROV].items()
+                }
+            record_header_items[item[Fields.ID]] = item
+        return record_header_items
+
+    def _invalidate_records_header_cache(self) -> None:
+        self._records_header_cache = None
+        self._get_records_header_cache_path().unlink(missing_ok=True)
+
     def save_records_dict_to_file(self, records: dict) -> None:
         """Save the records dict"""
         # Note : this classmethod function can be called by CoLRev scripts
         # operating outside a CoLRev repo (e.g., sync)
 
-        bibtex_str = to_string(records_dict=records, implementation="bib")
-
-        with open(self.review_manager.paths.records, "w", encoding="utf-8") as out:
-            out.write(bibtex_str + "\n")
-
+        # Note : the records are written one at a time to a temporary file,
+        # which replaces the records file atomically
+        records_file = self.review_manager.paths.records
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=records_file.parent,
+            prefix=f".{records_file.name}.",
+            delete=False,
+        ) as temp_file:
+            try:
+                colrev.writer.bib.to_stream(records_dict=records, file=temp_file)
+                temp_file.write("\n")
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            except Exception:
+                os.unlink(temp_file.name)
+                raise
+        if records_file.is_file():
+            shutil.copymode(records_file, temp_file.name)
+        else:
+            # Note : temporary files are created with mode 0600
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file.name, 0o666 & ~umask)
+        os.replace(temp_file.name, records_file)
+
+        self._invalidate_records_header_cache()
+        self._set_records_header_snapshot(records)
         self._add_record_changes()
 
-    def _save_record_list_by_id(self, records: dict) -> None:
+    @staticmethod
+    def _get_header_items(records: dict) -> dict:
+        header_keys = [
+            Fields.ID,
+            Fields.ORIGIN,
+            Fields.STATUS,
+            Fields.FILE,
+            Fields.SCREENING_CRITERIA,
+            Fields.MD_PROV,
+        ]
+        record_header_items = {}
+        for record_id, record_dict in records.items():
+            item = {
+                key: record_dict[key]
+                for key in header_keys
+                if key in record_dict and record_dict[key] != "NA"
+            }
+            # Note : copies (the records may be modified after saving)
+            if Fields.ORIGIN in item:
+                item[Fields.ORIGIN] = list(item[Fields.ORIGIN])
+            if Fields.MD_PROV in item:
+                item[Fields.MD_PROV] = {
+                    k: dict(v) for k, v in item[Fields.MD_PROV].items()
+                }
+            record_header_items[record_id] = item
+        return record_header_items
+
+    def _set_records_header_snapshot(self, records: dict) -> None:
+        """Cache the header items of the records that were just saved
+        so that subsequent header-only loads do not parse the records file"""
 
-        parsed = to_string(records_dict=records, implementation="bib")
-        record_list = [
+        record_header_items = self._get_header_items(records)
+        stat = self.review_manager.paths.records.stat()
+        self._store_records_header_cache(
             {
-                Fields.ID: item[item.find("{") + 1 : item.find(",")],
-                "record": "@" + item + "\n",
+                "version": self.RECORDS_HEADER_CACHE_VERSION,
+                "blob_sha": self._get_blob_sha(self.review_manager.paths.records),
+                "items": self._record_header_items_to_cache(record_header_items),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
             }
-            for item in parsed.split("\n@")
-        ]
-        # Correct the first item
-        record_list[0]["record"] = "@" + record_list[0]["record"][2:]
+        )
 
-        current_id_str = "NOTSET"
-        if self.review_manager.paths.records.is_file():
-            with open(self.review_manager.paths.records, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
-                    if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8")
-                    if current_id_str in [x[Fields.ID] for x in record_list]:
-                        replacement = [
-                            x["record"]
-                            for x in record_list
-                            if x[Fields.ID] == current_id_str
-                        ][0]
-                        record_list = [
-                            x for x in record_list if x[Fields.ID] != current_id_str
+    def _update_records_header_cache(self, cache: dict, *, records: dict) -> None:
+        """Update the header items and the status aggregate for the records
+        that were replaced (or appended) in the records file"""
+
+        cached_items = {item[Fields.ID]: item for item in cache["items"]}
+        record_header_items = self._get_header_items(records)
+
+        # Note : the aggregate is computed when it is needed (get_status_aggregate())
+        aggregate = None
+        if "status_aggregate" in cache and all(
+            Fields.STATUS in item and Fields.ORIGIN in item
+            for item in record_header_items.values()
+        ):
+            aggregate = colrev.process.status.StatusAggregate.from_dict(
+                cache["status_aggregate"]
+            )
+
+        for record_id, cached_item in zip(
+            record_header_items,
+            self._record_header_items_to_cache(record_header_items),
+        ):
+            if aggregate is not None:
+                if record_id in cached_items:
+                    aggregate.remove(
+                        self._record_header_items_from_cache([cached_items[record_id]])[
+                            record_id
                         ]
-                        line = file.readline()
-                        while (
-                            b"@" not in line[:3] and line
-                        ):  # replace: drop the current record
-                            line = file.readline()
-                        remaining = line + file.read()
-                        file.seek(seekpos)
-                        file.write(replacement.encode("utf-8"))
-                        seekpos = file.tell()
-                        file.flush()
-                        os.fsync(file)
-                        file.write(remaining)
-                        file.truncate()  # if the replacement is shorter...
-                        file.seek(seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
-
-        if len(record_list) > 0:
-            with open(
-                self.review_manager.paths.records, "a", encoding="utf8"
-            ) as m_refs:
-                for item in record_list:
-                    m_refs.write(item["record"])
+                    )
+                aggregate.add(record_header_items[record_id])
+            cached_items[record_id] = cached_item
+
+        records_file = self.review_manager.paths.records
+        stat = records_file.stat()
+        updated_cache = {
+            "version": self.RECORDS_HEADER_CACHE_VERSION,
+            "blob_sha": self._get_blob_sha(records_file),
+            "items": list(cached_items.values()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if aggregate is not None:
+            updated_cache["status_aggregate"] = aggregate.to_dict()
+        self._store_records_header_cache(updated_cache)
+
+    def _save_record_list_by_id(self, records: dict) -> None:
+        replacements = {
+            record_id: colrev.writer.bib.to_string(
+                records_dict={record_id: records[record_id]}
+            )
+            + "\n"
+            for record_id in sorted(records)
+        }
+
+        records_file = self.review_manager.paths.records
+        if not records_file.is_file():
+            with open(records_file, "a", encoding="utf8") as m_refs:
+                for replacement in replacements.values():
+                    m_refs.write(replacement)
+            self._invalidate_records_header_cache()
+            self._add_record_changes()
+            return
+
+        # Note : the header cache (and status aggregate) is updated incrementally
+        # if it corresponds to the records file before the replacement
+        cache = self._get_current_records_header_cache()
 
+        # Note : the records are replaced in a single (streaming) rewrite
+        # of a temporary file, which replaces the records file atomically
+        with open(records_file, "rb") as file, tempfile.NamedTemporaryFile(
+            dir=records_file.parent, prefix=f".{records_file.name}.", delete=False
+        ) as temp_file:
+            try:
+                copy_from = 0
+                for (
+                    record_id,
+                    start,
+                    end,
+                ) in colrev.record.record_history.get_record_offsets(file):
+                    if record_id not in replacements:
+                        continue
+                    file.seek(copy_from)
+                    for chunk_start in range(copy_from, start, 1024 * 1024):
+                        temp_file.write(
+                            file.read(min(1024 * 1024, start - chunk_start))
+                        )
+                    temp_file.write(replacements.pop(record_id).encode("utf-8"))
+                    copy_from = end
+                file.seek(copy_from)
+                shutil.copyfileobj(file, temp_file)
+                for replacement in replacements.values():
+                    temp_file.write(replacement.encode("utf-8"))
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            except Exception:
+                os.unlink(temp_file.name)
+                raise
+        shutil.copymode(records_file, temp_file.name)
+        os.replace(temp_file.name, records_file)
+
+        self._invalidate_records_header_cache()
+        if cache is not None:
+            self._update_records_header_cache(cache, records=records)
         self._add_record_changes()
 
     def save_records_dict(self, records: dict, *, partial: bool = False) -> None:
@@ -312,6 +599,7 @@ class Dataset:
         colrev.ops.check.CheckOperation(self.review_manager)  # to notify
         quality_model = self.review_manager.get_qm()
         records = self.load_records_dict()
+        records_to_check = []
         for record_dict in records.values():
             if Fields.STATUS not in record_dict:
                 return {
@@ -323,11 +611,15 @@ class Dataset:
             if record_dict[Fields.STATUS] in [
                 RecordState.md_needs_manual_preparation,
             ]:
-                record.run_quality_model(quality_model, set_prepared=True)
+                records_to_check.append(record)
 
             if record_dict[Fields.STATUS] == RecordState.pdf_prepared:
                 record.reset_pdf_provenance_notes()
 
+        colrev.record.record.Record.run_quality_model_batch(
+            records_to_check, quality_model, set_prepared=True
+        )
+
         self.save_records_dict(records)
         changed = self.review_manager.paths.RECORDS_FILE in [
             r.a_path for r in self._git_repo.index.diff(None)
@@ -346,14 +638,12 @@ class Dataset:
     def propagated_id(self, *, record_id: str) -> bool:
         """Check whether an ID is propagated (i.e., its record's status is beyond md_processed)"""
 
-        for record in self.load_records_dict(header_only=True).values():
-            if record[Fields.ID] == record_id:
-                if record[Fields.STATUS] in RecordState.get_post_x_states(
-                    state=RecordState.md_processed
-                ):
-                    return True
-
-        return False
+        record = self.load_records_dict(header_only=True).get(record_id)
+        if record is None:
+            return False
+        return record[Fields.STATUS] in RecordState.get_post_x_states(
+            state=RecordState.md_processed
+        )
 
     def set_ids(self, selected_ids: typing.Optional[list] = None) -> dict:
         """Set the IDs of records according to predefined formats or
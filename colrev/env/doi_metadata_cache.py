@@ -0,0 +1,170 @@
+#! /usr/bin/env python
+"""Persistent cache of DOI metadata (e.g., retrieved from Crossref)."""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+from datetime import timedelta
+from pathlib import Path
+
+from colrev.constants import Filepaths
+
+
+class DOIMetadataCache:
+    """The DOIMetadataCache stores the metadata retrieved for DOIs locally
+
+    Entries expire after the ttl and the least recently retrieved entries
+    are removed when the cache exceeds max_entries.
+    DOIs that were not found are cached (as empty dicts) until the not_found_ttl
+    expires."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    TABLE_NAME = "doi_metadata"
+    CREATE_TABLE_QUERY = (
+        f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} "
+        "(doi TEXT PRIMARY KEY, record_json TEXT, retrieved REAL)"
+    )
+    # Note : the size cap is enforced after every PRUNE_INTERVAL insertions
+    PRUNE_INTERVAL = 1000
+    # Condition for entries that did not expire (parameters: see _get_min_retrieved)
+    _NOT_EXPIRED = "retrieved > (CASE WHEN record_json IS NULL THEN ? ELSE ? END)"
+
+    def __init__(
+        self,
+        *,
+        cache_path: typing.Optional[Path] = None,
+        ttl: timedelta = timedelta(days=30),
+        not_found_ttl: timedelta = timedelta(days=1),
+        max_entries: int = 500_000,
+    ) -> None:
+        self.cache_path = cache_path or Filepaths.DOI_METADATA_CACHE_FILE
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._nr_inserted = 0
+
+    @staticmethod
+    def _get_key(doi: str) -> str:
+        # Note : DOIs are case-insensitive
+        return doi.strip().upper()
+
+    def _get_min_retrieved(self) -> typing.Tuple[float, float]:
+        # Note : entries of DOIs that were not found (record_json NULL) expire earlier
+        now = time.time()
+        return (
+            now - self.not_found_ttl.total_seconds(),
+            now - self.ttl.total_seconds(),
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Note : connections must not be shared with forked worker processes
+        if self._pid != os.getpid():
+            self._connection = None
+            self._pid = os.getpid()
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.cache_path), timeout=30, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(self.CREATE_TABLE_QUERY)
+            self._connection.commit()
+        return self._connection
+
+    def get(self, doi: str) -> typing.Optional[dict]:
+        """Get the metadata of a DOI (None if it is not cached or expired,
+        an empty dict if the DOI was not found)"""
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    f"SELECT record_json FROM {self.TABLE_NAME} "
+                    f"WHERE doi = ? AND {self._NOT_EXPIRED}",
+                    (self._get_key(doi), *self._get_min_retrieved()),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return self._load(row[0])
+
+    def get_many(self, dois: list) -> dict:
+        """Get the metadata of DOIs that are cached (keyed by the DOIs passed,
+        empty dicts for DOIs that were not found)"""
+        keys = {self._get_key(doi): doi for doi in dois}
+        key_list = list(keys)
+        results = {}
+        min_retrieved = self._get_min_retrieved()
+        with self._lock:
+            connection = self._get_connection()
+            # Note : the number of sqlite variables is limited (999 in older versions)
+            for i in range(0, len(key_list), 900):
+                chunk = key_list[i : i + 900]
+                rows = connection.execute(
+                    f"SELECT doi, record_json FROM {self.TABLE_NAME} "
+                    f"WHERE doi IN ({','.join('?' * len(chunk))}) "
+                    f"AND {self._NOT_EXPIRED}",
+                    (*chunk, *min_retrieved),
+                ).fetchall()
+                for key, record_json in rows:
+                    results[keys[key]] = self._load(record_json)
+        return results
+
+    @staticmethod
+    def _load(record_json: typing.Optional[str]) -> dict:
+        if record_json is None:
+            return {}
+        return json.loads(record_json)
+
+    def set(self, doi: str, record_dict: dict) -> None:
+        """Store the metadata of a DOI"""
+        self._set(doi, json.dumps(record_dict, default=str, ensure_ascii=False))
+
+    def set_not_found(self, doi: str) -> None:
+        """Store that a DOI was not found (expires after the not_found_ttl)"""
+        self._set(doi, None)
+
+    def _set(self, doi: str, record_json: typing.Optional[str]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE_NAME} VALUES (?, ?, ?)",
+                (self._get_key(doi), record_json, time.time()),
+            )
+            connection.commit()
+            self._nr_inserted += 1
+            if self._nr_inserted % self.PRUNE_INTERVAL == 0:
+                self._prune(connection)
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            f"DELETE FROM {self.TABLE_NAME} WHERE NOT {self._NOT_EXPIRED}",
+            self._get_min_retrieved(),
+        )
+        connection.execute(
+            f"DELETE FROM {self.TABLE_NAME} WHERE doi IN "
+            f"(SELECT doi FROM {self.TABLE_NAME} ORDER BY retrieved DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        connection.commit()
+
+    def prune(self) -> None:
+        """Remove expired entries and enforce the size cap"""
+        with self._lock:
+            self._prune(self._get_connection())
+
+    def close(self) -> None:
+        """Close the connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
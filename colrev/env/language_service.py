@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import re
+import threading
+import typing
+from functools import lru_cache
 
 import pycountry
+from lingua import LanguageDetector  # pylint: disable=no-name-in-module
 from lingua import LanguageDetectorBuilder  # pylint: disable=no-name-in-module
 
 import colrev.exceptions as colrev_exceptions
@@ -12,29 +16,75 @@ import colrev.record.record
 from colrev.constants import Fields
 
 
+# Note : building a detector (and loading its language models) is expensive.
+# Detectors are therefore built once per process and shared across instances.
+_LINGUA_LANGUAGE_DETECTORS: typing.Dict[typing.Tuple[bool, bool], LanguageDetector] = {}
+_LANG_CODE_MAPPING: typing.Dict[str, str] = {}
+_LOCK = threading.Lock()
+
+
+def _get_lingua_language_detector(
+    *, low_accuracy: bool, preload_models: bool
+) -> LanguageDetector:
+    key = (low_accuracy, preload_models)
+    with _LOCK:
+        if key not in _LINGUA_LANGUAGE_DETECTORS:
+            builder = LanguageDetectorBuilder.from_all_languages_with_latin_script()
+            if low_accuracy:
+                builder = builder.with_low_accuracy_mode()
+            if preload_models:
+                builder = builder.with_preloaded_language_models()
+            _LINGUA_LANGUAGE_DETECTORS[key] = builder.build()
+        return _LINGUA_LANGUAGE_DETECTORS[key]
+
+
+def _get_lang_code_mapping() -> typing.Dict[str, str]:
+    with _LOCK:
+        if not _LANG_CODE_MAPPING:
+            for country in pycountry.languages:
+                _LANG_CODE_MAPPING[country.name.lower()] = country.alpha_3
+        return _LANG_CODE_MAPPING
+
+
+@lru_cache(maxsize=4096)
+def _detect_language(
+    language_detector: LanguageDetector, text: str
+) -> typing.Optional[str]:
+    language = language_detector.detect_language_of(text)
+    if language is None:
+        return None
+    return language.iso_code_639_3.name.lower()
+
+
 class LanguageService:
     """Service to detect languages and handle language codes"""
 
     _eng_false_negatives = ["editorial", "introduction"]
 
-    def __init__(self) -> None:
+    def __init__(
+        self, *, low_accuracy: bool = False, preload_models: bool = False
+    ) -> None:
         # Note : Lingua is tested/evaluated relative to other libraries:
         # https://github.com/pemistahl/lingua-py
         # It performs particularly well for short strings (single words/word pairs)
         # The langdetect library is non-deterministic, especially for short strings
         # https://pypi.org/project/langdetect/
 
-        self._lingua_language_detector = (
-            LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
-        )
+        # The detector is initialized lazily (on the first detection)
+        self._low_accuracy = low_accuracy
+        self._preload_models = preload_models
 
         # Language formats: ISO 639-1 standard language codes
         # https://pypi.org/project/langcodes/
         # https://github.com/flyingcircusio/pycountry
 
-        self._lang_code_mapping = {}
-        for country in pycountry.languages:
-            self._lang_code_mapping[country.name.lower()] = country.alpha_3
+        self._lang_code_mapping = _get_lang_code_mapping()
+
+    @property
+    def _lingua_language_detector(self) -> LanguageDetector:
+        return _get_lingua_language_detector(
+            low_accuracy=self._low_accuracy, preload_models=self._preload_models
+        )
 
     # pylint: disable=too-many-return-statements
     # pylint: disable=too-many-branches
@@ -88,13 +138,13 @@ class LanguageService:
         if text.lower() in self._eng_false_negatives:
             return "eng"
 
-        language = self._lingua_language_detector.detect_language_of(text)
+        language = _detect_language(self._lingua_language_detector, text)
 
         if language:
             # There are too many errors/classifying papers as latin
-            if language.iso_code_639_3.name.lower() == "lat":
+            if language == "lat":
                 return ""
-            return language.iso_code_639_3.name.lower()
+            return language
 
         return self._determine_alphabet(text)
 
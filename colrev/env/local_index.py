@@ -28,6 +28,10 @@ from colrev.env.local_index_prep import prepare_record_for_return
 class LocalIndex:
     """The LocalIndex implements indexing and retrieval of records across projects"""
 
+    # Note : the pool is shared by all LocalIndex instances (process-wide)
+    # and hands out one long-lived connection per thread.
+    connection_pool = colrev.env.local_index_sqlite.SQLiteConnectionPool()
+
     def __init__(
         self,
         *,
@@ -39,16 +43,40 @@ class LocalIndex:
         self._index_tei = index_tei
         self.thread_lock = Lock()
 
+    @classmethod
+    def get_connection_stats(cls) -> dict:
+        """Get statistics on pooled connections and query latency"""
+        return cls.connection_pool.get_stats()
+
+    @classmethod
+    def close_connections(cls) -> None:
+        """Close the pooled connections (e.g., when the index is rebuilt)"""
+        cls.connection_pool.close_all()
+
+    def _get_sqlite_index_record(
+        self,
+    ) -> colrev.env.local_index_sqlite.SQLiteIndexRecord:
+        return colrev.env.local_index_sqlite.SQLiteIndexRecord(
+            connection_pool=self.connection_pool
+        )
+
+    def _get_sqlite_index_toc(self) -> colrev.env.local_index_sqlite.SQLiteIndexTOC:
+        return colrev.env.local_index_sqlite.SQLiteIndexTOC(
+            connection_pool=self.connection_pool
+        )
+
     def get_journal_rankings(self, journal: str) -> list:
         """Get the journal rankings from the sqlite database"""
-        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings()
+        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings(
+            connection_pool=self.connection_pool
+        )
         return sqlite_index_ranking.select(journal=journal)
 
     def _retrieve_based_on_colrev_id(
         self, cids_to_retrieve: list
     ) -> colrev.record.record.Record:
 
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        sqlite_index_record = self._get_sqlite_index_record()
         for cid_to_retrieve in cids_to_retrieve:
             try:
                 retrieved_record = sqlite_index_record.get(
@@ -58,8 +86,6 @@ class LocalIndex:
 
             except colrev_exceptions.RecordNotInIndexException:
                 continue  # continue with the next cid_to_retrieve
-            finally:
-                sqlite_index_record.connection.close()
 
         raise colrev_exceptions.RecordNotInIndexException()
 
@@ -109,10 +135,10 @@ class LocalIndex:
     def search(self, query: str) -> list[colrev.record.record.Record]:
         """Run a search for records"""
 
+        records_to_return = []
         try:
             self.thread_lock.acquire(timeout=60)
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            records_to_return = []
+            sqlite_index_record = self._get_sqlite_index_record()
             for record_dict in sqlite_index_record.search(query=query):
                 record = prepare_record_for_return(record_dict, include_file=False)
                 records_to_return.append(record)
@@ -120,7 +146,36 @@ class LocalIndex:
         except sqlite3.OperationalError as exc:  # pragma: no cover
             print(exc)
         finally:
-            sqlite_index_record.connection.close()
+            self.thread_lock.release()
+
+        return records_to_return
+
+    def fulltext_search(
+        self, keywords: str, *, limit: typing.Optional[int] = 20, offset: int = 0
+    ) -> list[colrev.record.record.Record]:
+        """Run a ranked keyword search (title, abstract, author, fulltext)
+
+        All keywords must match. Results are ordered by relevance,
+        use limit and offset for pagination (limit=None: all results)."""
+
+        fts_query = " ".join(
+            '"' + keyword.replace('"', '""') + '"' for keyword in keywords.split()
+        )
+        records_to_return: typing.List[colrev.record.record.Record] = []
+        if not fts_query:
+            return records_to_return
+        try:
+            self.thread_lock.acquire(timeout=60)
+            sqlite_index_record = self._get_sqlite_index_record()
+            for record_dict in sqlite_index_record.fulltext_search(
+                fts_query, limit=limit, offset=offset
+            ):
+                record = prepare_record_for_return(record_dict, include_file=False)
+                records_to_return.append(record)
+
+        except sqlite3.OperationalError as exc:  # pragma: no cover
+            print(exc)
+        finally:
             self.thread_lock.release()
 
         return records_to_return
@@ -129,7 +184,7 @@ class LocalIndex:
         """Determine the year of a paper based on its table-of-content (journal-volume-number)"""
 
         try:
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc = self._get_sqlite_index_toc()
             toc_key = colrev.record.record.Record(record_dict).get_toc_key()
             toc_items = []
             if self._toc_exists(toc_key):
@@ -139,7 +194,7 @@ class LocalIndex:
                 raise colrev_exceptions.TOCNotAvailableException()
 
             toc_records_colrev_id = toc_items[0]
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+            sqlite_index_record = self._get_sqlite_index_record()
             record_dict = sqlite_index_record.get(
                 key=Fields.COLREV_ID, value=toc_records_colrev_id
             )
@@ -153,13 +208,11 @@ class LocalIndex:
             colrev_exceptions.RecordNotInIndexException,
         ) as exc:
             raise colrev_exceptions.TOCNotAvailableException() from exc
-        finally:
-            sqlite_index_toc.connection.close()
 
     def _toc_exists(self, toc_item: str) -> bool:
         try:
             self.thread_lock.acquire(timeout=60)
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+            sqlite_index_toc = self._get_sqlite_index_toc()
             return sqlite_index_toc.exists(toc_item)
         except sqlite3.OperationalError:  # pragma: no cover
             pass  # return False
@@ -167,18 +220,31 @@ class LocalIndex:
             # ie. no sqlite database available
             pass  # return False
         finally:
-            sqlite_index_toc.connection.close()
             self.thread_lock.release()
         return False
 
+    def get_indexed_toc_keys(self, toc_keys: list) -> set:
+        """Get the TOC keys that are in the index (a single query for a batch)"""
+        try:
+            self.thread_lock.acquire(timeout=60)
+            sqlite_index_toc = self._get_sqlite_index_toc()
+            return sqlite_index_toc.get_existing_toc_keys(toc_keys)
+        except sqlite3.OperationalError:  # pragma: no cover
+            pass  # return set()
+        except AttributeError:  # pragma: no cover
+            # ie. no sqlite database available
+            pass  # return set()
+        finally:
+            self.thread_lock.release()
+        return set()
+
     def _get_toc_items(self, toc_key: str, *, search_across_tocs: bool) -> list:
-        sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
+        sqlite_index_toc = self._get_sqlite_index_toc()
         toc_items = []
         if self._toc_exists(toc_key):
             toc_items = sqlite_index_toc.get_toc_items(toc_key=toc_key)
         else:
             if not search_across_tocs:
-                sqlite_index_toc.connection.close()
                 raise colrev_exceptions.RecordNotInIndexException()
 
         if not toc_items and search_across_tocs:
@@ -189,7 +255,6 @@ class LocalIndex:
                 toc_items = sqlite_index_toc.get_toc_items(
                     partial_toc_key=partial_toc_key
                 )
-                sqlite_index_toc.connection.close()
             except (
                 colrev_exceptions.NotTOCIdentifiableException,
                 KeyError,
@@ -217,8 +282,7 @@ class LocalIndex:
             raise colrev_exceptions.RecordNotInIndexException() from exc
 
         toc_items = self._get_toc_items(toc_key, search_across_tocs=search_across_tocs)
-        # SQLiteIndexRecord() must be after _get_toc_items(), which also uses the sqlite file
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        sqlite_index_record = self._get_sqlite_index_record()
         try:
             for toc_records_colrev_id in toc_items:
                 record_dict = sqlite_index_record.get(
@@ -241,8 +305,6 @@ class LocalIndex:
         ):
             pass
 
-        sqlite_index_record.connection.close()
-
         raise colrev_exceptions.RecordNotInIndexException()
 
     def retrieve_based_on_colrev_pdf_id(
@@ -252,15 +314,10 @@ class LocalIndex:
         Convenience function to retrieve the indexed record_dict metadata
         based on a colrev_pdf_id
         """
-        try:
-            sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-            record_dict = sqlite_index_record.get(
-                key=Fields.PDF_ID, value=colrev_pdf_id
-            )
-            record_to_import = prepare_record_for_return(record_dict, include_file=True)
-            record_to_import.data.pop(Fields.FILE, None)
-        finally:
-            sqlite_index_record.connection.close()
+        sqlite_index_record = self._get_sqlite_index_record()
+        record_dict = sqlite_index_record.get(key=Fields.PDF_ID, value=colrev_pdf_id)
+        record_to_import = prepare_record_for_return(record_dict, include_file=True)
+        record_to_import.data.pop(Fields.FILE, None)
         return record_to_import
 
     def retrieve(
@@ -308,15 +365,8 @@ class LocalIndex:
                     or Fields.ID == key
                 ):
                     continue
-                try:
-                    sqlite_index_record = (
-                        colrev.env.local_index_sqlite.SQLiteIndexRecord()
-                    )
-                    retrieved_record_dict = sqlite_index_record.get(
-                        key=key, value=value
-                    )
-                finally:
-                    sqlite_index_record.connection.close()
+                sqlite_index_record = self._get_sqlite_index_record()
+                retrieved_record_dict = sqlite_index_record.get(key=key, value=value)
 
                 if key in retrieved_record_dict:
                     if retrieved_record_dict[key] == value:
@@ -5,6 +5,8 @@ from __future__ import annotations
 import collections
 import io
 import os
+import sqlite3
+import time
 import typing
 from copy import deepcopy
 from datetime import timedelta
@@ -12,11 +14,13 @@ from multiprocessing import Lock
 from pathlib import Path
 from threading import Timer
 
+import git
 import pandas as pd
 import requests_cache
 from tqdm import tqdm
 
 import colrev.env.environment_manager
+import colrev.env.local_index
 import colrev.env.local_index_sqlite
 import colrev.env.resources
 import colrev.env.tei_parser
@@ -24,6 +28,7 @@ import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
 import colrev.ops.check
+import colrev.paths
 import colrev.record.record
 import colrev.review_manager
 from colrev.constants import Colors
@@ -39,6 +44,8 @@ from colrev.writer.write_utils import to_string
 class LocalIndexBuilder:
     """The LocalIndexBuilder implements indexing functionality"""
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(
         self,
         *,
@@ -49,13 +56,69 @@ class LocalIndexBuilder:
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self._index_tei = index_tei
         self.thread_lock = Lock()
+        self._sqlite_index_record: typing.Optional[
+            colrev.env.local_index_sqlite.SQLiteIndexRecord
+        ] = None
+        self._sqlite_index_toc: typing.Optional[
+            colrev.env.local_index_sqlite.SQLiteIndexTOC
+        ] = None
+        self._sqlite_index_repository: typing.Optional[
+            colrev.env.local_index_sqlite.SQLiteIndexRepository
+        ] = None
+        self.nr_indexed_records = 0
+
+    def _get_sqlite_index_record(
+        self,
+    ) -> colrev.env.local_index_sqlite.SQLiteIndexRecord:
+        # Note : the builder keeps one (write) connection
+        if self._sqlite_index_record is None:
+            self._sqlite_index_record = (
+                colrev.env.local_index_sqlite.SQLiteIndexRecord()
+            )
+            colrev.env.local_index_sqlite.migrate_schema(
+                self._sqlite_index_record.connection
+            )
+        return self._sqlite_index_record
+
+    def _get_sqlite_index_toc(self) -> colrev.env.local_index_sqlite.SQLiteIndexTOC:
+        # Note : the tables are updated in the transaction of the record index
+        if self._sqlite_index_toc is None:
+            self._sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC(
+                connection=self._get_sqlite_index_record().connection
+            )
+        return self._sqlite_index_toc
+
+    def _get_sqlite_index_repository(
+        self,
+    ) -> colrev.env.local_index_sqlite.SQLiteIndexRepository:
+        if self._sqlite_index_repository is None:
+            self._sqlite_index_repository = (
+                colrev.env.local_index_sqlite.SQLiteIndexRepository(
+                    connection=self._get_sqlite_index_record().connection
+                )
+            )
+        return self._sqlite_index_repository
 
     def reinitialize_sqlite_db(self) -> None:
         """Reinitialize the SQLITE database ()"""
 
+        # Pooled (read) connections would otherwise refer to the removed file
+        colrev.env.local_index.LocalIndex.close_connections()
+        if self._sqlite_index_record is not None:
+            self._sqlite_index_record.close()
         Filepaths.LOCAL_INDEX_SQLITE_FILE.unlink(missing_ok=True)
-        colrev.env.local_index_sqlite.SQLiteIndexRecord(reinitialize=True)
-        colrev.env.local_index_sqlite.SQLiteIndexTOC(reinitialize=True)
+        self._sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+            reinitialize=True
+        )
+        connection = self._sqlite_index_record.connection
+        self._sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC(
+            reinitialize=True, connection=connection
+        )
+        self._sqlite_index_repository = (
+            colrev.env.local_index_sqlite.SQLiteIndexRepository(
+                reinitialize=True, connection=connection
+            )
+        )
 
     def _outlets_duplicated(self) -> bool:
         print("Validate curated metadata")
@@ -109,7 +172,12 @@ class LocalIndexBuilder:
             else:
                 toc_to_index[toc_item] = colrev_id
 
-    def _add_index_records(self, *, recs_to_index: list, curated_fields: list) -> None:
+    def _add_index_records(
+        self, *, recs_to_index: list, repo_source_path: Path, curated_fields: list
+    ) -> set:
+        """Add the records to the index (in the current transaction).
+        Returns the repositories of records that were already indexed
+        (amended with the curated fields or not added)"""
         list_to_add = [
             {
                 k: v
@@ -118,8 +186,11 @@ class LocalIndexBuilder:
             }
             for el in recs_to_index
         ]
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
-        for item in list_to_add:
+        for item, record_dict in zip(list_to_add, recs_to_index):
+            # The dblp_key column (no dots in column names) stores the dblp_key field
+            if Fields.DBLP_KEY in record_dict:
+                item[LocalIndexFields.DBLP_KEY] = record_dict[Fields.DBLP_KEY]
+            item[LocalIndexFields.REPO_SOURCE_PATH] = str(repo_source_path)
             for (
                 records_index_required_key
             ) in colrev.env.local_index_sqlite.SQLiteIndexRecord.KEYS:
@@ -127,12 +198,17 @@ class LocalIndexBuilder:
                     item[records_index_required_key] = ""
             if item[LocalIndexFields.ID] == "":
                 print("NO ID IN RECORD")
-                continue
+        list_to_add = [item for item in list_to_add if item[LocalIndexFields.ID] != ""]
 
-            if not sqlite_index_record.exists(local_index_id=item[LocalIndexFields.ID]):
-                sqlite_index_record.insert(item)
-            else:
-                if not curated_fields:
+        # Note : all records of a repository are added in one transaction
+        sqlite_index_record = self._get_sqlite_index_record()
+        existing_repo_source_paths = sqlite_index_record.get_repo_source_paths(
+            [item[LocalIndexFields.ID] for item in list_to_add]
+        )
+        if curated_fields:
+            existing_ids = set(existing_repo_source_paths)
+            for item in list_to_add:
+                if item[LocalIndexFields.ID] not in existing_ids:
                     continue
                 try:
                     stored_record = sqlite_index_record.get(
@@ -148,8 +224,14 @@ class LocalIndexBuilder:
                     )
                 except colrev_exceptions.RecordNotInIndexException:  # pragma: no cover
                     pass
+            list_to_add = [
+                item
+                for item in list_to_add
+                if item[LocalIndexFields.ID] not in existing_ids
+            ]
 
-        sqlite_index_record.commit()
+        self.nr_indexed_records += sqlite_index_record.insert_many(list_to_add)
+        return set(existing_repo_source_paths.values())
 
     def _amend_record(
         self,
@@ -188,7 +270,11 @@ class LocalIndexBuilder:
         )
 
         sqlite_index_record.update(
-            local_index_id=item_to_add[LocalIndexFields.ID], bibtex=bibtex
+            local_index_id=item_to_add[LocalIndexFields.ID],
+            bibtex=bibtex,
+            record_json=colrev.env.local_index_sqlite.record_to_json(
+                stored_record.data
+            ),
         )
 
     # pylint: disable=too-many-arguments
@@ -202,12 +288,42 @@ class LocalIndexBuilder:
         curated_fields: list,
     ) -> None:
         """Index a CoLRev project"""
+        self._index_records(
+            records=records,
+            repo_source_path=repo_source_path,
+            curation_url=curation_url,
+            curated_masterdata=curated_masterdata,
+            curated_fields=curated_fields,
+        )
+        self._get_sqlite_index_record().commit()
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-locals
+    def _index_records(
+        self,
+        *,
+        records: dict,
+        repo_source_path: Path,
+        curation_url: str,
+        curated_masterdata: bool,
+        curated_fields: list,
+        changed_ids: typing.Optional[set] = None,
+    ) -> set:
+        """Index the records of a CoLRev project (in the current transaction)
+        (changed_ids: only index the records with these IDs,
+        the TOC items are created based on all records).
+        Returns the repositories that share records with the project"""
 
         recs_to_index = []
         toc_to_index: typing.Dict[str, str] = {}
         for record_dict in tqdm(records.values()):
             copy_for_toc_index = deepcopy(record_dict)
             try:
+                if (
+                    changed_ids is not None
+                    and record_dict[Fields.ID] not in changed_ids
+                ):
+                    continue
                 record_dict[Fields.METADATA_SOURCE_REPOSITORY_PATHS] = str(
                     repo_source_path
                 )
@@ -221,15 +337,20 @@ class LocalIndexBuilder:
                         curation_url
                     )
 
-                # Set absolute file paths and set bibtex field (for simpler retrieval)
+                # Set absolute file paths and set bibtex/record_json fields
+                # (for simpler and faster retrieval)
                 if Fields.FILE in record_dict:
                     record_dict.update(
                         file=repo_source_path / Path(record_dict[Fields.FILE])
                     )
-                record_dict[LocalIndexFields.BIBTEX] = to_string(
+                bibtex = to_string(
                     records_dict={record_dict[Fields.ID]: record_dict},
                     implementation="bib",
                 )
+                record_dict[LocalIndexFields.RECORD_JSON] = (
+                    colrev.env.local_index_sqlite.record_to_json(record_dict)
+                )
+                record_dict[LocalIndexFields.BIBTEX] = bibtex
                 record_dict = prepare_record_for_indexing(record_dict)
                 recs_to_index.append(record_dict)
 
@@ -251,13 +372,17 @@ class LocalIndexBuilder:
 
         self._index_tei_document(recs_to_index)
 
-        self._add_index_records(
-            recs_to_index=recs_to_index, curated_fields=curated_fields
+        shared_repo_source_paths = self._add_index_records(
+            recs_to_index=recs_to_index,
+            repo_source_path=repo_source_path,
+            curated_fields=curated_fields,
         )
 
         if curated_masterdata:
-            sqlite_index_toc = colrev.env.local_index_sqlite.SQLiteIndexTOC()
-            sqlite_index_toc.add(toc_to_index)
+            sqlite_index_toc = self._get_sqlite_index_toc()
+            sqlite_index_toc.delete_repository_items(str(repo_source_path))
+            sqlite_index_toc.add(toc_to_index, repo_source_path=str(repo_source_path))
+        return shared_repo_source_paths
 
     def _load_masterdata_curations(self) -> dict:  # pragma: no cover
         # Note : the following should be replaced by heuristics
@@ -275,67 +400,208 @@ class LocalIndexBuilder:
 
         return masterdata_curations
 
-    def index_colrev_project(self, repo_source_path: Path) -> None:  # pragma: no cover
-        """Index a CoLRev project"""
+    def _get_repository_state(self, repo_source_path: Path) -> dict:
+        """Get the git HEAD commit and the (working tree) records.bib blob sha"""
         try:
-            if not Path(repo_source_path).is_dir():
-                print(f"Warning {repo_source_path} not a directory")
-                return
-
-            print(f"Index records from {repo_source_path}")
-            os.chdir(repo_source_path)
-            review_manager = colrev.review_manager.ReviewManager(
-                path_str=str(repo_source_path)
+            git_repo = git.Repo(repo_source_path)
+            records_blob_sha = ""
+            if (
+                Path(repo_source_path) / colrev.paths.PathManager.RECORDS_FILE
+            ).is_file():
+                records_blob_sha = git_repo.git.hash_object(
+                    colrev.paths.PathManager.RECORDS_FILE_GIT
+                )
+            return {
+                LocalIndexFields.HEAD_SHA: git_repo.head.commit.hexsha,
+                LocalIndexFields.RECORDS_BLOB_SHA: records_blob_sha,
+            }
+        except (git.exc.GitError, ValueError):
+            # e.g., not a git repository or no commits
+            return {}
+
+    def _get_changed_record_ids(
+        self, *, git_repo: git.Repo, indexed_records_blob_sha: str, records: dict
+    ) -> typing.Optional[set]:
+        """Get the IDs of records that were added, changed, or removed
+        since the records.bib blob was indexed (None if the blob is not available)"""
+        try:
+            indexed_records_bib = git_repo.git.cat_file(
+                "blob", indexed_records_blob_sha
             )
+        except git.exc.GitCommandError:
+            # e.g., changes that were not committed when the repository was indexed
+            return None
+        indexed_records = colrev.loader.load_utils.loads(
+            load_string=indexed_records_bib,
+            implementation="bib",
+            unique_id_field="ID",
+        )
+        changed_ids = {
+            record_id
+            for record_id, record_dict in records.items()
+            if indexed_records.get(record_id) != record_dict
+        }
+        return changed_ids | (set(indexed_records) - set(records))
+
+    def _state_changed(self, *, indexed_state: dict, repository_state: dict) -> bool:
+        return not repository_state or any(
+            indexed_state.get(key) != value for key, value in repository_state.items()
+        )
 
-            check_operation = colrev.ops.check.CheckOperation(review_manager)
-
-            if review_manager.dataset.get_repo().active_branch.name != "main":
-                print(
-                    f"{Colors.ORANGE}Warning: {repo_source_path} not on main branch{Colors.END}"
+    def _shared_records_changed(self, repo_source_paths: list) -> bool:
+        """Check whether repositories that share records with other repositories
+        changed or were removed since they were last indexed"""
+        registered_repo_source_paths = {str(x) for x in repo_source_paths}
+        for repo_source_path, indexed_state in self._get_indexed_states().items():
+            if not indexed_state.get(LocalIndexFields.SHARED_RECORDS):
+                continue
+            if repo_source_path not in registered_repo_source_paths or (
+                self._state_changed(
+                    indexed_state=indexed_state,
+                    repository_state=self._get_repository_state(Path(repo_source_path)),
                 )
+            ):
+                return True
+        return False
 
-            records_file = check_operation.review_manager.paths.records
-            if not records_file.is_file():
+    def _get_indexed_states(self) -> dict:
+        try:
+            return self._get_sqlite_index_repository().get_states()
+        except sqlite3.OperationalError:  # pragma: no cover
+            return {}
+
+    def _remove_repository(self, repo_source_path: str) -> None:
+        """Remove the records, TOC items, and state of a repository from the index
+        (in the current transaction)"""
+        self._get_sqlite_index_record().delete_repository_records(repo_source_path)
+        self._get_sqlite_index_toc().delete_repository_items(repo_source_path)
+        self._get_sqlite_index_repository().delete(repo_source_path)
+
+    def index_colrev_project(
+        self, repo_source_path: Path, *, incremental: bool = False
+    ) -> None:  # pragma: no cover
+        """Index a CoLRev project
+
+        incremental: skip the project if the git HEAD commit and the records.bib
+        did not change since it was last indexed (otherwise, replace the records
+        that changed or, if they cannot be determined, all records of the project)
+        """
+        # Note : the records, TOC items, and state of the repository
+        # are updated in one transaction (committed if the update succeeds)
+        sqlite_index_record = self._get_sqlite_index_record()
+        nr_indexed_records = self.nr_indexed_records
+        try:
+            self._update_repository_index(repo_source_path, incremental=incremental)
+        # TypeErrors are thrown when a repo is in interactive rebase mode
+        except (colrev_exceptions.CoLRevException, TypeError) as exc:
+            sqlite_index_record.rollback()
+            self.nr_indexed_records = nr_indexed_records
+            print(exc)
+        except BaseException:
+            sqlite_index_record.rollback()
+            self.nr_indexed_records = nr_indexed_records
+            raise
+        else:
+            sqlite_index_record.commit()
+
+    # pylint: disable=too-many-locals
+    def _update_repository_index(
+        self, repo_source_path: Path, *, incremental: bool
+    ) -> None:  # pragma: no cover
+        """Update the records of a repository in the index (in the current transaction)"""
+        if not Path(repo_source_path).is_dir():
+            print(f"Warning {repo_source_path} not a directory")
+            return
+
+        repository_state = self._get_repository_state(repo_source_path)
+        indexed_state = None
+        if incremental:
+            indexed_state = self._get_indexed_states().get(str(repo_source_path))
+            if indexed_state and not self._state_changed(
+                indexed_state=indexed_state, repository_state=repository_state
+            ):
+                print(f"Skip {repo_source_path} (not changed since last indexed)")
                 return
-            records = check_operation.review_manager.dataset.load_records_dict()
 
-            curation_endpoints = [
-                x
-                for x in check_operation.review_manager.settings.data.data_package_endpoints
-                if x["endpoint"] == "colrev.colrev_curation"
-            ]
+        print(f"Index records from {repo_source_path}")
+        os.chdir(repo_source_path)
+        review_manager = colrev.review_manager.ReviewManager(
+            path_str=str(repo_source_path)
+        )
 
-            curated_fields = []
-            curation_url = ""
-            if curation_endpoints:
-                curation_endpoint = curation_endpoints[0]
-                # Set masterdata_provenace to CURATED:{url}
-                curation_url = curation_endpoint["curation_url"]
-                if (
-                    not check_operation.review_manager.settings.is_curated_masterdata_repo()
-                ):
-                    # Add curation_url to curated fields (provenance)
-                    curated_fields = curation_endpoint["curated_fields"]
+        check_operation = colrev.ops.check.CheckOperation(review_manager)
 
-            curated_masterdata = (
-                check_operation.review_manager.settings.is_curated_masterdata_repo()
+        if review_manager.dataset.get_repo().active_branch.name != "main":
+            print(
+                f"{Colors.ORANGE}Warning: {repo_source_path} not on main branch{Colors.END}"
             )
 
-            self.index_records(
-                records=records,
-                repo_source_path=repo_source_path,
-                curated_fields=curated_fields,
-                curation_url=curation_url,
-                curated_masterdata=curated_masterdata,
+        records_file = check_operation.review_manager.paths.records
+        if not records_file.is_file():
+            if incremental:
+                self._remove_repository(str(repo_source_path))
+            return
+        records = check_operation.review_manager.dataset.load_records_dict()
+
+        changed_ids = None
+        if incremental:
+            if indexed_state:
+                changed_ids = self._get_changed_record_ids(
+                    git_repo=review_manager.dataset.get_repo(),
+                    indexed_records_blob_sha=indexed_state[
+                        LocalIndexFields.RECORDS_BLOB_SHA
+                    ],
+                    records=records,
+                )
+            self._get_sqlite_index_record().delete_repository_records(
+                str(repo_source_path), citation_keys=changed_ids
             )
 
-        # TypeErrors are thrown when a repo is in interactive rebase mode
-        except (colrev_exceptions.CoLRevException, TypeError) as exc:
-            print(exc)
+        curation_endpoints = [
+            x
+            for x in check_operation.review_manager.settings.data.data_package_endpoints
+            if x["endpoint"] == "colrev.colrev_curation"
+        ]
+
+        curated_fields = []
+        curation_url = ""
+        if curation_endpoints:
+            curation_endpoint = curation_endpoints[0]
+            # Set masterdata_provenace to CURATED:{url}
+            curation_url = curation_endpoint["curation_url"]
+            if not check_operation.review_manager.settings.is_curated_masterdata_repo():
+                # Add curation_url to curated fields (provenance)
+                curated_fields = curation_endpoint["curated_fields"]
+
+        curated_masterdata = (
+            check_operation.review_manager.settings.is_curated_masterdata_repo()
+        )
 
-    def index(self) -> None:  # pragma: no cover
-        """Index all registered CoLRev projects"""
+        shared_repo_source_paths = self._index_records(
+            records=records,
+            repo_source_path=repo_source_path,
+            curated_fields=curated_fields,
+            curation_url=curation_url,
+            curated_masterdata=curated_masterdata,
+            changed_ids=changed_ids,
+        )
+        # Note : repositories that share records are not updated incrementally
+        # (e.g., records of other repositories amended by curated fields)
+        sqlite_index_repository = self._get_sqlite_index_repository()
+        if repository_state:
+            sqlite_index_repository.set_state(
+                str(repo_source_path),
+                head_sha=repository_state[LocalIndexFields.HEAD_SHA],
+                records_blob_sha=repository_state[LocalIndexFields.RECORDS_BLOB_SHA],
+                shared_records=bool(shared_repo_source_paths),
+            )
+        sqlite_index_repository.set_shared_records(shared_repo_source_paths)
+
+    def index(self, *, reinitialize: bool = False) -> None:  # pragma: no cover
+        """Index all registered CoLRev projects
+
+        Projects that did not change since they were last indexed are skipped
+        (reinitialize: rebuild the index from scratch)"""
 
         # Note : this task takes long and does not need to run often
         session = requests_cache.CachedSession(
@@ -350,8 +616,6 @@ class LocalIndexBuilder:
         if self._outlets_duplicated():
             return
 
-        self.reinitialize_sqlite_db()
-
         repo_source_paths = [
             x["repo_source_path"] for x in self.environment_manager.local_repos()
         ]
@@ -368,8 +632,50 @@ class LocalIndexBuilder:
                 x["repo_source_path"] for x in self.environment_manager.local_repos()
             ]
 
+        # Note : indexes without repository states (e.g., created before
+        # schema version 5) are rebuilt
+        incremental = (
+            not reinitialize
+            and Filepaths.LOCAL_INDEX_SQLITE_FILE.is_file()
+            and bool(self._get_indexed_states())
+        )
+        if incremental and self._shared_records_changed(repo_source_paths):
+            print("Rebuild the index (repositories that share records changed)")
+            incremental = False
+        if not incremental:
+            self.reinitialize_sqlite_db()
+        sqlite_index_record = self._get_sqlite_index_record()
+        if not incremental:
+            sqlite_index_record.set_bulk_load_mode(True)
+        start_time = time.time()
+        self.nr_indexed_records = 0
+
+        if incremental:
+            # Remove repositories that are no longer registered
+            for repo_source_path in set(self._get_indexed_states()) - {
+                str(x) for x in repo_source_paths
+            }:
+                print(f"Remove records from {repo_source_path}")
+                self._remove_repository(repo_source_path)
+                sqlite_index_record.commit()
+
         for repo_source_path in repo_source_paths:
-            self.index_colrev_project(repo_source_path)
+            self.index_colrev_project(repo_source_path, incremental=incremental)
+
+        self.create_secondary_indexes()
+        if not incremental:
+            sqlite_index_record.set_bulk_load_mode(False)
+
+        duration = time.time() - start_time
+        print(
+            f"Indexed {self.nr_indexed_records} records in {duration:.1f}s "
+            f"({self.nr_indexed_records / max(duration, 0.001):.0f} records/s)"
+        )
+
+    def create_secondary_indexes(self) -> None:
+        """Create the secondary indexes (after bulk loading the records)"""
+        sqlite_index_record = self._get_sqlite_index_record()
+        sqlite_index_record.create_secondary_indexes(sqlite_index_record.connection)
 
     def _index_tei_document(self, recs_to_index: list) -> None:
         if not self._index_tei:
@@ -2,7 +2,11 @@
 """LocalIndex: sqlite."""
 from __future__ import annotations
 
+import json
+import os
 import sqlite3
+import threading
+import time
 import typing
 
 import pandas as pd
@@ -12,6 +16,7 @@ import colrev.record.record
 from colrev.constants import Fields
 from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
+from colrev.constants import RecordState
 
 # Note : records are indexed by id = hash(colrev_id)
 # to ensure that the indexing-ids do not exceed limits
@@ -42,39 +47,207 @@ from colrev.constants import LocalIndexFields
 #     return new_hex.decode("utf-8")
 
 
+# Note : the schema version is stored in the sqlite user_version pragma
+# Version 0: record_index without secondary indexes
+# Version 1: secondary indexes on the global keys of the record_index
+# Version 2: parsed records (json) stored alongside the bibtex
+# Version 3: full-text search (fts5) table
+# Version 4: fts5 table maintained by triggers (rowid of the record_index)
+# Version 5: repository of each record/toc item and indexed state of each repository
+#            (including whether it shares records with other repositories)
+SCHEMA_VERSION = 5
+
+
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    ret_dict = {}
+    for idx, col in enumerate(cursor.description):
+        ret_dict[col[0]] = row[idx]
+    return ret_dict
+
+
+class SQLiteConnectionPool:
+    """Process-wide pool of long-lived read connections to the sqlite index
+
+    Each worker thread (of each process) receives its own connection,
+    which is kept open and reused across lookups.
+    Connections are opened in WAL mode (readers do not block the builder)
+    and keep a statement cache so that the (constant) lookup queries
+    are prepared only once per connection."""
+
+    CACHED_STATEMENTS = 256
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: typing.Dict[
+            typing.Tuple[int, int, str], sqlite3.Connection
+        ] = {}
+        self.connections_opened = 0
+        self.outdated_schema = False
+        self.queries = 0
+        self.query_time = 0.0
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread (opened on first use)"""
+        db_path = str(Filepaths.LOCAL_INDEX_SQLITE_FILE)
+        key = (os.getpid(), threading.get_ident(), db_path)
+        with self._lock:
+            if key in self._connections:
+                return self._connections[key]
+            connection = sqlite3.connect(
+                db_path,
+                timeout=90,
+                check_same_thread=False,
+                cached_statements=self.CACHED_STATEMENTS,
+            )
+            connection.row_factory = _dict_factory
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError:  # pragma: no cover
+                pass  # e.g., read-only file system or locked database
+            # Note : readers do not migrate the schema (the migration can take long
+            # and indexes are rebuilt by the LocalIndexBuilder / colrev env --index)
+            schema_version = get_schema_version(connection)
+            if schema_version < SCHEMA_VERSION and not self.outdated_schema:
+                self.outdated_schema = True
+                print(
+                    f"The local index has schema version {schema_version} "
+                    f"(current: {SCHEMA_VERSION}). Run colrev env --index to update it."
+                )
+            self._connections[key] = connection
+            self.connections_opened += 1
+            return connection
+
+    def record_query(self, duration: float) -> None:
+        """Record the latency of a query"""
+        with self._lock:
+            self.queries += 1
+            self.query_time += duration
+
+    def get_stats(self) -> dict:
+        """Get the connection and query-latency statistics"""
+        with self._lock:
+            return {
+                "connections_opened": self.connections_opened,
+                "open_connections": len(self._connections),
+                "queries": self.queries,
+                "query_time": self.query_time,
+                "avg_query_time": (
+                    self.query_time / self.queries if self.queries else 0.0
+                ),
+            }
+
+    def close_all(self) -> None:
+        """Close all pooled connections (e.g., before the index is rebuilt)"""
+        with self._lock:
+            for connection in self._connections.values():
+                try:
+                    connection.close()
+                except sqlite3.ProgrammingError:  # pragma: no cover
+                    pass
+            self._connections = {}
+
+
 # pylint: disable=too-few-public-methods
 class SQLiteIndex:
     """The SQLiteIndex class implements indexing and retrieval of records locally"""
 
     connection: sqlite3.Connection
+    INDEX_NAME: str
+    KEYS: typing.List[str]
     CREATE_TABLE_QUERY: str
 
+    # pylint: disable=too-many-arguments
     def __init__(
-        self, *, index_name: str, index_keys: list, reinitialize: bool
+        self,
+        *,
+        index_name: str,
+        index_keys: list,
+        reinitialize: bool,
+        connection_pool: typing.Optional[SQLiteConnectionPool] = None,
+        connection: typing.Optional[sqlite3.Connection] = None,
     ) -> None:
         self.index_name = index_name
         self.index_keys = index_keys
-        self.connection = sqlite3.connect(
-            str(Filepaths.LOCAL_INDEX_SQLITE_FILE), timeout=90
-        )
-        self.connection.row_factory = self._dict_factory
+        self.connection_pool = connection_pool
+        # Note : connections of the pool or of another index (shared to write
+        # the tables in one transaction) are not closed by this index
+        self._owns_connection = connection_pool is None and connection is None
+        if connection is not None:
+            self.connection = connection
+        elif connection_pool is not None:
+            self.connection = connection_pool.get_connection()
+        else:
+            self.connection = sqlite3.connect(
+                str(Filepaths.LOCAL_INDEX_SQLITE_FILE), timeout=90
+            )
+            self.connection.row_factory = _dict_factory
         if reinitialize:
             self._reinitialize_db()
 
-    def _dict_factory(self, cursor: sqlite3.Cursor, row: dict) -> dict:
-        ret_dict = {}
-        for idx, col in enumerate(cursor.description):
-            ret_dict[col[0]] = row[idx]
-        return ret_dict
+    @classmethod
+    def add_missing_columns(
+        cls, connection: sqlite3.Connection, *, create_table: bool = False
+    ) -> None:
+        """Add columns that were introduced after the table was created
+        (create_table: create the table if it does not exist)"""
+        cur = connection.cursor()
+        cur.row_factory = None  # type: ignore
+        columns = [
+            row[1] for row in cur.execute(f"PRAGMA table_info({cls.INDEX_NAME})")
+        ]
+        if not columns:
+            if not create_table:
+                raise sqlite3.OperationalError(f"no such table: {cls.INDEX_NAME}")
+            connection.execute(cls.CREATE_TABLE_QUERY)
+            connection.commit()
+            return
+        for key in cls.KEYS:
+            if key not in columns:
+                connection.execute(f"ALTER TABLE {cls.INDEX_NAME} ADD COLUMN {key}")
+        connection.commit()
 
     def _get_cursor(self) -> sqlite3.Cursor:
         return self.connection.cursor()
 
+    def _execute(self, query: str, parameters: typing.Any = ()) -> sqlite3.Cursor:
+        cur = self._get_cursor()
+        if self.connection_pool is None:
+            cur.execute(query, parameters)
+            return cur
+        start = time.perf_counter()
+        cur.execute(query, parameters)
+        self.connection_pool.record_query(time.perf_counter() - start)
+        return cur
+
     def commit(self) -> None:
         """Commit changes to the SQLITE database"""
         if self.connection:
             self.connection.commit()
 
+    def rollback(self) -> None:
+        """Discard the changes of the current transaction"""
+        if self.connection:
+            self.connection.rollback()
+
+    def close(self) -> None:
+        """Close the connection (pooled or shared connections remain open)"""
+        if self._owns_connection:
+            self.connection.close()
+
+    def set_bulk_load_mode(self, enabled: bool) -> None:
+        """Tune the connection for bulk loading (e.g., when the index is rebuilt).
+        Note: without synchronous writes, the index may be corrupted
+        if the process crashes (the index can be rebuilt)."""
+        if enabled:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=OFF")
+            self.connection.execute("PRAGMA temp_store=MEMORY")
+            self.connection.execute("PRAGMA cache_size=-262144")  # 256 MB
+        else:
+            self.connection.execute("PRAGMA synchronous=FULL")
+            self.connection.execute("PRAGMA temp_store=DEFAULT")
+            self.connection.execute("PRAGMA cache_size=-2000")  # sqlite default
+
     def _reinitialize_db(self) -> None:
         """Reinitialize the SQLITE database"""
 
@@ -85,7 +258,10 @@ class SQLiteIndex:
             self.connection.commit()
 
     def _get_record_from_row(self, row: dict) -> dict:
+        if row.get(LocalIndexFields.RECORD_JSON):
+            return record_from_json(row[LocalIndexFields.RECORD_JSON])
 
+        # Rows indexed before schema version 2 only contain the bibtex
         records_dict = colrev.loader.load_utils.loads(
             load_string=row[LocalIndexFields.BIBTEX],
             implementation="bib",
@@ -114,6 +290,8 @@ class SQLiteIndexRecord(SQLiteIndex):
         LocalIndexFields.DBLP_KEY,  # Note : no dots in key names
         Fields.PDF_ID,
         LocalIndexFields.BIBTEX,
+        LocalIndexFields.RECORD_JSON,
+        LocalIndexFields.REPO_SOURCE_PATH,
     ]
 
     GLOBAL_KEYS = [
@@ -134,33 +312,133 @@ class SQLiteIndexRecord(SQLiteIndex):
         LocalIndexFields.ID: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.ID}=?",
         Fields.COLREV_ID: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.COLREV_ID}=?",
         Fields.DOI: f"SELECT * FROM {INDEX_NAME} where {Fields.DOI}=?",
-        Fields.DBLP_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.DBLP_KEY}=?",
+        Fields.DBLP_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.DBLP_KEY}=?",
         Fields.PDF_ID: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.PDF_ID}=?",
         Fields.URL: f"SELECT * FROM {INDEX_NAME} WHERE {Fields.URL}=?",
     }
 
+    # Columns with secondary indexes (corresponding to the GLOBAL_KEYS)
+    # The repo_source_path is used to remove records when re-indexing a repository
+    SECONDARY_INDEX_COLUMNS = [
+        Fields.COLREV_ID,
+        Fields.DOI,
+        LocalIndexFields.DBLP_KEY,
+        Fields.PDF_ID,
+        Fields.URL,
+        LocalIndexFields.REPO_SOURCE_PATH,
+    ]
+
     INSERT_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(:{', :'.join(KEYS)})"
 
+    # Note : existing records are not replaced (the first record indexed is kept)
+    INSERT_OR_IGNORE_QUERY = (
+        f"INSERT OR IGNORE INTO {INDEX_NAME} VALUES(:{', :'.join(KEYS)})"
+    )
+
+    # Full-text search (fts5) table
+    # The rowids correspond to the record_index rowids and the table is
+    # maintained by triggers (the author is only available in the record_json)
+    FTS_INDEX_NAME = "record_fts"
+    FTS_KEYS = [
+        Fields.TITLE,
+        Fields.ABSTRACT,
+        Fields.AUTHOR,
+        Fields.FULLTEXT,
+    ]
+    # Note : bm25 weights correspond to the FTS_KEYS
+    FTS_WEIGHTS = "10.0, 5.0, 3.0, 1.0"
+
+    CREATE_FTS_TABLE_QUERY = (
+        f"CREATE VIRTUAL TABLE {FTS_INDEX_NAME} USING fts5({','.join(FTS_KEYS)})"
+    )
+
+    # Note : {prefix} is "NEW." in the trigger and "" when selecting from the table
+    _FTS_VALUES = (
+        f"{{prefix}}{Fields.TITLE}, {{prefix}}{Fields.ABSTRACT}, "
+        f"CASE WHEN json_valid({{prefix}}{LocalIndexFields.RECORD_JSON}) "
+        f"THEN json_extract({{prefix}}{LocalIndexFields.RECORD_JSON}, "
+        f"'$.{Fields.AUTHOR}') END, "
+        f"{{prefix}}{Fields.FULLTEXT}"
+    )
+
+    CREATE_FTS_TRIGGER_QUERIES = [
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_INDEX_NAME}_insert
+            AFTER INSERT ON {INDEX_NAME} BEGIN
+            INSERT INTO {FTS_INDEX_NAME} (rowid, {', '.join(FTS_KEYS)})
+            VALUES (NEW.rowid, {_FTS_VALUES.format(prefix="NEW.")});
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_INDEX_NAME}_delete
+            AFTER DELETE ON {INDEX_NAME} BEGIN
+            DELETE FROM {FTS_INDEX_NAME} WHERE rowid = OLD.rowid;
+            END""",
+    ]
+
+    POPULATE_FTS_QUERY = (
+        f"INSERT INTO {FTS_INDEX_NAME} (rowid, {', '.join(FTS_KEYS)}) "
+        f"SELECT rowid, {_FTS_VALUES.format(prefix='')} FROM {INDEX_NAME}"
+    )
+
+    FTS_SEARCH_QUERY = f"""
+            SELECT {INDEX_NAME}.* FROM {FTS_INDEX_NAME}
+            JOIN {INDEX_NAME} ON {INDEX_NAME}.rowid = {FTS_INDEX_NAME}.rowid
+            WHERE {FTS_INDEX_NAME} MATCH ?
+            ORDER BY bm25({FTS_INDEX_NAME}, {FTS_WEIGHTS})
+            LIMIT ? OFFSET ?"""
+
     UPDATE_RECORD_QUERY = f"""
             UPDATE {INDEX_NAME} SET
-            {LocalIndexFields.BIBTEX}=?
+            {LocalIndexFields.BIBTEX}=?,
+            {LocalIndexFields.RECORD_JSON}=?
             WHERE {LocalIndexFields.ID}=?"""
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection_pool: typing.Optional[SQLiteConnectionPool] = None,
+    ) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            connection_pool=connection_pool,
         )
 
+    @classmethod
+    def create_fts_index(cls, connection: sqlite3.Connection) -> None:
+        """Create the full-text search table (populated from existing rows)"""
+        if connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' AND name=?",
+            (f"{cls.FTS_INDEX_NAME}_insert",),
+        ).fetchone():
+            return
+        # Tables without triggers (schema version 3) are recreated
+        connection.execute(f"DROP TABLE IF EXISTS {cls.FTS_INDEX_NAME}")
+        connection.execute(cls.CREATE_FTS_TABLE_QUERY)
+        connection.execute(cls.POPULATE_FTS_QUERY)
+        for query in cls.CREATE_FTS_TRIGGER_QUERIES:
+            connection.execute(query)
+        connection.commit()
+
+    @classmethod
+    def create_secondary_indexes(cls, connection: sqlite3.Connection) -> None:
+        """Create the secondary indexes and set the schema version.
+        Indexes should be created after bulk loading (which is faster)."""
+        for column in cls.SECONDARY_INDEX_COLUMNS:
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {cls.INDEX_NAME}_{column}_idx "
+                f"ON {cls.INDEX_NAME} ({column})"
+            )
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.commit()
+
     def exists(
         self,
         *,
         local_index_id: str,
     ) -> bool:
         """Check if a record exists in the index"""
-        cur = self._get_cursor()
-        cur.execute(
+        cur = self._execute(
             self.SELECT_KEY_QUERIES[LocalIndexFields.ID],
             (local_index_id,),
         )
@@ -176,6 +454,37 @@ class SQLiteIndexRecord(SQLiteIndex):
         cur.execute(self.INSERT_QUERY, item)
         self.commit()
 
+    def insert_many(self, items: list) -> int:
+        """Insert records into the index (in the current transaction),
+        ignoring records that are already in the index.
+        Returns the number of records inserted."""
+        cur = self._get_cursor()
+        cur.executemany(self.INSERT_OR_IGNORE_QUERY, items)
+        return cur.rowcount
+
+    def get_existing_ids(self, local_index_ids: list) -> set:
+        """Get the ids that are already in the index"""
+        return set(self.get_repo_source_paths(local_index_ids))
+
+    def get_repo_source_paths(self, local_index_ids: list) -> dict:
+        """Get the repositories of the ids that are already in the index
+        (keyed by the id)"""
+        repo_source_paths: typing.Dict[str, str] = {}
+        # Note : the number of sqlite variables is limited (999 in older versions)
+        for i in range(0, len(local_index_ids), 900):
+            chunk = local_index_ids[i : i + 900]
+            cur = self._execute(
+                f"SELECT {LocalIndexFields.ID}, {LocalIndexFields.REPO_SOURCE_PATH} "
+                f"FROM {self.INDEX_NAME} "
+                f"WHERE {LocalIndexFields.ID} IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            repo_source_paths.update(
+                (row[LocalIndexFields.ID], row[LocalIndexFields.REPO_SOURCE_PATH])
+                for row in cur.fetchall()
+            )
+        return repo_source_paths
+
     def get(
         self,
         *,
@@ -184,8 +493,7 @@ class SQLiteIndexRecord(SQLiteIndex):
     ) -> dict:
         """Get a record from the index"""
         try:
-            cur = self._get_cursor()
-            cur.execute(self.SELECT_KEY_QUERIES[key], (value,))
+            cur = self._execute(self.SELECT_KEY_QUERIES[key], (value,))
             selected_row = cur.fetchone()
             if not selected_row:
                 raise colrev_exceptions.RecordNotInIndexException()
@@ -230,24 +538,148 @@ class SQLiteIndexRecord(SQLiteIndex):
                 raise NotImplementedError
         return retrieved_record
 
-    def update(self, local_index_id: str, bibtex: str) -> None:
+    def update(self, local_index_id: str, bibtex: str, record_json: str) -> None:
         """Update a record in the index"""
         cur = self._get_cursor()
-        cur.execute(self.UPDATE_RECORD_QUERY, (bibtex, local_index_id))
+        cur.execute(self.UPDATE_RECORD_QUERY, (bibtex, record_json, local_index_id))
+
+    def delete_repository_records(
+        self,
+        repo_source_path: str,
+        *,
+        citation_keys: typing.Optional[typing.Iterable[str]] = None,
+    ) -> int:
+        """Delete the records of a repository from the index (in the current transaction).
+        If citation_keys are given, only the corresponding records are deleted.
+        Returns the number of records deleted."""
+        query = (
+            f"DELETE FROM {self.INDEX_NAME} "
+            f"WHERE {LocalIndexFields.REPO_SOURCE_PATH}=?"
+        )
+        cur = self._get_cursor()
+        if citation_keys is None:
+            cur.execute(query, (repo_source_path,))
+            return cur.rowcount
+
+        nr_deleted = 0
+        citation_keys = list(citation_keys)
+        # Note : the number of sqlite variables is limited (999 in older versions)
+        for i in range(0, len(citation_keys), 900):
+            chunk = citation_keys[i : i + 900]
+            cur.execute(
+                f"{query} AND {LocalIndexFields.CITATION_KEY} "
+                f"IN ({','.join('?' * len(chunk))})",
+                [repo_source_path, *chunk],
+            )
+            nr_deleted += cur.rowcount
+        return nr_deleted
 
     def search(self, query: str) -> list:
         """Search for records in the index"""
-        cur = self._get_cursor()
         records_to_return = []
 
         selected_row = None
-        cur.execute(f"{self.SELECT_ALL_QUERY} {query}")
+        cur = self._execute(f"{self.SELECT_ALL_QUERY} {query}")
         for row in cur.fetchall():
             selected_row = row
             retrieved_record_dict = self._get_record_from_row(selected_row)
             records_to_return.append(retrieved_record_dict)
         return records_to_return
 
+    def fulltext_search(
+        self, query: str, *, limit: typing.Optional[int] = None, offset: int = 0
+    ) -> list:
+        """Search for records in the full-text index (fts5 query syntax),
+        ranked by relevance (bm25)"""
+        cur = self._execute(
+            self.FTS_SEARCH_QUERY, (query, -1 if limit is None else limit, offset)
+        )
+        return [self._get_record_from_row(row) for row in cur.fetchall()]
+
+    def _reinitialize_db(self) -> None:
+        super()._reinitialize_db()
+        cur = self._get_cursor()
+        cur.execute(f"drop table if exists {self.FTS_INDEX_NAME}")
+        cur.execute(self.CREATE_FTS_TABLE_QUERY)
+        for query in self.CREATE_FTS_TRIGGER_QUERIES:
+            cur.execute(query)
+        self.commit()
+
+
+def record_to_json(record_dict: dict) -> str:
+    """Serialize a record (including provenance) for the record_index"""
+    return json.dumps(record_dict, default=str, ensure_ascii=False)
+
+
+def record_from_json(record_json: str) -> dict:
+    """Deserialize a record from the record_index"""
+    record_dict = json.loads(record_json)
+    if Fields.STATUS in record_dict:
+        record_dict[Fields.STATUS] = RecordState[record_dict[Fields.STATUS]]
+    return record_dict
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Get the schema version of the sqlite index"""
+    cur = connection.cursor()
+    cur.row_factory = None  # type: ignore
+    return int(cur.execute("PRAGMA user_version").fetchone()[0])
+
+
+def _backfill_record_json(
+    connection: sqlite3.Connection, *, batch_size: int = 1000
+) -> None:
+    """Set the record_json of rows indexed before schema version 2
+    (parsed from the bibtex, in batches)"""
+    cur = connection.cursor()
+    cur.row_factory = None  # type: ignore
+    last_rowid = 0
+    while True:
+        rows = cur.execute(
+            f"SELECT rowid, {LocalIndexFields.BIBTEX} "
+            f"FROM {SQLiteIndexRecord.INDEX_NAME} WHERE rowid > ? "
+            f"AND ({LocalIndexFields.RECORD_JSON} IS NULL "
+            f"OR {LocalIndexFields.RECORD_JSON} = '') ORDER BY rowid LIMIT ?",
+            (last_rowid, batch_size),
+        ).fetchall()
+        if not rows:
+            return
+        updates = []
+        for rowid, bibtex in rows:
+            records_dict = colrev.loader.load_utils.loads(
+                load_string=bibtex,
+                implementation="bib",
+                unique_id_field="ID",
+            )
+            if records_dict:
+                updates.append((record_to_json(list(records_dict.values())[0]), rowid))
+        cur.executemany(
+            f"UPDATE {SQLiteIndexRecord.INDEX_NAME} "
+            f"SET {LocalIndexFields.RECORD_JSON}=? WHERE rowid=?",
+            updates,
+        )
+        connection.commit()
+        last_rowid = rows[-1][0]
+
+
+def migrate_schema(connection: sqlite3.Connection) -> None:
+    """Migrate an existing sqlite index (in place) to the current schema version
+    (called by the LocalIndexBuilder, not by readers)"""
+    try:
+        if get_schema_version(connection) >= SCHEMA_VERSION:
+            return
+        # Note : the migration steps are idempotent
+        SQLiteIndexRecord.add_missing_columns(connection)
+        # Note : the full-text index is populated from the record_json
+        _backfill_record_json(connection)
+        SQLiteIndexRecord.create_fts_index(connection)
+        SQLiteIndexTOC.add_missing_columns(connection, create_table=True)
+        SQLiteIndexRepository.add_missing_columns(connection, create_table=True)
+        SQLiteIndexRecord.create_secondary_indexes(connection)
+    except sqlite3.OperationalError:  # pragma: no cover
+        # e.g., no record_index table (yet) or database locked by the builder
+        pass
+
 
 class SQLiteIndexRankings(SQLiteIndex):
     """The SQLiteIndexRankings class implements indexing and retrieval
@@ -259,11 +691,17 @@ class SQLiteIndexRankings(SQLiteIndex):
     CREATE_TABLE_QUERY = f"CREATE TABLE {INDEX_NAME} (id TEXT PRIMARY KEY)"
     SELECT_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE journal_name = ?"
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection_pool: typing.Optional[SQLiteConnectionPool] = None,
+    ) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            connection_pool=connection_pool,
         )
 
     def insert_df(self, data_frame: pd.DataFrame) -> None:
@@ -276,8 +714,7 @@ class SQLiteIndexRankings(SQLiteIndex):
     def select(self, journal: str) -> list:
         """Select journal rankings from the index"""
 
-        cur = self._get_cursor()
-        cur.execute(self.SELECT_QUERY, (journal,))
+        cur = self._execute(self.SELECT_QUERY, (journal,))
         rankings = cur.fetchall()
         return rankings
 
@@ -286,10 +723,16 @@ class SQLiteIndexTOC(SQLiteIndex):
     """The SQLiteIndexTOC class implements indexing and retrieval of TOC items locally"""
 
     INDEX_NAME = "toc_index"
-    KEYS: typing.List[str] = []
+    KEYS = [
+        LocalIndexFields.TOC_KEY,
+        "colrev_ids",
+        LocalIndexFields.REPO_SOURCE_PATH,
+    ]
 
     CREATE_TABLE_QUERY = (
-        f"CREATE TABLE {INDEX_NAME} (toc_key TEXT PRIMARY KEY, colrev_ids)"
+        f"CREATE TABLE {INDEX_NAME} (toc_key TEXT PRIMARY KEY,"
+        + ",".join(KEYS[1:])
+        + ")"
     )
 
     SELECT_ALL_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE "
@@ -298,19 +741,26 @@ class SQLiteIndexTOC(SQLiteIndex):
         LocalIndexFields.TOC_KEY: f"SELECT * FROM {INDEX_NAME} WHERE {LocalIndexFields.TOC_KEY}=?",
     }
 
-    INSERT_MANY_QUERY = f"INSERT INTO {INDEX_NAME} VALUES(?, ?)"
+    INSERT_MANY_QUERY = f"INSERT INTO {INDEX_NAME} ({', '.join(KEYS)}) VALUES(?, ?, ?)"
 
-    def __init__(self, *, reinitialize: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection_pool: typing.Optional[SQLiteConnectionPool] = None,
+        connection: typing.Optional[sqlite3.Connection] = None,
+    ) -> None:
         super().__init__(
             index_name=self.INDEX_NAME,
             index_keys=self.KEYS,
             reinitialize=reinitialize,
+            connection_pool=connection_pool,
+            connection=connection,
         )
 
     def exists(self, toc_item: str) -> bool:
         """Check if TOC item exists in the index"""
-        cur = self._get_cursor()
-        cur.execute(
+        cur = self._execute(
             self.SELECT_KEY_QUERY[LocalIndexFields.TOC_KEY],
             (toc_item,),
         )
@@ -319,6 +769,22 @@ class SQLiteIndexTOC(SQLiteIndex):
             return False
         return True
 
+    def get_existing_toc_keys(self, toc_keys: list) -> set:
+        """Get the TOC keys that are in the index"""
+        existing_toc_keys: typing.Set[str] = set()
+        # Note : the number of sqlite variables is limited (999 in older versions)
+        for i in range(0, len(toc_keys), 900):
+            chunk = toc_keys[i : i + 900]
+            cur = self._execute(
+                f"SELECT {LocalIndexFields.TOC_KEY} FROM {self.INDEX_NAME} "
+                f"WHERE {LocalIndexFields.TOC_KEY} IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            existing_toc_keys.update(
+                row[LocalIndexFields.TOC_KEY] for row in cur.fetchall()
+            )
+        return existing_toc_keys
+
     def get_toc_items(self, toc_key: str = "", partial_toc_key: str = "") -> list:
         """Get TOC items from the index"""
         if partial_toc_key != "":
@@ -333,8 +799,7 @@ class SQLiteIndexTOC(SQLiteIndex):
             raise NotImplementedError
 
         try:
-            cur = self._get_cursor()
-            cur.execute(query, (argument,))
+            cur = self._execute(query, (argument,))
             results = cur.fetchall()
 
         except sqlite3.OperationalError as exc:  # pragma: no cover
@@ -349,13 +814,100 @@ class SQLiteIndexTOC(SQLiteIndex):
 
         return toc_items
 
-    def add(self, toc_to_index: dict) -> None:
-        """Add TOC items to the index"""
-        list_to_add = list((k, v) for k, v in toc_to_index.items() if v != "DROPPED")
+    def add(self, toc_to_index: dict, *, repo_source_path: str = "") -> None:
+        """Add TOC items to the index (in the current transaction)"""
+        list_to_add = list(
+            (k, v, repo_source_path) for k, v in toc_to_index.items() if v != "DROPPED"
+        )
         cur = self._get_cursor()
         try:
             cur.executemany(self.INSERT_MANY_QUERY, list_to_add)
         except sqlite3.IntegrityError as exc:  # pragma: no cover
             print(exc)
-        finally:
-            self.commit()
+
+    def delete_repository_items(self, repo_source_path: str) -> None:
+        """Delete the TOC items of a repository from the index (in the current transaction)"""
+        cur = self._get_cursor()
+        cur.execute(
+            f"DELETE FROM {self.INDEX_NAME} "
+            f"WHERE {LocalIndexFields.REPO_SOURCE_PATH}=?",
+            (repo_source_path,),
+        )
+
+
+class SQLiteIndexRepository(SQLiteIndex):
+    """The SQLiteIndexRepository class keeps track of the state
+    (git HEAD commit and records.bib blob) at which each repository was indexed,
+    and of the repositories that share records with other repositories
+    (records amended by curated fields or not indexed because
+    they were already indexed from another repository)"""
+
+    INDEX_NAME = "repository_index"
+    KEYS = [
+        LocalIndexFields.REPO_SOURCE_PATH,
+        LocalIndexFields.HEAD_SHA,
+        LocalIndexFields.RECORDS_BLOB_SHA,
+        LocalIndexFields.SHARED_RECORDS,
+    ]
+
+    CREATE_TABLE_QUERY = (
+        f"CREATE TABLE {INDEX_NAME} (repo_source_path TEXT PRIMARY KEY,"
+        + ",".join(KEYS[1:])
+        + ")"
+    )
+
+    def __init__(
+        self,
+        *,
+        reinitialize: bool = False,
+        connection_pool: typing.Optional[SQLiteConnectionPool] = None,
+        connection: typing.Optional[sqlite3.Connection] = None,
+    ) -> None:
+        super().__init__(
+            index_name=self.INDEX_NAME,
+            index_keys=self.KEYS,
+            reinitialize=reinitialize,
+            connection_pool=connection_pool,
+            connection=connection,
+        )
+
+    def get_states(self) -> dict:
+        """Get the indexed state of each repository (keyed by the repo_source_path)"""
+        cur = self._execute(f"SELECT * FROM {self.INDEX_NAME}")
+        return {
+            row.pop(LocalIndexFields.REPO_SOURCE_PATH): row for row in cur.fetchall()
+        }
+
+    def set_state(
+        self,
+        repo_source_path: str,
+        *,
+        head_sha: str,
+        records_blob_sha: str,
+        shared_records: bool = False,
+    ) -> None:
+        """Set the state at which a repository was indexed (in the current transaction)"""
+        cur = self._get_cursor()
+        cur.execute(
+            f"INSERT OR REPLACE INTO {self.INDEX_NAME} VALUES(?, ?, ?, ?)",
+            (repo_source_path, head_sha, records_blob_sha, int(shared_records)),
+        )
+
+    def set_shared_records(self, repo_source_paths: typing.Iterable[str]) -> None:
+        """Mark repositories that share records with other repositories
+        (in the current transaction)"""
+        cur = self._get_cursor()
+        cur.executemany(
+            f"UPDATE {self.INDEX_NAME} SET {LocalIndexFields.SHARED_RECORDS}=1 "
+            f"WHERE {LocalIndexFields.REPO_SOURCE_PATH}=?",
+            [(repo_source_path,) for repo_source_path in repo_source_paths],
+        )
+
+    def delete(self, repo_source_path: str) -> None:
+        """Delete the state of a repository (in the current transaction)"""
+        cur = self._get_cursor()
+        cur.execute(
+            f"DELETE FROM {self.INDEX_NAME} "
+            f"WHERE {LocalIndexFields.REPO_SOURCE_PATH}=?",
+            (repo_source_path,),
+        )
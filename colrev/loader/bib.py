@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 import io
-import itertools
 import logging
 import os
 import re
-import string
 import typing
 from pathlib import Path
 
 import pybtex.errors
+from pybtex.bibtex.utils import split_name_list
 from pybtex.database import Person
 from pybtex.database.input import bibtex
 
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.loader
+import colrev.record.record_id_allocator
 from colrev.constants import Fields
 from colrev.constants import FieldSet
 from colrev.constants import FieldValues
@@ -27,14 +27,51 @@ from colrev.constants import RecordState
 # pylint: disable=too-many-arguments
 
 
+def _format_name(person: Person) -> str:
+    def join(name_list: list) -> str:
+        return " ".join([name for name in name_list if name])
+
+    first = person.get_part_as_text("first")
+    middle = person.get_part_as_text("middle")
+    prelast = person.get_part_as_text("prelast")
+    last = person.get_part_as_text("last")
+    lineage = person.get_part_as_text("lineage")
+    name_string = ""
+    if last:
+        name_string += join([prelast, last])
+    if lineage:
+        name_string += f", {lineage}"
+    if first or middle:
+        name_string += ", "
+        name_string += join([first, middle])
+    return name_string
+
+
 class BIBLoader(colrev.loader.loader.Loader):
     """Loads BibTeX files"""
 
+    # Note : the canonical layout is written by colrev.writer.bib.to_string
+    _CANONICAL_FIELD_SEPARATOR = ",\n   "
+    _CANONICAL_HEADER = re.compile(r"@([a-zA-Z]+)\{([^\s,;{}]+)")
+    _CANONICAL_FIELD_NAME = re.compile(r"[a-zA-Z_][a-zA-Z0-9_\-.:+]*")
+    _NAME_SEPARATOR = re.compile(" [Aa][Nn][Dd] ")
+    _TEX_CHARACTERS = re.compile(r"[{}\\~]")
+    _PERSON_FIELDS = {Fields.AUTHOR, Fields.EDITOR}
+    _PARSED_FIELDS = {
+        Fields.STATUS,
+        Fields.DOI,
+        Fields.ORIGIN,
+        Fields.MD_PROV,
+        Fields.D_PROV,
+        *FieldSet.LIST_FIELDS,
+    }
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         unique_id_field: str = "ID",
         entrytype_setter: typing.Callable = lambda x: x,
         field_mapper: typing.Callable = lambda x: x,
@@ -43,6 +80,7 @@ class BIBLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -60,29 +98,15 @@ class BIBLoader(colrev.loader.loader.Loader):
                     count += 1
         return count
 
-    def _generate_next_unique_id(
-        self,
-        *,
-        temp_id: str,
-        existing_ids: list,
-    ) -> str:
-        """Get the next unique ID"""
-
-        order = 0
-        letters = list(string.ascii_lowercase)
-        next_unique_id = temp_id
-        appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
-            if len(appends) == 0:
-                order += 1
-                appends = list(itertools.product(letters, repeat=order))
-            next_unique_id = temp_id + "".join(list(appends.pop(0)))
-        temp_id = next_unique_id
-        return temp_id
-
-    def _apply_file_fixes(self) -> None:
+    def _apply_file_fixes(self, file: typing.IO) -> None:
+        # Note : file is a bib file opened in r+b mode or a bytes buffer
         # pylint: disable=too-many-statements
 
+        def sync(file: typing.IO) -> None:
+            file.flush()
+            if not isinstance(file, io.BytesIO):
+                os.fsync(file)
+
         def fix_key(
             file: typing.IO, line: bytes, replacement_line: bytes, seekpos: int
         ) -> int:
@@ -95,178 +119,258 @@ class BIBLoader(colrev.loader.loader.Loader):
             file.seek(seekpos)
             file.write(replacement_line)
             seekpos = file.tell()
-            file.flush()
-            os.fsync(file)
+            sync(file)
             file.write(remaining)
             file.truncate()  # if the replacement is shorter...
             file.seek(seekpos)
             return seekpos
 
-        if self.filename is not None:
-
-            with open(self.filename, encoding="utf8") as bibtex_file:
-                contents = bibtex_file.read()
-                if len(contents) < 10:
-                    return
-                bib_r = re.compile(r"@.*{.*,", re.M)
-                if len(re.findall(bib_r, contents)) == 0:
-                    self.logger.error(f"Not a bib file? {self.filename.name}")
-                    raise colrev_exceptions.UnsupportedImportFormatError(self.filename)
-
-            # Errors to fix before pybtex loading:
-            # - set_incremental_ids (otherwise, not all records will be loaded)
-            # - fix_keys (keys containing white spaces)
-            record_ids: typing.List[str] = []
-            with open(self.filename, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
-                    if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8").lstrip().rstrip()
-
-                        if any(x in current_id_str for x in [";"]):
-                            replacement_line = re.sub(
-                                r";",
-                                r"_",
-                                line.decode("utf-8"),
-                            ).encode("utf-8")
-                            seekpos = fix_key(file, line, replacement_line, seekpos)
-
-                        if current_id_str in record_ids:
-                            next_id = self._generate_next_unique_id(
-                                temp_id=current_id_str, existing_ids=record_ids
-                            )
-                            self.logger.info(
-                                f"Fix duplicate ID: {current_id_str} >> {next_id}"
-                            )
-
-                            replacement_line = (
-                                line.decode("utf-8")
-                                .replace(current_id.decode("utf-8"), next_id)
-                                .encode("utf-8")
-                            )
-
-                            line = file.readline()
-                            remaining = line + file.read()
-                            file.seek(seekpos)
-                            file.write(replacement_line)
-                            seekpos = file.tell()
-                            file.flush()
-                            os.fsync(file)
-                            file.write(remaining)
-                            file.truncate()  # if the replacement is shorter...
-                            file.seek(seekpos)
-
-                            record_ids.append(next_id)
-
-                        else:
-                            record_ids.append(current_id_str)
-
-                    # Fix keys
-                    if re.match(
-                        r"^\s*[a-zA-Z0-9]+\s+[a-zA-Z0-9]+\s*\=", line.decode("utf-8")
-                    ):
-                        replacement_line = re.sub(
-                            r"(^\s*)([a-zA-Z0-9]+)\s+([a-zA-Z0-9]+)(\s*\=)",
-                            r"\1\2_\3\4",
-                            line.decode("utf-8"),
-                        ).encode("utf-8")
-                        seekpos = fix_key(file, line, replacement_line, seekpos)
-
-                    # Fix IDs
-                    if re.match(
-                        r"^@[a-zA-Z0-9]+\{[a-zA-Z0-9]+\s[a-zA-Z0-9]+,",
+        contents = file.read().decode("utf-8")
+        if len(contents) < 10:
+            return
+        bib_r = re.compile(r"@.*{.*,", re.M)
+        if len(re.findall(bib_r, contents)) == 0:
+            filename = self.filename or Path("load_string.bib")
+            self.logger.error(f"Not a bib file? {filename.name}")
+            raise colrev_exceptions.UnsupportedImportFormatError(filename)
+
+        # Errors to fix before pybtex loading:
+        # - set_incremental_ids (otherwise, not all records will be loaded)
+        # - fix_keys (keys containing white spaces)
+        id_allocator = colrev.record.record_id_allocator.IDAllocator()
+        file.seek(0)
+        seekpos = file.tell()
+        line = file.readline()
+        while line:
+            if b"@" in line[:3]:
+                current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
+                current_id_str = current_id.decode("utf-8").lstrip().rstrip()
+
+                if any(x in current_id_str for x in [";"]):
+                    replacement_line = re.sub(
+                        r";",
+                        r"_",
                         line.decode("utf-8"),
-                    ):
-                        replacement_line = re.sub(
-                            r"^(@[a-zA-Z0-9]+\{[a-zA-Z0-9]+)\s([a-zA-Z0-9]+,)",
-                            r"\1_\2",
-                            line.decode("utf-8"),
-                        ).encode("utf-8")
-                        seekpos = fix_key(file, line, replacement_line, seekpos)
+                    ).encode("utf-8")
+                    seekpos = fix_key(file, line, replacement_line, seekpos)
+
+                if current_id_str in id_allocator:
+                    next_id = id_allocator.allocate(current_id_str)
+                    self.logger.info(f"Fix duplicate ID: {current_id_str} >> {next_id}")
+
+                    replacement_line = (
+                        line.decode("utf-8")
+                        .replace(current_id.decode("utf-8"), next_id)
+                        .encode("utf-8")
+                    )
 
-                    seekpos = file.tell()
                     line = file.readline()
+                    remaining = line + file.read()
+                    file.seek(seekpos)
+                    file.write(replacement_line)
+                    seekpos = file.tell()
+                    sync(file)
+                    file.write(remaining)
+                    file.truncate()  # if the replacement is shorter...
+                    file.seek(seekpos)
+
+                else:
+                    id_allocator.add(current_id_str)
+
+            # Fix keys
+            if re.match(r"^\s*[a-zA-Z0-9]+\s+[a-zA-Z0-9]+\s*\=", line.decode("utf-8")):
+                replacement_line = re.sub(
+                    r"(^\s*)([a-zA-Z0-9]+)\s+([a-zA-Z0-9]+)(\s*\=)",
+                    r"\1\2_\3\4",
+                    line.decode("utf-8"),
+                ).encode("utf-8")
+                seekpos = fix_key(file, line, replacement_line, seekpos)
+
+            # Fix IDs
+            if re.match(
+                r"^@[a-zA-Z0-9]+\{[a-zA-Z0-9]+\s[a-zA-Z0-9]+,",
+                line.decode("utf-8"),
+            ):
+                replacement_line = re.sub(
+                    r"^(@[a-zA-Z0-9]+\{[a-zA-Z0-9]+)\s([a-zA-Z0-9]+,)",
+                    r"\1_\2",
+                    line.decode("utf-8"),
+                ).encode("utf-8")
+                seekpos = fix_key(file, line, replacement_line, seekpos)
+
+            seekpos = file.tell()
+            line = file.readline()
+
+    def _parse_field_value(self, field: str, value: str) -> typing.Any:
+        # Cast status to Enum
+        if Fields.STATUS == field:
+            return RecordState[value]
+        # DOIs are case insensitive -> use upper case.
+        if Fields.DOI == field:
+            return value.upper()
+        # Note : the following two lines are a temporary fix
+        # to converg colrev_origins to list items
+        if field == Fields.ORIGIN:
+            return [el.rstrip().lstrip() for el in value.split(";") if "" != el]
+        if field in FieldSet.LIST_FIELDS:
+            return [el.rstrip() for el in (value + " ").split("; ") if "" != el]
+        if field in [Fields.MD_PROV, Fields.D_PROV]:
+            return self._load_field_dict(value=value, field=field)
+        return value
 
     def _parse_records_dict(self, *, records_dict: dict) -> dict:
         """Parse a records_dict from pybtex to colrev standard"""
 
-        def format_name(person: Person) -> str:
-            def join(name_list: list) -> str:
-                return " ".join([name for name in name_list if name])
-
-            first = person.get_part_as_text("first")
-            middle = person.get_part_as_text("middle")
-            prelast = person.get_part_as_text("prelast")
-            last = person.get_part_as_text("last")
-            lineage = person.get_part_as_text("lineage")
-            name_string = ""
-            if last:
-                name_string += join([prelast, last])
-            if lineage:
-                name_string += f", {lineage}"
-            if first or middle:
-                name_string += ", "
-                name_string += join([first, middle])
-            return name_string
-
         # Need to concatenate fields and persons dicts
         # but pybtex is still the most efficient solution.
         records_dict = {
             k: {
                 **{Fields.ID: k},
                 **{Fields.ENTRYTYPE: v.type},
-                **dict(
-                    {
-                        # Cast status to Enum
-                        k: (
-                            RecordState[v]
-                            if (Fields.STATUS == k)
-                            # DOIs are case insensitive -> use upper case.
-                            else (
-                                v.upper()
-                                if (Fields.DOI == k)
-                                # Note : the following two lines are a temporary fix
-                                # to converg colrev_origins to list items
-                                else (
-                                    [
-                                        el.rstrip().lstrip()
-                                        for el in v.split(";")
-                                        if "" != el
-                                    ]
-                                    if k == Fields.ORIGIN
-                                    else (
-                                        [
-                                            el.rstrip()
-                                            for el in (v + " ").split("; ")
-                                            if "" != el
-                                        ]
-                                        if k in FieldSet.LIST_FIELDS
-                                        else (
-                                            self._load_field_dict(value=v, field=k)
-                                            if k in [Fields.MD_PROV, Fields.D_PROV]
-                                            else v
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                        for k, v in v.fields.items()
-                    }
-                ),
-                **dict(
-                    {
-                        k: " and ".join(format_name(person) for person in persons)
-                        for k, persons in v.persons.items()
-                    }
-                ),
+                **{
+                    field: self._parse_field_value(field, value)
+                    for field, value in v.fields.items()
+                },
+                **{
+                    field: " and ".join(_format_name(person) for person in persons)
+                    for field, persons in v.persons.items()
+                },
             }
             for k, v in records_dict.items()
         }
 
         return records_dict
 
+    @classmethod
+    def _is_nested(cls, value: str) -> bool:
+        # Braces must be balanced and never close before they are opened
+        if "{" not in value and "}" not in value:
+            return True
+        depth = 0
+        for char in value:
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth < 0:
+                    return False
+        return depth == 0
+
+    @classmethod
+    def _format_canonical_names(cls, value: str) -> str:
+        # Note : names in the "Last, First" form are formatted without pybtex
+        if cls._TEX_CHARACTERS.search(value):
+            return " and ".join(
+                _format_name(Person(name)) for name in split_name_list(value)
+            )
+        formatted_names = []
+        for name in cls._NAME_SEPARATOR.split(value):
+            last, sep, first = name.partition(",")
+            last, first = last.strip(), first.strip()
+            if sep and last and "," not in first:
+                formatted_names.append(f"{last}, {first}" if first else last)
+            else:
+                formatted_names.append(_format_name(Person(name)))
+        return " and ".join(formatted_names)
+
+    def _parse_canonical_fields(
+        self, pieces: list, *, field_names: dict
+    ) -> typing.Optional[dict]:
+        # pylint: disable=too-many-branches
+        fields: dict = {}
+        persons: dict = {}
+        seen_fields = set()
+        pending = ""
+        person_fields, parsed_fields = self._PERSON_FIELDS, self._PARSED_FIELDS
+        for piece in pieces:
+            # Note : values that contain the field separator were split
+            if pending:
+                piece = pending + self._CANONICAL_FIELD_SEPARATOR + piece
+            name, sep, value = piece.partition(" = {")
+            value = value[:-1] if value[-1:] == "}" else None
+            if (
+                not sep
+                or value is None
+                or ("{" in value or "}" in value)
+                and not self._is_nested(value)
+            ):
+                pending = piece
+                continue
+            pending = ""
+
+            # Note : field names are validated once (name includes the padding)
+            try:
+                name, name_lower = field_names[name]
+            except KeyError:
+                field_names[name] = (
+                    (name.rstrip(), name.rstrip().lower())
+                    if self._CANONICAL_FIELD_NAME.fullmatch(name.rstrip())
+                    else (None, None)
+                )
+                name, name_lower = field_names[name]
+            if name is None:
+                return None
+            # pybtex ignores duplicate fields (case-insensitive)
+            if name_lower in seen_fields:
+                continue
+            seen_fields.add(name_lower)
+
+            value = " ".join(value.split())
+            if name in parsed_fields:
+                fields[name] = self._parse_field_value(name, value)
+            elif name_lower not in person_fields:
+                fields[name] = value
+            elif value:
+                try:
+                    persons[name] = self._format_canonical_names(value)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # Note : pybtex reports (or raises) errors for invalid names
+                    return None
+
+        if pending:
+            return None
+        return {**fields, **persons}
+
+    def _parse_canonical_records(self, content: str) -> typing.Optional[dict]:
+        """Parse records in the canonical layout (see colrev.writer.bib.to_string)
+
+        The records are parsed in a single pass (without pybtex),
+        returning None if the content is not in the canonical layout
+        (the results correspond to those of pybtex and _parse_records_dict)."""
+
+        records_dict: dict = {}
+        record_ids = set()
+        field_names: dict = {}
+        chunks = content.split("\n}\n")
+        if chunks[-1].strip():
+            return None
+        for chunk in chunks[:-1]:
+            chunk = chunk.lstrip("\n")
+            if chunk[-1:] != ",":
+                return None
+            header, *pieces = chunk[:-1].split(self._CANONICAL_FIELD_SEPARATOR)
+            match = self._CANONICAL_HEADER.fullmatch(header)
+            if not match:
+                return None
+            entrytype, record_id = match.group(1).lower(), match.group(2)
+            # Duplicate IDs would require file fixes
+            if entrytype in ["comment", "string", "preamble"] or (
+                record_id.lower() in record_ids
+            ):
+                return None
+            record_ids.add(record_id.lower())
+
+            fields = self._parse_canonical_fields(pieces, field_names=field_names)
+            if fields is None:
+                return None
+            records_dict[record_id] = {
+                Fields.ID: record_id,
+                Fields.ENTRYTYPE: entrytype,
+                **fields,
+            }
+
+        return records_dict
+
     def _load_field_dict(self, *, value: str, field: str) -> dict:
         # pylint: disable=too-many-branches
 
@@ -348,7 +452,7 @@ class BIBLoader(colrev.loader.loader.Loader):
 
     # pylint: disable=too-many-branches
     def _read_record_header_items(
-        self, *, file_object: typing.Optional[typing.TextIO] = None
+        self, *, file_object: typing.Optional[typing.IO] = None
     ) -> list:
         # Note : more than 10x faster than the pybtex part of load_records_dict()
 
@@ -417,8 +521,10 @@ class BIBLoader(colrev.loader.loader.Loader):
 
     def get_record_header_items(self) -> dict:
         """Get the record header items"""
-        record_header_list = []
-        record_header_list = self._read_record_header_items()
+        file_object = self.file_object
+        if file_object is not None and not isinstance(file_object, io.TextIOBase):
+            file_object = io.TextIOWrapper(file_object, encoding="utf-8")
+        record_header_list = self._read_record_header_items(file_object=file_object)
 
         record_header_dict = {r[Fields.ID]: r for r in record_header_list}
         return record_header_dict
@@ -426,11 +532,12 @@ class BIBLoader(colrev.loader.loader.Loader):
     def load_records_list(self) -> list:
 
         def drop_empty_fields(*, records: dict) -> None:
-            for record_id in records:
+            for record_id, record_dict in records.items():
+                values = record_dict.values()
+                if None not in values and "nan" not in values:
+                    continue
                 records[record_id] = {
-                    k: v
-                    for k, v in records[record_id].items()
-                    if v is not None and v != "nan"
+                    k: v for k, v in record_dict.items() if v is not None and v != "nan"
                 }
 
         def resolve_crossref(*, records: dict) -> None:
@@ -456,14 +563,34 @@ class BIBLoader(colrev.loader.loader.Loader):
             for crossref_id in crossref_ids:
                 del records[crossref_id]
 
-        self._apply_file_fixes()
-
-        temp_f = io.StringIO()
-        pybtex.io.stderr = temp_f
-        pybtex.errors.set_strict_mode(False)
-        parser = bibtex.Parser()
-        bib_data = parser.parse_file(str(self.filename))
-        records = self._parse_records_dict(records_dict=bib_data.entries)
+        if self.file_object is not None:
+            content = self.file_object.read()
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+        else:
+            assert self.filename is not None
+            content = self.filename.read_bytes()
+
+        # Note : records files (in the canonical layout) do not require pybtex
+        records = self._parse_canonical_records(content.decode("utf-8"))
+        if records is None:
+            temp_f = io.StringIO()
+            pybtex.io.stderr = temp_f
+            pybtex.errors.set_strict_mode(False)
+            parser = bibtex.Parser()
+            if self.file_object is not None:
+                buffer = io.BytesIO(content)
+                self._apply_file_fixes(buffer)
+                buffer.seek(0)
+                bib_data = parser.parse_stream(
+                    io.TextIOWrapper(buffer, encoding="utf-8")
+                )
+            else:
+                assert self.filename is not None
+                with open(self.filename, "r+b") as file:
+                    self._apply_file_fixes(file)
+                bib_data = parser.parse_file(str(self.filename))
+            records = self._parse_records_dict(records_dict=bib_data.entries)
 
         drop_empty_fields(records=records)
         resolve_crossref(records=records)
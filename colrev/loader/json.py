@@ -22,7 +22,8 @@ class JSONLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -31,6 +32,7 @@ class JSONLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -49,7 +51,6 @@ class JSONLoader(colrev.loader.loader.Loader):
     def load_records_list(self) -> list:
         """Load json entries"""
 
-        with open(self.filename, encoding="utf-8-sig") as file:
-            records_list = json.load(file)
+        records_list = json.loads(self._read_text(encoding="utf-8-sig"))
 
         return records_list
@@ -129,14 +129,15 @@ Example json record:
 """
 from __future__ import annotations
 
+import io
 import logging
-import tempfile
 import typing
 from pathlib import Path
 
 import colrev.loader.bib
 import colrev.loader.enl
 import colrev.loader.json
+import colrev.loader.loader
 import colrev.loader.md
 import colrev.loader.nbib
 import colrev.loader.ris
@@ -147,6 +148,27 @@ import colrev.loader.table
 # flake8: noqa: E501
 
 
+_PARSERS: typing.Dict[str, typing.Type[colrev.loader.loader.Loader]] = {
+    ".bib": colrev.loader.bib.BIBLoader,
+    ".csv": colrev.loader.table.TableLoader,
+    ".xls": colrev.loader.table.TableLoader,
+    ".xlsx": colrev.loader.table.TableLoader,
+    ".ris": colrev.loader.ris.RISLoader,
+    ".enl": colrev.loader.enl.ENLLoader,
+    ".txt": colrev.loader.enl.ENLLoader,
+    ".md": colrev.loader.md.MarkdownLoader,
+    ".nbib": colrev.loader.nbib.NBIBLoader,
+    ".json": colrev.loader.json.JSONLoader,
+}
+
+
+def _get_parser(suffix: str) -> typing.Type[colrev.loader.loader.Loader]:
+    try:
+        return _PARSERS[suffix]
+    except KeyError as exc:
+        raise NotImplementedError from exc
+
+
 def load(  # type: ignore
     filename: Path,
     *,
@@ -164,24 +186,9 @@ def load(  # type: ignore
             return {}
         raise FileNotFoundError
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError
+    parser = _get_parser(filename.suffix)
 
-    return parser(
+    return parser(  # type: ignore
         filename=filename,
         entrytype_setter=entrytype_setter,
         field_mapper=field_mapper,
@@ -216,20 +223,23 @@ def loads(  # type: ignore
     ]:
         raise NotImplementedError
 
-    with tempfile.NamedTemporaryFile(
-        mode="wb", delete=False, suffix=f".{implementation}"
-    ) as temp_file:
-        temp_file.write(load_string.encode("utf-8"))
-        temp_file_path = Path(temp_file.name)
+    parser = _get_parser(f".{implementation}")
 
-    return load(
-        filename=temp_file_path,
+    # Note : the string is loaded in memory (no temporary files)
+    # Excel files are binary (loaded from a bytes buffer)
+    file_object: typing.IO = (
+        io.BytesIO(load_string.encode("utf-8"))
+        if implementation in ["xls", "xlsx"]
+        else io.StringIO(load_string)
+    )
+    return parser(  # type: ignore
+        file_object=file_object,
         entrytype_setter=entrytype_setter,
         field_mapper=field_mapper,
         id_labeler=id_labeler,
         unique_id_field=unique_id_field,
         logger=logger,
-    )
+    ).load()
 
 
 def get_nr_records(  # type: ignore
@@ -240,21 +250,6 @@ def get_nr_records(  # type: ignore
     if not filename.exists():
         return 0
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError
+    parser = _get_parser(filename.suffix)
 
-    return parser.get_nr_records(filename)
+    return parser.get_nr_records(filename)  # type: ignore
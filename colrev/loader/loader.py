@@ -1,5 +1,6 @@
 #! /usr/bin/env python
 """Convenience functions to load files (BiBTeX, RIS, CSV, etc.)"""
+import itertools
 import logging
 import typing
 from pathlib import Path
@@ -14,17 +15,24 @@ from colrev.constants import Fields
 class Loader:
     """Loader class"""
 
+    BATCH_SIZE = 1000
+
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path],
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
         unique_id_field: str,
         logger: logging.Logger,
+        file_object: typing.Optional[typing.IO] = None,
     ):
+        # Note : records are loaded from the file_object (text stream or bytes buffer)
+        # if it is provided (e.g., to load strings without writing temporary files)
+        assert (filename is None) != (file_object is None)
         self.filename = filename
+        self.file_object = file_object
         self.unique_id_field = unique_id_field
         assert id_labeler is not None or unique_id_field != ""
         self.id_labeler = id_labeler
@@ -33,9 +41,9 @@ class Loader:
 
         self.logger = logger
 
-    def _set_ids(self, records_list: list) -> None:
+    def _set_ids(self, records_list: list, *, offset: int = 0) -> None:
         if self.unique_id_field == "INCREMENTAL":
-            for next_id, record_dict in enumerate(records_list, 1):
+            for next_id, record_dict in enumerate(records_list, offset + 1):
                 record_dict[Fields.ID] = str(next_id).zfill(6)
 
         elif self.unique_id_field != "":
@@ -47,26 +55,25 @@ class Loader:
         assert all(
             Fields.ID in record_dict for record_dict in records_list
         ), "ID not set in all records"
-        unique_ids = {record_dict[Fields.ID] for record_dict in records_list}
-        assert len(unique_ids) == len(records_list), "ID is not unique in records"
 
-    def _set_entrytypes(self, records_dict: dict) -> None:
-        for r_dict_val in records_dict.values():
-            self.entrytype_setter(r_dict_val)
+    def _set_entrytypes(self, records_list: list) -> None:
+        for record_dict in records_list:
+            self.entrytype_setter(record_dict)
         assert all(
-            Fields.ENTRYTYPE in r for r in records_dict.values()
+            Fields.ENTRYTYPE in r for r in records_list
         ), "ENTRYTYPE not set in all records"
         invalid_entrytypes = [
             r[Fields.ENTRYTYPE]
-            for r in records_dict.values()
+            for r in records_list
             if r[Fields.ENTRYTYPE] not in ENTRYTYPES.get_all()
         ]
         assert (
             len(invalid_entrytypes) == 0
         ), f"Invalid ENTRYTYPE in some records: {invalid_entrytypes}"
 
-    def _set_fields(self, records_dict: dict) -> None:
-        for record_dict in records_dict.values():
+    def _set_fields(self, records_list: list) -> list:
+        """Map the fields and return the records that contain invalid keys"""
+        for record_dict in records_list:
             self.field_mapper(record_dict)
 
         # assert all(
@@ -75,36 +82,84 @@ class Loader:
         #     for mandatory_field in [Fields.AUTHOR, Fields.TITLE, Fields.YEAR]
         # ), "Mandatory field not set in all records"
 
-        error_field_list = [
-            field if any(c in field for c in [" ", ";"]) else None
-            for record_dict in records_dict.values()
-            for field in record_dict.keys()
+        field_names = {field for record_dict in records_list for field in record_dict}
+        error_fields = {field for field in field_names if " " in field or ";" in field}
+        if not error_fields:
+            return []
+        return [
+            r
+            for r in records_list
+            if any(error_field in r for error_field in error_fields)
         ]
 
-        error_fields = {field for field in error_field_list if field is not None}
-
-        if any(error_fields):
-            error_cases = [
-                r
-                for r in records_dict.values()
-                if any(error_field in r for error_field in error_fields)
-            ]
-            self.logger.error(
-                f"Record contains invalid keys: {error_fields},\n record: {error_cases}"
-            )
+    def _read_text(self, *, encoding: str = "utf-8") -> str:
+        """Read the contents of the file (or file_object)"""
+        if self.file_object is not None:
+            content = self.file_object.read()
+            if isinstance(content, bytes):
+                return content.decode(encoding)
+            return content
+        assert self.filename is not None
+        return self.filename.read_text(encoding=encoding)
+
+    def _read_lines(self, *, encoding: str = "utf-8") -> typing.Iterator[str]:
+        """Read the lines of the file (or file_object) one at a time
+        (without the line breaks)"""
+        if self.file_object is not None:
+            for line in self.file_object:
+                if isinstance(line, bytes):
+                    line = line.decode(encoding)
+                yield line[:-1] if line.endswith("\n") else line
+            return
+        assert self.filename is not None
+        with open(self.filename, encoding=encoding) as file:
+            for line in file:
+                yield line[:-1] if line.endswith("\n") else line
 
     def load_records_list(self) -> list:
         """The load_records_list must be implemented by the inheriting class
         (e.g., for ris/bib/...)"""
         raise NotImplementedError  # pragma: no cover
 
+    def iter_records(self) -> typing.Iterator[dict]:
+        """Iterate over the records
+
+        Loaders for large files (e.g., ris) override this method
+        to yield the records one at a time (without loading the whole file)"""
+        yield from self.load_records_list()
+
     def load(self) -> dict:
         """Load table entries from the source"""
 
-        records_list = self.load_records_list()
-        self._set_ids(records_list)
-        records_dict = {str(r[Fields.ID]): r for r in records_list}
-        self._set_entrytypes(records_dict)
-        self._set_fields(records_dict)
+        # Note : the records are processed in batches (ids, entrytypes, fields)
+        # to avoid intermediate copies of all records.
+        # The id_labeler is called with all records (e.g., to create unique IDs)
+        batch_size = self.BATCH_SIZE if self.unique_id_field != "" else None
+        records_dict: dict = {}
+        error_cases: list = []
+        records = self.iter_records()
+        while True:
+            records_list = list(itertools.islice(records, batch_size))
+            if not records_list:
+                break
+            self._set_ids(records_list, offset=len(records_dict))
+            for record_dict in records_list:
+                assert (
+                    str(record_dict[Fields.ID]) not in records_dict
+                ), "ID is not unique in records"
+                records_dict[str(record_dict[Fields.ID])] = record_dict
+            self._set_entrytypes(records_list)
+            error_cases.extend(self._set_fields(records_list))
+
+        if error_cases:
+            error_fields = {
+                field
+                for r in error_cases
+                for field in r
+                if " " in field or ";" in field
+            }
+            self.logger.error(
+                f"Record contains invalid keys: {error_fields},\n record: {error_cases}"
+            )
 
         return records_dict
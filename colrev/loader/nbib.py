@@ -2,6 +2,7 @@
 """Convenience functions to load nbib files"""
 from __future__ import annotations
 
+import itertools
 import logging
 import re
 import typing
@@ -32,7 +33,8 @@ class NBIBLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -41,6 +43,7 @@ class NBIBLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -88,7 +91,7 @@ class NBIBLoader(colrev.loader.loader.Loader):
         self._add_tag(tag, line)
         raise NextLine
 
-    def _parse_lines(self, lines: list) -> typing.Iterator[dict]:
+    def _parse_lines(self, lines: typing.Iterable[str]) -> typing.Iterator[dict]:
         for line in lines:
             try:
                 yield self._parse_tag(line)
@@ -96,6 +99,12 @@ class NBIBLoader(colrev.loader.loader.Loader):
             except NextLine:
                 continue
 
+    def iter_records(self) -> typing.Iterator[dict]:
+        """Iterate over the nbib entries (reading the file one line at a time)"""
+        # Note : the last line (empty) completes the last record
+        lines = itertools.chain(self._read_lines(), [""])
+        yield from (r for r in self._parse_lines(lines) if r)
+
     def load_records_list(self) -> list:
         """Loads nbib entries"""
 
@@ -104,8 +113,4 @@ class NBIBLoader(colrev.loader.loader.Loader):
         # Note: skip-tags and unknown-tags can be handled
         # between load_nbib_entries and convert_to_records.
 
-        text = self.filename.read_text(encoding="utf-8")
-        # clean_text?
-        lines = text.split("\n")
-        records_list = list(r for r in self._parse_lines(lines) if r)
-        return records_list
+        return list(self.iter_records())
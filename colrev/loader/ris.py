@@ -32,7 +32,8 @@ class RISLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -41,6 +42,7 @@ class RISLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -88,7 +90,7 @@ class RISLoader(colrev.loader.loader.Loader):
         self._add_tag(tag, line)
         raise NextLine
 
-    def _parse_lines(self, lines: list) -> typing.Iterator[dict]:
+    def _parse_lines(self, lines: typing.Iterable[str]) -> typing.Iterator[dict]:
         for line in lines:
             try:
                 yield self._parse_tag(line)
@@ -96,20 +98,21 @@ class RISLoader(colrev.loader.loader.Loader):
             except NextLine:
                 continue
 
-    def _clean_text(self, text: str) -> str:
+    def _clean_lines(self, lines: typing.Iterable[str]) -> typing.Iterator[str]:
         # Example:
         # Provider: JSTOR http://www.jstor.org
         # Database: JSTOR
         # Content: text/plain; charset="UTF-8"
 
-        lines = []
-        for line in text.split("\n"):
-            if re.match(self.pattern, line):
-                lines.append(line)
-            if line.strip() in ["", "\n"]:
-                lines.append(line)
-        lines.append("")
-        return "\n".join(lines)
+        for line in lines:
+            if self.pattern.match(line) or line.strip() == "":
+                yield line
+        yield ""
+
+    def iter_records(self) -> typing.Iterator[dict]:
+        """Iterate over the ris entries (reading the file one line at a time)"""
+        lines = self._clean_lines(self._read_lines())
+        yield from (r for r in self._parse_lines(lines) if r)
 
     def load_records_list(self, *, content: str = "") -> list:
         """Load ris entries
@@ -121,8 +124,7 @@ class RISLoader(colrev.loader.loader.Loader):
         # its DEFAULT_LIST_TAGS can be extended with list fields that should be joined automatically
 
         if content == "":
-            content = self.filename.read_text(encoding="utf-8")
-            content = self._clean_text(content)
+            return list(self.iter_records())
 
         lines = content.split("\n")
         records_list = list(r for r in self._parse_lines(lines) if r)
@@ -2,6 +2,7 @@
 """Convenience functions to load tabular files (csv, xlsx)"""
 from __future__ import annotations
 
+import io
 import logging
 import typing
 from pathlib import Path
@@ -22,7 +23,8 @@ class TableLoader(colrev.loader.loader.Loader):
     def __init__(
         self,
         *,
-        filename: Path,
+        filename: typing.Optional[Path] = None,
+        file_object: typing.Optional[typing.IO] = None,
         entrytype_setter: typing.Callable,
         field_mapper: typing.Callable,
         id_labeler: typing.Callable,
@@ -31,6 +33,7 @@ class TableLoader(colrev.loader.loader.Loader):
     ):
         super().__init__(
             filename=filename,
+            file_object=file_object,
             id_labeler=id_labeler,
             unique_id_field=unique_id_field,
             entrytype_setter=entrytype_setter,
@@ -48,18 +51,26 @@ class TableLoader(colrev.loader.loader.Loader):
         count = len(data)
         return count
 
+    def _read_table(self) -> pd.DataFrame:
+        # Note : text streams are read as csv, bytes buffers as Excel files
+        if self.file_object is not None:
+            if isinstance(self.file_object, io.TextIOBase):
+                return pd.read_csv(self.file_object)
+            return pd.read_excel(self.file_object, dtype=str)
+
+        assert self.filename is not None
+        if self.filename.name.endswith(".csv"):
+            return pd.read_csv(self.filename)
+        # dtype=str to avoid type casting
+        return pd.read_excel(self.filename, dtype=str)
+
     def load_records_list(self) -> list:
         try:
-            if self.filename.name.endswith(".csv"):
-                data = pd.read_csv(self.filename)
-            elif self.filename.name.endswith((".xls", ".xlsx")):
-                data = pd.read_excel(
-                    self.filename, dtype=str
-                )  # dtype=str to avoid type casting
-
+            data = self._read_table()
         except pd.errors.ParserError as exc:  # pragma: no cover
+            name = self.filename.name if self.filename else "file_object"
             raise colrev_exceptions.ImportException(
-                f"Error: Not a valid file? {self.filename.name}"
+                f"Error: Not a valid file? {name}"
             ) from exc
 
         records_list = data.to_dict("records")
@@ -18,6 +18,7 @@ import colrev.exceptions as colrev_exceptions
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
     import colrev.ops.status
+    import colrev.process.status
 
 
 class Commit:
@@ -118,9 +119,16 @@ class Commit:
             flag = "*"
         return flag
 
-    def _get_commit_report(self, status_operation: colrev.ops.status.Status) -> str:
+    def _get_commit_report(
+        self,
+        status_operation: colrev.ops.status.Status,
+        *,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
+    ) -> str:
         report = self._get_commit_report_header()
-        report += status_operation.get_review_status_report(colors=False)
+        report += status_operation.get_review_status_report(
+            colors=False, status_stats=status_stats
+        )
         report += self._get_commit_report_details()
         return report
 
@@ -158,9 +166,12 @@ class Commit:
             )
 
         self.review_manager.logger.debug("Prepare commit: checks and updates")
+        # Note : the status statistics are computed once (from a single snapshot of
+        # the records) for the status.yaml, the completeness condition and the report
+        status_stats = self.review_manager.get_status_stats()
         if not skip_status_yaml:
             status_yml = self.review_manager.paths.status
-            self.review_manager.update_status_yaml()
+            self.review_manager.update_status_yaml(status_stats=status_stats)
             self.review_manager.dataset.add_changes(status_yml)
 
         committer, email = self.review_manager.get_committer()
@@ -179,12 +190,12 @@ class Commit:
             pass
 
         self.records_committed = self.review_manager.paths.records.is_file()
-        self.completeness_condition = self.review_manager.get_completeness_condition()
+        self.completeness_condition = status_stats.completeness_condition
 
         self.msg = (
             self.msg
             + self._get_version_flag()
-            + self._get_commit_report(status_operation)
+            + self._get_commit_report(status_operation, status_stats=status_stats)
             + self._get_detailed_processing_report()
         )
         git_repo.index.commit(
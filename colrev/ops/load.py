@@ -2,14 +2,14 @@
 """CoLRev load operation: Load records from search sources into references.bib."""
 from __future__ import annotations
 
-import itertools
-import string
+import typing
 from pathlib import Path
 
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils_formatter
 import colrev.process.operation
 import colrev.record.record
+import colrev.record.record_id_allocator
 import colrev.settings
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -24,6 +24,7 @@ class Load(colrev.process.operation.Operation):
     """Load the records"""
 
     type = OperationsType.load
+    IMPORT_BATCH_SIZE = 1000
 
     def __init__(
         self,
@@ -129,31 +130,49 @@ class Load(colrev.process.operation.Operation):
 
         if not record.masterdata_is_curated():
             set_initial_import_provenance(record)
-            record.run_quality_model(self.quality_model)
 
-    def _import_record(self, *, record_dict: dict) -> dict:
-        self.review_manager.logger.debug(f"import_record {record_dict[Fields.ID]}: ")
+    def _import_records(self, *, record_dicts: list) -> typing.Iterator[dict]:
+        # Note : the records are imported in batches of bounded size
+        # (the Record objects of one batch are released before the next batch)
+        for start in range(0, len(record_dicts), self.IMPORT_BATCH_SIZE):
+            yield from self._import_record_batch(
+                record_dicts=record_dicts[start : start + self.IMPORT_BATCH_SIZE]
+            )
 
-        record = colrev.record.record.Record(record_dict)
+    def _import_record_batch(self, *, record_dicts: list) -> list:
+        records = []
+        for record_dict in record_dicts:
+            self.review_manager.logger.debug(
+                f"import_record {record_dict[Fields.ID]}: "
+            )
 
-        # For better readability of the git diff:
-        self.load_formatter.run(record)
+            record = colrev.record.record.Record(record_dict)
 
-        self._import_provenance(record)
+            # For better readability of the git diff:
+            self.load_formatter.run(record)
 
-        if record.data[Fields.STATUS] in [
-            RecordState.md_retrieved,
-            RecordState.md_needs_manual_preparation,
-        ]:
-            record.set_status(RecordState.md_imported)
+            self._import_provenance(record)
+            records.append(record)
 
-        if record.is_retracted():
-            self.review_manager.logger.info(
-                f"{Colors.GREEN}Found paper retract: "
-                f"{record.data['ID']}{Colors.END}"
-            )
+        # Note : the quality model is applied to the batch of records
+        colrev.record.record.Record.run_quality_model_batch(
+            [r for r in records if not r.masterdata_is_curated()], self.quality_model
+        )
 
-        return record.get_data()
+        for record in records:
+            if record.data[Fields.STATUS] in [
+                RecordState.md_retrieved,
+                RecordState.md_needs_manual_preparation,
+            ]:
+                record.set_status(RecordState.md_imported)
+
+            if record.is_retracted():
+                self.review_manager.logger.info(
+                    f"{Colors.GREEN}Found paper retract: "
+                    f"{record.data['ID']}{Colors.END}"
+                )
+
+        return [record.get_data() for record in records]
 
     def _validate_source_records(
         self,
@@ -279,26 +298,17 @@ class Load(colrev.process.operation.Operation):
 
         self.setup_source_for_load(source)
         records = self.review_manager.dataset.load_records_dict()
+        id_allocator = colrev.record.record_id_allocator.IDAllocator(records.keys())
 
         self.review_manager.logger.debug(
             f"Import individual source records {source.search_source.filename}"
         )
-        for source_record in source.search_source.source_records_list:
-            source_record = self._import_record(record_dict=source_record)
+        for source_record in self._import_records(
+            record_dicts=source.search_source.source_records_list
+        ):
 
             # Make sure not to replace existing records
-            order = 0
-            letters = list(string.ascii_lowercase)
-            next_unique_id = source_record[Fields.ID]
-            appends: list = []
-            while next_unique_id in records:
-                if len(appends) == 0:
-                    order += 1
-                    appends = list(itertools.product(letters, repeat=order))
-                next_unique_id = source_record[Fields.ID] + "".join(
-                    list(appends.pop(0))
-                )
-            source_record[Fields.ID] = next_unique_id
+            source_record[Fields.ID] = id_allocator.allocate(source_record[Fields.ID])
 
             records[source_record[Fields.ID]] = source_record
 
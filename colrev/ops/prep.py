@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import inspect
 import logging
-import multiprocessing as mp
 import random
 import shutil
 import typing
@@ -13,7 +12,6 @@ from datetime import datetime
 from datetime import timedelta
 from multiprocessing import Lock
 from multiprocessing import Value
-from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 from requests.exceptions import ConnectionError as requests_ConnectionError
@@ -22,6 +20,7 @@ from requests.exceptions import ReadTimeout
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
+import colrev.ops.prep_engines
 import colrev.process.operation
 import colrev.record.record_prep
 from colrev.constants import Colors
@@ -76,8 +75,11 @@ class Prep(colrev.process.operation.Operation):
     _cpu = 1
     _prep_commit_id = "HEAD"
 
+    ENGINES = ["thread", "process"]
+
     type = OperationsType.prep
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         *,
@@ -85,6 +87,7 @@ class Prep(colrev.process.operation.Operation):
         notify_state_transition_operation: bool,
         polish: bool,
         cpu: int,
+        engine: str = "thread",
     ) -> None:
         super().__init__(
             review_manager=review_manager,
@@ -109,6 +112,13 @@ class Prep(colrev.process.operation.Operation):
 
         self.polish = polish
         self._cpu = cpu
+        if engine not in self.ENGINES:
+            raise colrev_exceptions.ParameterError(
+                parameter="engine", value=engine, options=self.ENGINES
+            )
+        self.engine = engine
+        # Note : worker processes return the temp records (written by the parent)
+        self._temp_record_strs: typing.Optional[typing.List[str]] = None
 
         # Note: for unit testing, we use a simple loop (instead of parallel)
         # to ensure that the IDs of feed records don't change
@@ -130,11 +140,12 @@ class Prep(colrev.process.operation.Operation):
 
     def _print_stats(self) -> None:
         if self.review_manager.verbose_mode:
-            print("Runtime statistics (averages)")
+            print(f"Runtime statistics (averages and totals, engine: {self.engine})")
             averaged_list = [
                 {
                     "script": script,
                     "average": sum(deltalist, timedelta(0)) / len(deltalist),
+                    "total": sum(deltalist, timedelta(0)),
                 }
                 for script, deltalist in self._stats.items()
             ]
@@ -150,10 +161,12 @@ class Prep(colrev.process.operation.Operation):
                 average_time = float(average_time_str)
                 average_time = round(average_time, 2)
                 average_time_str = f"{average_time:.2f}"
+                total_time_str = f"{item['total'].total_seconds():.2f}"  # type: ignore
                 print(
                     f"{item['script']} ".ljust(50, " ")
                     + ":"
                     + f"{average_time_str} s".rjust(10, " ")
+                    + f"{total_time_str} s".rjust(12, " ")
                 )
             print()
 
@@ -413,6 +426,12 @@ class Prep(colrev.process.operation.Operation):
             records_dict={record.data[Fields.ID]: record.get_data()},
             implementation="bib",
         )
+        if self._temp_record_strs is not None:
+            self._temp_record_strs.append(rec_str)
+            return
+        self._append_to_temp(rec_str)
+
+    def _append_to_temp(self, rec_str: str) -> None:
         self.temp_prep_lock.acquire(timeout=120)
         self.current_temp_records.parent.mkdir(exist_ok=True)
         with open(self.current_temp_records, "a", encoding="utf-8") as cur_temp_rec:
@@ -710,6 +729,20 @@ class Prep(colrev.process.operation.Operation):
             )
         return prep_data
 
+    def _setup_prep_package_endpoints(
+        self, prep_round: colrev.settings.PrepRound
+    ) -> None:
+        self.prep_package_endpoints: dict[str, typing.Any] = {}
+        for prep_package_endpoint in prep_round.prep_package_endpoints:
+
+            prep_class = self.package_manager.get_package_endpoint_class(
+                package_type=EndpointType.prep,
+                package_identifier=prep_package_endpoint["endpoint"],
+            )
+            self.prep_package_endpoints[prep_package_endpoint["endpoint"]] = prep_class(
+                prep_operation=self, settings=prep_package_endpoint
+            )
+
     def _setup_prep_round(
         self, *, i: int, prep_round: colrev.settings.PrepRound
     ) -> None:
@@ -729,16 +762,7 @@ class Prep(colrev.process.operation.Operation):
         if len(self.review_manager.settings.prep.prep_rounds) > 1:
             self.review_manager.logger.info(f"Prepare ({prep_round.name})")
 
-        self.prep_package_endpoints: dict[str, typing.Any] = {}
-        for prep_package_endpoint in prep_round.prep_package_endpoints:
-
-            prep_class = self.package_manager.get_package_endpoint_class(
-                package_type=EndpointType.prep,
-                package_identifier=prep_package_endpoint["endpoint"],
-            )
-            self.prep_package_endpoints[prep_package_endpoint["endpoint"]] = prep_class(
-                prep_operation=self, settings=prep_package_endpoint
-            )
+        self._setup_prep_package_endpoints(prep_round)
 
         non_available_endpoints = [
             x["endpoint"].lower()
@@ -856,28 +880,6 @@ class Prep(colrev.process.operation.Operation):
             "See https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/prep.html"
         )
 
-    def _prep_packages_ram_heavy(self, prep_round: colrev.settings.PrepRound) -> bool:
-        prep_pe_names = [r["endpoint"] for r in prep_round.prep_package_endpoints]
-        ram_reavy = "colrev.exclude_languages" in prep_pe_names  # type: ignore
-        self.review_manager.logger.info(
-            "Info: The language detector requires RAM and may take longer"
-        )
-        return ram_reavy
-
-    def _get_prep_pool(
-        self, prep_round: colrev.settings.PrepRound
-    ) -> mp.pool.ThreadPool:
-        if self._prep_packages_ram_heavy(prep_round=prep_round):
-            pool = Pool(mp.cpu_count() // 2)
-        else:
-            # Note : if we use too many CPUS,
-            # a "too many open files" exception is thrown
-            pool = Pool(self._cpu)
-        self.review_manager.logger.info(
-            "Info: ✔ = quality-assured by CoLRev community curators"
-        )
-        return pool
-
     def _create_prep_commit(
         self,
         *,
@@ -934,6 +936,11 @@ class Prep(colrev.process.operation.Operation):
 
                 preparation_data = self._get_prep_data_tasks(prep_round)
                 previous_preparation_data = deepcopy(preparation_data)
+                # Note : the quality model is run in the workers (the local data
+                # it requires, e.g., cached DOI metadata, is retrieved at once)
+                self.quality_model.prefetch(
+                    records=[item["record"] for item in preparation_data]
+                )
 
                 if len(preparation_data) == 0 and not self.temp_records.is_file():
                     self.review_manager.logger.info("No records to prepare.")
@@ -946,11 +953,18 @@ class Prep(colrev.process.operation.Operation):
                     for item in preparation_data:
                         record = self.prepare(item)
                         prepared_records.append(record)
+                elif self.engine == "process":
+                    prepared_records = (
+                        colrev.ops.prep_engines.prepare_with_process_pool(
+                            self,
+                            prep_round=prep_round,
+                            preparation_data=preparation_data,
+                        )
+                    )
                 else:
-                    pool = self._get_prep_pool(prep_round)
-                    prepared_records = pool.map(self.prepare, preparation_data)
-                    pool.close()
-                    pool.join()
+                    prepared_records = colrev.ops.prep_engines.prepare_with_thread_pool(
+                        self, prep_round=prep_round, preparation_data=preparation_data
+                    )
 
                 self._complete_resumed_operation(prepared_records)
 
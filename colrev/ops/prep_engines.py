@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+"""Engines of the prep operation (records are prepared in threads or processes)."""
+from __future__ import annotations
+
+import multiprocessing as mp
+import multiprocessing.synchronize
+import typing
+from multiprocessing.pool import ThreadPool as Pool
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.ops.prep
+    import colrev.settings
+
+# Note : the operation is inherited by the worker processes (fork)
+_PREP_WORKER_OPERATION: typing.Optional[colrev.ops.prep.Prep] = None
+
+
+def _prep_packages_ram_heavy(
+    operation: colrev.ops.prep.Prep, prep_round: colrev.settings.PrepRound
+) -> bool:
+    prep_pe_names = [r["endpoint"] for r in prep_round.prep_package_endpoints]
+    ram_reavy = "colrev.exclude_languages" in prep_pe_names  # type: ignore
+    operation.review_manager.logger.info(
+        "Info: The language detector requires RAM and may take longer"
+    )
+    return ram_reavy
+
+
+def _get_prep_pool(
+    operation: colrev.ops.prep.Prep, prep_round: colrev.settings.PrepRound
+) -> mp.pool.ThreadPool:
+    # pylint: disable=protected-access
+    if _prep_packages_ram_heavy(operation, prep_round):
+        pool = Pool(mp.cpu_count() // 2)
+    else:
+        # Note : if we use too many CPUS,
+        # a "too many open files" exception is thrown
+        pool = Pool(operation._cpu)
+    operation.review_manager.logger.info(
+        "Info: ✔ = quality-assured by CoLRev community curators"
+    )
+    return pool
+
+
+def prepare_with_thread_pool(
+    operation: colrev.ops.prep.Prep,
+    *,
+    prep_round: colrev.settings.PrepRound,
+    preparation_data: list,
+) -> list:
+    """Prepare the records in threads"""
+    pool = _get_prep_pool(operation, prep_round)
+    prepared_records = pool.map(operation.prepare, preparation_data)
+    pool.close()
+    pool.join()
+    return prepared_records
+
+
+def prepare_with_process_pool(
+    operation: colrev.ops.prep.Prep,
+    *,
+    prep_round: colrev.settings.PrepRound,
+    preparation_data: list,
+) -> list:
+    """Prepare the records in worker processes"""
+    # pylint: disable=global-statement
+    # pylint: disable=protected-access
+    global _PREP_WORKER_OPERATION
+
+    if "fork" not in mp.get_all_start_methods():  # pragma: no cover
+        operation.review_manager.logger.info(
+            "Info: the process engine is not available on this platform "
+            "(using the thread engine)"
+        )
+        return prepare_with_thread_pool(
+            operation, prep_round=prep_round, preparation_data=preparation_data
+        )
+
+    nr_processes = operation._cpu or mp.cpu_count()
+    if _prep_packages_ram_heavy(operation, prep_round):
+        # Note : each process loads its own language detector
+        nr_processes = min(nr_processes, max(mp.cpu_count() // 2, 1))
+    operation.review_manager.logger.info(
+        "Info: ✔ = quality-assured by CoLRev community curators"
+    )
+
+    _PREP_WORKER_OPERATION = operation
+    prepared_records = []
+    try:
+        with mp.get_context("fork").Pool(
+            nr_processes,
+            initializer=_init_prep_worker_process,
+            initargs=(prep_round,),
+        ) as pool:
+            for record_dict, stats, temp_record_strs in pool.imap(
+                _prepare_in_worker_process,
+                preparation_data,
+                chunksize=max(1, len(preparation_data) // (nr_processes * 8)),
+            ):
+                for endpoint, durations in stats.items():
+                    operation._stats.setdefault(endpoint, []).extend(durations)
+                for rec_str in temp_record_strs:
+                    operation._append_to_temp(rec_str)
+                prepared_records.append(record_dict)
+    finally:
+        _PREP_WORKER_OPERATION = None
+    return prepared_records
+
+
+def _share_locks(parent_object: object, worker_object: object, *, depth: int) -> None:
+    """Replace the locks of an object (and its attributes) by the parent's locks"""
+    for key, value in vars(worker_object).items():
+        parent_value = getattr(parent_object, key, None)
+        if parent_value is None or parent_value is value:
+            continue
+        if isinstance(value, multiprocessing.synchronize.Lock):
+            setattr(worker_object, key, parent_value)
+        elif depth > 0 and hasattr(value, "__dict__"):
+            _share_locks(parent_value, value, depth=depth - 1)
+
+
+def _init_prep_worker_process(prep_round: colrev.settings.PrepRound) -> None:
+    """Initialize the prep endpoints (once per process)"""
+    # pylint: disable=protected-access
+    assert _PREP_WORKER_OPERATION is not None
+    operation = _PREP_WORKER_OPERATION
+    # Note : the quality model is inherited from the parent (fork),
+    # including the data prefetched for the records of the round.
+    # Endpoints are not shared with the parent (e.g., sessions, connections)
+    parent_endpoints = operation.prep_package_endpoints
+    operation._setup_prep_package_endpoints(prep_round)
+    # Note : the locks of the parent's endpoints (e.g., the crossref_lock of the
+    # Crossref source) were created before the fork and are shared by the workers.
+    # They protect the feeds, which the endpoints reload, update and save.
+    for endpoint_name, endpoint in operation.prep_package_endpoints.items():
+        if endpoint_name in parent_endpoints:
+            _share_locks(parent_endpoints[endpoint_name], endpoint, depth=1)
+
+
+def _prepare_in_worker_process(item: dict) -> tuple:
+    """Prepare a record in a worker process.
+    Returns the record, the runtime statistics, and the records to save to temp"""
+    # pylint: disable=protected-access
+    assert _PREP_WORKER_OPERATION is not None
+    operation = _PREP_WORKER_OPERATION
+    operation._stats = {}
+    operation._temp_record_strs = []
+    record_dict = operation.prepare(item)
+    return record_dict, operation._stats, operation._temp_record_strs
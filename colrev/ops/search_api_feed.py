@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import time
+import typing
 from copy import deepcopy
+from pathlib import Path
 from random import randint
 
 import colrev.exceptions as colrev_exceptions
@@ -31,6 +33,13 @@ class SearchAPIFeed:
     _nr_added: int = 0
     _nr_changed: int = 0
 
+    # Note : feed records can be looked up by these fields (hash-indexed).
+    # The values are normalized (e.g., file paths)
+    INDEXED_FIELDS: typing.Dict[str, typing.Callable] = {
+        Fields.FILE: Path,
+        "md_string": str,
+    }
+
     def __init__(
         self,
         *,
@@ -65,12 +74,67 @@ class SearchAPIFeed:
 
         self.origin_prefix = self.source.get_origin_prefix()
 
+        # Note : the indexes are built when they are first needed
+        self._feed_indexes: typing.Dict[str, typing.Dict[typing.Any, dict]] = {}
+        self._origin_index: typing.Optional[typing.Dict[str, str]] = None
+        self._origin_index_size = 0
+
         self._load_feed()
 
         self.prep_mode = prep_mode
         if not prep_mode:
             self.records = self.review_manager.dataset.load_records_dict()
 
+    @property
+    def records(self) -> dict:
+        """The main records (data/records.bib)"""
+        return self._records
+
+    @records.setter
+    def records(self, records: dict) -> None:
+        self._records = records
+        self._origin_index = None
+
+    def _get_index_value(self, key: str, record_dict: dict) -> typing.Any:
+        if key not in record_dict:
+            return None
+        return self.INDEXED_FIELDS[key](record_dict[key])
+
+    def _add_to_feed_index(self, key: str, feed_record_dict: dict) -> None:
+        value = self._get_index_value(key, feed_record_dict)
+        if value is not None:
+            self._feed_indexes[key].setdefault(value, {})[
+                feed_record_dict[Fields.ID]
+            ] = None
+
+    def _add_to_feed_indexes(self, feed_record_dict: dict) -> None:
+        for key in self._feed_indexes:
+            self._add_to_feed_index(key, feed_record_dict)
+
+    def _remove_from_feed_indexes(self, feed_record_dict: dict) -> None:
+        for key, index in self._feed_indexes.items():
+            value = self._get_index_value(key, feed_record_dict)
+            if value in index:
+                index[value].pop(feed_record_dict[Fields.ID], None)
+
+    def get_feed_records(self, *, key: str, value: typing.Any) -> list:
+        """Get the feed records with the value in the key field
+        (the key must be in INDEXED_FIELDS)"""
+
+        if key not in self._feed_indexes:
+            self._feed_indexes[key] = {}
+            for feed_record_dict in self.feed_records.values():
+                self._add_to_feed_index(key, feed_record_dict)
+
+        value = self.INDEXED_FIELDS[key](value)
+        # Note : feed records may have been modified directly (without updating the index)
+        return [
+            self.feed_records[feed_id]
+            for feed_id in self._feed_indexes[key].get(value, {})
+            if feed_id in self.feed_records
+            and self._get_index_value(key, self.feed_records[feed_id]) == value
+        ]
+
     def _load_feed(self) -> None:
         if not self.feed_file.is_file():
             self._available_ids = {}
@@ -158,7 +222,10 @@ class SearchAPIFeed:
                     if key in self.feed_records[frid]:
                         feed_record_dict[key] = self.feed_records[frid][key]
 
+        if frid in self.feed_records:
+            self._remove_from_feed_indexes(self.feed_records[frid])
         self.feed_records[frid] = feed_record_dict
+        self._add_to_feed_indexes(feed_record_dict)
         if added_new:
             if not self.prep_mode:
                 self.logger.info(f"  add record: {record.data[self.source_identifier]}")
@@ -317,19 +384,37 @@ class SearchAPIFeed:
             return True
         return False
 
+    def _build_origin_index(self) -> typing.Dict[str, str]:
+        origin_index: typing.Dict[str, str] = {}
+        for record_id, record_dict in self.records.items():
+            for origin in record_dict[Fields.ORIGIN]:
+                origin_index.setdefault(origin, record_id)
+        self._origin_index = origin_index
+        self._origin_index_size = len(self.records)
+        return origin_index
+
     def _get_main_record(self, colrev_origin: str) -> colrev.record.record.Record:
 
-        main_record_dict: dict = {}
-        for record_dict in self.records.values():
-            if colrev_origin in record_dict[Fields.ORIGIN]:
-                main_record_dict = record_dict
-                break
+        # Note : the index is invalidated when the records are set
+        # (or when records are added/removed). Origins that are changed
+        # in the records dict (e.g., merged) require setting the records.
+        origin_index = self._origin_index
+        if origin_index is None or self._origin_index_size != len(self.records):
+            origin_index = self._build_origin_index()
+
+        record_id = origin_index.get(colrev_origin)
+        if record_id is not None and (
+            record_id not in self.records
+            or colrev_origin not in self.records[record_id][Fields.ORIGIN]
+        ):
+            # The record was replaced or its origins changed (the index is outdated)
+            record_id = self._build_origin_index().get(colrev_origin)
 
-        if main_record_dict == {}:
+        if record_id is None:
             raise colrev_exceptions.RecordNotFoundException(
                 f"Could not find/update {colrev_origin}"
             )
-        return colrev.record.record.Record(main_record_dict)
+        return colrev.record.record.Record(self.records[record_id])
 
     def _update_record(
         self,
@@ -474,5 +559,8 @@ class SearchAPIFeed:
 
         if not self.prep_mode:
             self.review_manager.dataset.save_records_dict(self.records)
+        # Note : feed records may be modified directly between saves
+        # (e.g., temporary fields), i.e., the indexes are rebuilt when needed
+        self._feed_indexes = {}
         self._nr_added = 0
         self._nr_changed = 0
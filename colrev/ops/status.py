@@ -2,89 +2,176 @@
 """CoLRev status operation: Display the project status."""
 from __future__ import annotations
 
-import io
+import csv
+import json
 import typing
+from pathlib import Path
 
+import git
+import pandas as pd
 import yaml
 
 import colrev.env.utils
+import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
+import colrev.process.status
 from colrev.constants import Colors
 from colrev.constants import OperationsType
 
+# Note : the C implementation (libyaml) is considerably faster
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Status(colrev.process.operation.Operation):
     """Determine the status of the project"""
 
     type = OperationsType.check
 
+    # Note : the cache is stored in the git directory (never committed)
+    ANALYTICS_CACHE_FILE = Path("colrev/status_analytics_cache.jsonl")
+    ANALYTICS_FIELDS = [
+        "atomic_steps",
+        "completed_atomic_steps",
+        "commit_id",
+        "commit_message",
+        "commit_author",
+        "committed_date",
+        "search",
+        "included",
+    ]
+
     def __init__(self, *, review_manager: colrev.review_manager.ReviewManager) -> None:
         super().__init__(
             review_manager=review_manager,
             operations_type=self.type,
         )
 
+    def _get_analytics_cache_path(self) -> Path:
+        git_dir = Path(self.review_manager.dataset.get_repo().git_dir)
+        return git_dir / self.ANALYTICS_CACHE_FILE
+
+    def _load_analytics_cache(self) -> dict:
+        analytics_cache = {}
+        try:
+            with open(self._get_analytics_cache_path(), encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # e.g., incomplete line of an interrupted write
+                    analytics_cache[entry["commit_id"]] = entry
+        except FileNotFoundError:
+            pass
+        return analytics_cache
+
+    def _get_analytics_entry(self, commit: git.Commit) -> dict:
+        filecontents = (
+            commit.tree / str(self.review_manager.paths.STATUS_FILE)
+        ).data_stream.read()
+
+        # TBD: we could simply include the whole STATUS_FILE
+        # (to create a general-purpose status analyzer)
+        # -> flatten nested structures (e.g., overall/currently)
+        # -> integrate with get_status (current data) -
+        # and get_prior? (levels: aggregated_statistics vs. record-level?)
+
+        data_loaded = yaml.load(filecontents.decode("utf-8"), Loader=_YAMLLoader)
+        return {
+            "atomic_steps": data_loaded["atomic_steps"],
+            "completed_atomic_steps": data_loaded["completed_atomic_steps"],
+            "commit_id": commit.hexsha,
+            "commit_message": commit.message.split("\n")[0],
+            "commit_author": commit.author.name,
+            "committed_date": commit.committed_date,
+            "search": data_loaded["overall"]["md_retrieved"],
+            "included": data_loaded["overall"]["rev_included"],
+        }
+
     def get_analytics(self) -> dict:
-        """Get status analytics"""
+        """Get status analytics
 
-        analytics_dict = {}
-        git_repo = self.review_manager.dataset.get_repo()
+        The analytics of each commit are cached (append-only, in the git directory)
+        so that only the status files of new commits are read."""
 
-        revlist = list(
-            (
-                commit.hexsha,
-                commit.message,
-                commit.author.name,
-                commit.committed_date,
-                (
-                    commit.tree / str(self.review_manager.paths.STATUS_FILE)
-                ).data_stream.read(),
-            )
-            for commit in git_repo.iter_commits(
-                paths=str(self.review_manager.paths.STATUS_FILE)
-            )
-        )
-        for ind, (
-            commit_id,
-            commit_msg,
-            commit_author,
-            committed_date,
-            filecontents,
-        ) in enumerate(revlist):
-            var_t = io.StringIO(filecontents.decode("utf-8"))
-
-            # TBD: we could simply include the whole STATUS_FILE
-            # (to create a general-purpose status analyzer)
-            # -> flatten nested structures (e.g., overall/currently)
-            # -> integrate with get_status (current data) -
-            # and get_prior? (levels: aggregated_statistics vs. record-level?)
-
-            data_loaded = yaml.safe_load(var_t)
-            analytics_dict[len(revlist) - ind] = {
-                "atomic_steps": data_loaded["atomic_steps"],
-                "completed_atomic_steps": data_loaded["completed_atomic_steps"],
-                "commit_id": commit_id,
-                "commit_message": commit_msg.split("\n")[0],
-                "commit_author": commit_author,
-                "committed_date": committed_date,
-                "search": data_loaded["overall"]["md_retrieved"],
-                "included": data_loaded["overall"]["rev_included"],
-            }
-
-        # keys = list(analytics_dict.values())[0].keys()
-        # with open("analytics.csv", "w", newline="", encoding="utf8") as output_file:
-        #     dict_writer = csv.DictWriter(output_file, keys)
-        #     dict_writer.writeheader()
-        #     dict_writer.writerows(reversed(analytics_dict.values()))
+        git_repo = self.review_manager.dataset.get_repo()
+        commit_ids = git_repo.git.rev_list(
+            "HEAD", "--", str(self.review_manager.paths.STATUS_FILE)
+        ).split()
+
+        analytics_cache = self._load_analytics_cache()
+        new_entries = [
+            self._get_analytics_entry(git_repo.commit(commit_id))
+            for commit_id in commit_ids
+            if commit_id not in analytics_cache
+        ]
+        if new_entries:
+            cache_path = self._get_analytics_cache_path()
+            try:
+                cache_path.parent.mkdir(exist_ok=True, parents=True)
+                with open(cache_path, "a", encoding="utf-8") as file:
+                    file.write(
+                        "".join(json.dumps(entry) + "\n" for entry in new_entries)
+                    )
+            except OSError:  # pragma: no cover
+                pass  # e.g., read-only file system
+            analytics_cache.update({entry["commit_id"]: entry for entry in new_entries})
 
+        analytics_dict = {}
+        for ind, commit_id in enumerate(commit_ids):
+            analytics_dict[len(commit_ids) - ind] = dict(analytics_cache[commit_id])
         return analytics_dict
 
+    def export_analytics(self, path: Path) -> None:
+        """Export the status analytics timeline (csv or parquet)"""
+
+        timeline = list(reversed(self.get_analytics().values()))
+        if path.suffix == ".parquet":
+            try:
+                pd.DataFrame(timeline).to_parquet(path, index=False)
+            except ImportError as exc:
+                raise colrev_exceptions.MissingDependencyError(
+                    "Exporting parquet files requires pyarrow or fastparquet"
+                ) from exc
+            return
+
+        with open(path, "w", newline="", encoding="utf8") as output_file:
+            dict_writer = csv.DictWriter(output_file, self.ANALYTICS_FIELDS)
+            dict_writer.writeheader()
+            dict_writer.writerows(timeline)
+
+    def verify_status_aggregate(self) -> list:
+        """Verify the (incrementally maintained) status aggregate
+        against a full recomputation based on the records
+
+        Returns the differences (the status aggregate is recomputed if there are any)
+        """
+
+        dataset = self.review_manager.dataset
+        expected = colrev.process.status.StatusAggregate.from_records(
+            dataset.load_records_dict()
+        )
+        differences = dataset.get_status_aggregate().get_differences(expected)
+        if differences:
+            self.review_manager.logger.error(
+                "Status aggregate differs from the records:\n  "
+                + "\n  ".join(differences)
+            )
+            dataset.get_status_aggregate(recompute=True)
+        else:
+            self.review_manager.logger.info("Status aggregate verified")
+        return differences
+
     def get_review_status_report(
-        self, *, records: typing.Optional[dict] = None, colors: bool = True
+        self,
+        *,
+        records: typing.Optional[dict] = None,
+        colors: bool = True,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
     ) -> str:
         """Get the review status report"""
 
-        status_stats = self.review_manager.get_status_stats(records=records)
+        if status_stats is None:
+            status_stats = self.review_manager.get_status_stats(records=records)
 
         template = colrev.env.utils.get_template(template_path="ops/commit/status.txt")
 
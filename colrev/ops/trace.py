@@ -78,15 +78,11 @@ class Trace(colrev.process.operation.Operation):
         self.review_manager.logger.info(f"Trace record by ID: {record_id}")
         # Ensure the path uses forward slashes, which is compatible with Git's path handling
 
-        revlist = self.review_manager.dataset.get_repo().iter_commits(
-            paths=self.review_manager.paths.RECORDS_FILE_GIT
-        )
+        record_history = self.review_manager.dataset.get_record_history()
 
         prev_record: dict = {}
-        for commit in reversed(list(revlist)):
-            filecontents = (
-                commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-            ).data_stream.read()
+        prev_record_hash = None
+        for commit in reversed(record_history.get_commits()):
             commit_message_first_line = str(commit.message).partition("\n")[0]
 
             if self.review_manager.verbose_mode:
@@ -100,16 +96,19 @@ class Trace(colrev.process.operation.Operation):
                     + f" {commit_message_first_line} (by {commit.author.name})"
                 )
 
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8"),
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
-
-            if record_id not in records_dict:
+            record_hash = record_history.get_record_hash(commit, record_id)
+            if record_hash is None:
                 if self.review_manager.verbose_mode:
                     print(f"record {record_id} not in commit.")
                 continue
+            # Note : only the versions of the record that changed are parsed
+            if record_hash == prev_record_hash:
+                continue
+            prev_record_hash = record_hash
+
+            records_dict = record_history.load_records(commit, record_ids=[record_id])
+            if record_id not in records_dict:  # pragma: no cover
+                continue
 
             prev_record = self._print_record_changes(
                 commit=commit,
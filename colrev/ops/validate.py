@@ -32,23 +32,12 @@ class Validate(colrev.process.operation.Operation):
 
     def _load_prior_records_dict(self, *, commit_sha: str) -> dict:
         """If commit is "": return the last commited version of records"""
-        git_repo = self.review_manager.dataset.get_repo()
-        # Ensure the path uses forward slashes, which is compatible with Git's path handling
-        records_file_path = self.review_manager.paths.RECORDS_FILE_GIT
-        revlist = (
-            (
-                commit_i.hexsha,
-                (commit_i.tree / records_file_path).data_stream.read(),
-            )
-            for commit_i in git_repo.iter_commits(
-                paths=str(self.review_manager.paths.RECORDS_FILE)
-            )
-        )
+        record_history = self.review_manager.dataset.get_record_history()
 
         found_target_commit = False
-        for commit_id, filecontents in list(revlist):
+        for commit in record_history.get_commits():
             if commit_sha:
-                if commit_id == commit_sha:
+                if commit.hexsha == commit_sha:
                     found_target_commit = True
                     continue
                 if not found_target_commit:
@@ -57,13 +46,7 @@ class Validate(colrev.process.operation.Operation):
                 # To skip the same commit
                 found_target_commit = True
                 continue
-            prior_records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8"),
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
-
-            return prior_records_dict
+            return record_history.load_records(commit)
         return {}
 
     def _get_prep_prescreen_exclusions(self, records: dict) -> list:
@@ -274,37 +257,29 @@ class Validate(colrev.process.operation.Operation):
     def _get_changed_records(self, *, target_commit: str) -> typing.List[dict]:
         """Get the records that changed in a selected commit"""
 
-        dataset = self.review_manager.dataset
-        git_repo = dataset.get_repo()
-        revlist = (
-            (
-                commit.hexsha,
-                (
-                    commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-                ).data_stream.read(),
-            )
-            for commit in git_repo.iter_commits(
-                paths=str(self.review_manager.paths.RECORDS_FILE)
-            )
-        )
-        found = False
+        record_history = self.review_manager.dataset.get_record_history()
+        commits = record_history.get_commits()
         records: typing.Dict[str, typing.Any] = {}
         prior_records = {}
-        for commit, filecontents in list(revlist):
-            if found:  # load the records_file_relative in the following commit
-                prior_records = colrev.loader.load_utils.loads(
-                    load_string=filecontents.decode("utf-8"),
-                    implementation="bib",
-                    logger=self.review_manager.logger,
-                )
-                break
-            if commit == target_commit:
-                records = colrev.loader.load_utils.loads(
-                    load_string=filecontents.decode("utf-8"),
-                    implementation="bib",
-                    logger=self.review_manager.logger,
+        for ind, commit in enumerate(commits):
+            if commit.hexsha != target_commit:
+                continue
+            records = record_history.load_records(commit)
+            if ind + 1 < len(commits):
+                # load the records_file_relative in the following commit
+                # Note : records that did not change are not parsed
+                record_hashes = record_history.get_record_hashes(commit)
+                prior_records = record_history.load_records(
+                    commits[ind + 1],
+                    record_ids=[
+                        record_id
+                        for record_id, record_hash in record_history.get_record_hashes(
+                            commits[ind + 1]
+                        ).items()
+                        if record_hashes.get(record_id) != record_hash
+                    ],
                 )
-                found = True
+            break
 
         # determine which records have been changed (prepared or merged)
         # in the target_commit
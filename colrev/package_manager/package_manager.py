@@ -3,19 +3,32 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import typing
 from pathlib import Path
 from typing import Any
 
 import colrev.exceptions as colrev_exceptions
-import colrev.package_manager.doc_registry_manager
-import colrev.package_manager.package
+from colrev.__version__ import __version__
 from colrev.constants import EndpointType
+from colrev.constants import Filepaths
+
+# pylint: disable=import-outside-toplevel
+
+# Note : the package modules (and their dependencies) are only imported when needed
+# (the PackageManager is used by the CLI at startup)
+
+# Note : the registry is validated once and shared by the PackageManager instances
+_ENDPOINT_REGISTRY: dict = {}
 
 
 class PackageManager:
     """The PackageManager provides functionality for package lookup and discovery"""
 
+    # Note : the endpoint registry resolves package identifiers to endpoints
+    # (without loading the pyproject.toml files of the packages)
+    ENDPOINT_REGISTRY_VERSION = 1
+
     def _get_package_dir(self, package_identifier: str) -> Path:
         if package_identifier.startswith("colrev."):
             colrev_package_module = importlib.import_module("colrev.packages")
@@ -42,12 +55,22 @@ class PackageManager:
             "Could not find the colrev package"
         )
 
-    def load_type_identifier_endpoint_dict(self) -> dict:
-        """Load the type_identifier_endpoint_dict from the packages"""
+    def _get_package_mtimes(self) -> dict:
+        package_mtimes = {}
+        for package_dir in self._get_packages_dirs():
+            config_path = package_dir / "pyproject.toml"
+            package_mtimes[package_dir.name] = (
+                config_path.stat().st_mtime_ns if config_path.is_file() else None
+            )
+        return package_mtimes
+
+    def _build_endpoint_registry(self, package_mtimes: dict) -> dict:
+        import colrev.package_manager.package
 
         type_identifier_endpoint_dict: typing.Dict[
             EndpointType, typing.Dict[str, Any]
         ] = {endpoint_type: {} for endpoint_type in EndpointType}
+        package_endpoints = {}
 
         for package_dir in self._get_packages_dirs():
             try:
@@ -55,11 +78,66 @@ class PackageManager:
                 package.add_to_type_identifier_endpoint_dict(
                     type_identifier_endpoint_dict
                 )
+                package_endpoints[f"colrev.{package_dir.name}"] = {
+                    endpoint_type.value: package.get_endpoint(endpoint_type)
+                    for endpoint_type in EndpointType
+                    if package.has_endpoint(endpoint_type)
+                }
             except colrev_exceptions.MissingDependencyError as exc:
                 print(exc)
                 continue
 
-        return type_identifier_endpoint_dict
+        return {
+            "version": self.ENDPOINT_REGISTRY_VERSION,
+            "colrev_version": __version__,
+            "package_mtimes": package_mtimes,
+            "type_identifier_endpoint_dict": {
+                endpoint_type.value: identifier_endpoint_dict
+                for endpoint_type, identifier_endpoint_dict in (
+                    type_identifier_endpoint_dict.items()
+                )
+            },
+            "package_endpoints": package_endpoints,
+        }
+
+    def _get_endpoint_registry(self) -> dict:
+        """Get the endpoint registry, which is stored in the local environment
+        and rebuilt when packages are added, removed, or changed"""
+
+        if _ENDPOINT_REGISTRY:
+            return _ENDPOINT_REGISTRY
+
+        registry_path = Filepaths.PACKAGE_ENDPOINT_REGISTRY_FILE
+        package_mtimes = self._get_package_mtimes()
+        try:
+            registry = json.loads(registry_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            registry = {}
+        if (
+            registry.get("version") != self.ENDPOINT_REGISTRY_VERSION
+            or registry.get("colrev_version") != __version__
+            or registry.get("package_mtimes") != package_mtimes
+        ):
+            registry = self._build_endpoint_registry(package_mtimes)
+            try:
+                registry_path.parent.mkdir(exist_ok=True, parents=True)
+                registry_path.write_text(json.dumps(registry), encoding="utf-8")
+            except OSError:  # pragma: no cover
+                pass  # e.g., read-only file system
+
+        _ENDPOINT_REGISTRY.update(registry)
+        return _ENDPOINT_REGISTRY
+
+    def load_type_identifier_endpoint_dict(self) -> dict:
+        """Load the type_identifier_endpoint_dict from the packages"""
+
+        registry = self._get_endpoint_registry()
+        return {
+            endpoint_type: dict(
+                registry["type_identifier_endpoint_dict"][endpoint_type.value]
+            )
+            for endpoint_type in EndpointType
+        }
 
     def _load_python_packages(self) -> list:
         # import colrev.env.utils
@@ -71,6 +149,8 @@ class PackageManager:
         #         "Package index not available (colrev/packages/packages.json)"
         #     )
         # package_list = json.loads(filedata.decode("utf-8"))
+        import colrev.package_manager.package
+
         packages = []
         for package_dir in self._get_packages_dirs():
             try:
@@ -86,6 +166,8 @@ class PackageManager:
         based on the packages in packages/packages.json
         and the endpoints.json files in the top directory of each package."""
 
+        import colrev.package_manager.doc_registry_manager
+
         doc_reg_manager = (
             colrev.package_manager.doc_registry_manager.DocRegistryManager(
                 package_manager=self, packages=self._load_python_packages()
@@ -93,6 +175,10 @@ class PackageManager:
         )
         doc_reg_manager.update()
 
+        _ENDPOINT_REGISTRY.clear()
+        Filepaths.PACKAGE_ENDPOINT_REGISTRY_FILE.unlink(missing_ok=True)
+        self._get_endpoint_registry()
+
     def discover_packages(self, *, package_type: EndpointType) -> typing.Dict:
         """Discover packages (for cli usage)"""
 
@@ -114,6 +200,22 @@ class PackageManager:
                 f"{package_identifier} is not a CoLRev package"
             )
 
-        module_path = self._get_package_dir(package_identifier)
-        package = colrev.package_manager.package.Package(module_path)
-        return package.get_endpoint_class(package_type)
+        package_endpoints = self._get_endpoint_registry()["package_endpoints"]
+        if package_identifier not in package_endpoints:
+            raise colrev_exceptions.MissingDependencyError(
+                f"Package {self._get_package_dir(package_identifier)} "
+                "not a CoLRev package"
+            )
+        if package_type.value not in package_endpoints[package_identifier]:
+            raise colrev_exceptions.MissingDependencyError(
+                f"Package {package_identifier} does not have a {package_type} endpoint"
+            )
+
+        # Note : the endpoint module is only imported when the endpoint is used
+        import colrev.package_manager.package
+
+        return colrev.package_manager.package.load_endpoint_class(
+            endpoint_path=package_endpoints[package_identifier][package_type.value],
+            endpoint_type=package_type,
+            identifier=package_identifier,
+        )
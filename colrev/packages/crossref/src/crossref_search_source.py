@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import typing
 import urllib
@@ -22,6 +23,7 @@ from dacite import from_dict
 from dataclasses_jsonschema import JsonSchemaMixin
 from rapidfuzz import fuzz
 
+import colrev.env.doi_metadata_cache
 import colrev.env.environment_manager
 import colrev.env.language_service
 import colrev.exceptions as colrev_exceptions
@@ -47,6 +49,8 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-lines
 
+_DOI_METADATA_CACHE = colrev.env.doi_metadata_cache.DOIMetadataCache()
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.SearchSourceInterface)
 @dataclass
@@ -201,6 +205,52 @@ class CrossrefSearchSource(JsonSchemaMixin):
                 msg="Record not found in crossref (based on doi)"
             ) from exc
 
+    @classmethod
+    def query_doi_cached(
+        cls, *, doi: str, etiquette: Etiquette, offline: bool = False
+    ) -> colrev.record.record_prep.PrepRecord:
+        """Get records from Crossref based on a doi query (using the local cache)
+
+        In offline mode (or if the COLREV_OFFLINE environment variable is "true"),
+        only cached records are returned."""
+
+        cached_record_dict = _DOI_METADATA_CACHE.get(doi)
+        if cached_record_dict == {}:
+            raise colrev_exceptions.RecordNotFoundInPrepSourceException(
+                msg="Record not found in crossref (based on doi, cached)"
+            )
+        if cached_record_dict is not None:
+            return colrev.record.record_prep.PrepRecord(cached_record_dict)
+
+        if offline or "true" == os.getenv("COLREV_OFFLINE"):
+            raise colrev_exceptions.RecordNotFoundInPrepSourceException(
+                msg="Record not in the local DOI metadata cache (offline mode)"
+            )
+
+        try:
+            retrieved_record = cls.query_doi(doi=doi, etiquette=etiquette)
+        except colrev_exceptions.RecordNotFoundInPrepSourceException as exc:
+            # Note : failed requests (e.g., timeouts) are not cached
+            if exc.__cause__ is None:
+                _DOI_METADATA_CACHE.set_not_found(doi)
+            raise
+        if isinstance(retrieved_record, colrev.record.record.Record):
+            _DOI_METADATA_CACHE.set(doi, retrieved_record.get_data())
+        return retrieved_record
+
+    @classmethod
+    def get_cached_doi_records(
+        cls, *, dois: list
+    ) -> typing.Dict[str, colrev.record.record_prep.PrepRecord]:
+        """Get the records of DOIs that are in the local cache (keyed by DOI)
+        (DOIs that were not found are not included)"""
+
+        return {
+            doi: colrev.record.record_prep.PrepRecord(record_dict)
+            for doi, record_dict in _DOI_METADATA_CACHE.get_many(dois).items()
+            if record_dict
+        }
+
     def _query_journal(self, *, rerun: bool) -> typing.Iterator[dict]:
         """Get records of a selected journal from Crossref"""
 
@@ -448,7 +498,7 @@ class CrossrefSearchSource(JsonSchemaMixin):
     ) -> colrev.record.record.Record:
         try:
             try:
-                retrieved_record = self.query_doi(
+                retrieved_record = self.query_doi_cached(
                     doi=record.data[Fields.DOI], etiquette=self.etiquette
                 )
             except (colrev_exceptions.RecordNotFoundInPrepSourceException, KeyError):
@@ -537,7 +587,7 @@ class CrossrefSearchSource(JsonSchemaMixin):
         self, record: colrev.record.record.Record
     ) -> colrev.record.record.Record:
         try:
-            retrieved_record = self.query_doi(
+            retrieved_record = self.query_doi_cached(
                 doi=record.data[Fields.DOI], etiquette=self.etiquette
             )
             if not colrev.record.record_similarity.matches(record, retrieved_record):
@@ -439,7 +439,7 @@ class FilesSearchSource(JsonSchemaMixin):
         *,
         file_path: Path,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: set,
         local_index: colrev.env.local_index.LocalIndex,
     ) -> dict:
         if file_path.suffix == ".pdf":
@@ -463,7 +463,7 @@ class FilesSearchSource(JsonSchemaMixin):
         *,
         file_path: Path,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: set,
         local_index: colrev.env.local_index.LocalIndex,
     ) -> dict:
         new_record: dict = {}
@@ -479,11 +479,7 @@ class FilesSearchSource(JsonSchemaMixin):
                     # Otherwise: skip linked PDFs
                     return new_record
 
-            if file_path in [
-                Path(r[Fields.FILE])
-                for r in files_dir_feed.feed_records.values()
-                if Fields.FILE in r
-            ]:
+            if files_dir_feed.get_feed_records(key=Fields.FILE, value=file_path):
                 return new_record
         # otherwise: reindex all
 
@@ -519,9 +515,10 @@ class FilesSearchSource(JsonSchemaMixin):
         # Note: identical md_string as a heuristic for duplicates
         potential_duplicates = [
             r
-            for r in files_dir_feed.feed_records.values()
-            if r["md_string"] == new_record["md_string"]
-            and not r[Fields.FILE] == new_record[Fields.FILE]
+            for r in files_dir_feed.get_feed_records(
+                key="md_string", value=new_record["md_string"]
+            )
+            if not r[Fields.FILE] == new_record[Fields.FILE]
         ]
         if potential_duplicates:
             self.review_manager.logger.warning(
@@ -537,7 +534,7 @@ class FilesSearchSource(JsonSchemaMixin):
         *,
         file_path: Path,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: set,
         local_index: colrev.env.local_index.LocalIndex,
     ) -> dict:
         record_dict = {Fields.ENTRYTYPE: "online", Fields.FILE: file_path}
@@ -567,7 +564,7 @@ class FilesSearchSource(JsonSchemaMixin):
         *,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
         local_index: colrev.env.local_index.LocalIndex,
-        linked_file_paths: list,
+        linked_file_paths: set,
     ) -> None:
         file_batches = self._get_file_batches()
         if not file_batches:
@@ -641,9 +638,9 @@ class FilesSearchSource(JsonSchemaMixin):
             update_only=(not rerun),
         )
 
-        linked_file_paths = [
+        linked_file_paths = {
             Path(r[Fields.FILE]) for r in records.values() if Fields.FILE in r
-        ]
+        }
 
         self._run_dir_search(
             files_dir_feed=files_dir_feed,
@@ -140,10 +140,12 @@ class LocalIndexSearchSource(JsonSchemaMixin):
         params = self.search_source.search_parameters
         query = params["query"]
 
-        if not any(x in query for x in [Fields.TITLE, Fields.ABSTRACT]):
-            query = f'title LIKE "%{query}%"'
-
-        returned_records = self.local_index.search(query)
+        if any(x in query for x in [Fields.TITLE, Fields.ABSTRACT]):
+            # SQL-based search (e.g., "title LIKE '%dark side%'")
+            returned_records = self.local_index.search(query)
+        else:
+            # Keyword-based search (full-text index)
+            returned_records = self.local_index.fulltext_search(query, limit=None)
 
         records_to_import = [r.get_data() for r in returned_records]
         records_to_import = [r for r in records_to_import if r]
@@ -4,13 +4,145 @@ from __future__ import annotations
 
 import typing
 from dataclasses import dataclass
+from dataclasses import field
+from functools import cached_property
 
 import colrev.process.operation
 from colrev.constants import Fields
+from colrev.constants import FieldValues
 from colrev.constants import RecordState
 from colrev.process.model import ProcessModel
 
 
+@dataclass
+class StatusAggregate:
+    """Aggregate of the records on which the status statistics are based
+
+    The aggregate is updated incrementally when records are added or removed
+    (e.g., replaced by their saved versions)."""
+
+    # pylint: disable=too-many-instance-attributes
+    nr_records: int = 0
+    state_counts: dict = field(default_factory=dict)
+    nr_origins: int = 0
+    md_duplicates_removed: int = 0
+    nr_curated_records: int = 0
+    screening_exclusions: dict = field(default_factory=dict)
+    # Note : origins can be in more than one record (counted once)
+    incomplete_origins: dict = field(default_factory=dict)
+
+    COMPLETED_STATES = [
+        RecordState.rev_synthesized,
+        RecordState.rev_excluded,
+        RecordState.rev_prescreen_excluded,
+        RecordState.pdf_not_available,
+    ]
+
+    @classmethod
+    def from_records(cls, records: dict) -> StatusAggregate:
+        """Compute the aggregate from the records (or record header items)"""
+        aggregate = cls()
+        for record_dict in records.values():
+            aggregate.add(record_dict)
+        return aggregate
+
+    @property
+    def nr_incomplete(self) -> int:
+        """The number of origins of incomplete records"""
+        return len(self.incomplete_origins)
+
+    def add(self, record_dict: dict) -> None:
+        """Add a record to the aggregate"""
+        self._update(record_dict, sign=1)
+
+    def remove(self, record_dict: dict) -> None:
+        """Remove a record from the aggregate"""
+        self._update(record_dict, sign=-1)
+
+    @staticmethod
+    def _add_count(counts: dict, key: typing.Any, value: int) -> None:
+        counts[key] = counts.get(key, 0) + value
+        if counts[key] == 0:
+            del counts[key]
+
+    def _update(self, record_dict: dict, *, sign: int) -> None:
+        status = record_dict[Fields.STATUS]
+        nr_origins = len(
+            [o for o in record_dict[Fields.ORIGIN] if not o.startswith("md_")]
+        )
+        self.nr_records += sign
+        self._add_count(self.state_counts, status, sign)
+        self.nr_origins += sign * nr_origins
+        self.md_duplicates_removed += sign * (nr_origins - 1)
+        if status not in self.COMPLETED_STATES:
+            for origin in record_dict[Fields.ORIGIN]:
+                self._add_count(self.incomplete_origins, origin, sign)
+        if FieldValues.CURATED in record_dict.get(Fields.MD_PROV, {}):
+            self.nr_curated_records += sign
+
+        screening_criteria = record_dict.get(Fields.SCREENING_CRITERIA, "")
+        if screening_criteria in ["", "NA"]:
+            return
+        for criterion in screening_criteria.split(";"):
+            criterion_name, decision = criterion.split("=")
+            if decision == "out":
+                self._add_count(self.screening_exclusions, criterion_name, sign)
+
+    def get_status_list(self) -> list:
+        """Get the list of record states"""
+        return [
+            state
+            for state in RecordState
+            for _ in range(self.state_counts.get(state, 0))
+        ]
+
+    def get_differences(self, other: StatusAggregate) -> list:
+        """Get the differences to another aggregate"""
+        other_dict = other.to_dict()
+        return [
+            f"{key}: {value} (expected: {other_dict[key]})"
+            for key, value in self.to_dict().items()
+            if value != other_dict[key]
+        ]
+
+    def to_dict(self) -> dict:
+        """Get the (json-serializable) dict of the aggregate"""
+        return {
+            "nr_records": self.nr_records,
+            "state_counts": {
+                state.name: self.state_counts[state]
+                for state in RecordState
+                if state in self.state_counts
+            },
+            "nr_origins": self.nr_origins,
+            "md_duplicates_removed": self.md_duplicates_removed,
+            "nr_incomplete": self.nr_incomplete,
+            "nr_curated_records": self.nr_curated_records,
+            "screening_exclusions": dict(sorted(self.screening_exclusions.items())),
+            "incomplete_origins": dict(sorted(self.incomplete_origins.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, aggregate_dict: dict) -> StatusAggregate:
+        """Load the aggregate from a dict (see to_dict)"""
+        aggregate_dict = {
+            key: value
+            for key, value in aggregate_dict.items()
+            if key != "nr_incomplete"
+        }
+        return cls(
+            **{
+                **aggregate_dict,
+                "state_counts": {
+                    RecordState[state]: count
+                    for state, count in aggregate_dict["state_counts"].items()
+                },
+                "screening_exclusions": dict(aggregate_dict["screening_exclusions"]),
+                "incomplete_origins": dict(aggregate_dict["incomplete_origins"]),
+            }
+        )
+
+
 @dataclass
 class StatusStats:
     """Data class for status statistics"""
@@ -48,16 +180,19 @@ class StatusStats:
         *,
         review_manager: colrev.review_manager.ReviewManager,
         records: dict,
+        aggregate: typing.Optional[StatusAggregate] = None,
     ) -> None:
         self.review_manager = review_manager
         self.records = records
-        self.origin_states_dict = self._get_origin_states_dict()
+        if aggregate is None:
+            aggregate = StatusAggregate.from_records(records)
+        self.aggregate = aggregate
 
-        self.status_list = [x[Fields.STATUS] for x in self.records.values()]
+        self.status_list = aggregate.get_status_list()
         self.screening_statistics = self._get_screening_statistics()
-        self.md_duplicates_removed = self._get_duplicates_removed()
-        self.nr_origins = self._get_nr_origins()
-        self.nr_incomplete = self._get_nr_incomplete()
+        self.md_duplicates_removed = aggregate.md_duplicates_removed
+        self.nr_origins = aggregate.nr_origins
+        self.nr_incomplete = aggregate.nr_incomplete
 
         self.overall = StatusStatsOverall(status_stats=self)
         self.currently = StatusStatsCurrently(status_stats=self)
@@ -84,7 +219,9 @@ class StatusStats:
             - self.currently.rev_excluded
         )
 
-    def _get_origin_states_dict(self) -> dict:
+    @cached_property
+    def origin_states_dict(self) -> dict:
+        """The states of the origins (based on the records)"""
         current_origin_states_dict = {}
         for record_dict in self.records.values():
             for origin in record_dict[Fields.ORIGIN]:
@@ -104,71 +241,24 @@ class StatusStats:
         return perc_curated
 
     def _get_nr_curated_records(self) -> int:
-        nr_curated_records = len(
-            [
-                r
-                for r in self.records.values()
-                if colrev.record.record.Record(r).masterdata_is_curated()
-            ]
-        )
+        nr_curated_records = self.aggregate.nr_curated_records
         if (
             self.review_manager.settings.is_curated_masterdata_repo()
         ):  # pragma: no cover
             nr_curated_records = self.overall.md_processed
         return nr_curated_records
 
-    def _get_nr_origins(self) -> int:
-        origin_list = [x[Fields.ORIGIN] for x in self.records.values()]
-        nr_origins = 0
-        for origin in origin_list:
-            nr_origins += len([o for o in origin if not o.startswith("md_")])
-        return nr_origins
-
-    def _get_duplicates_removed(self) -> int:
-        md_duplicates_removed = 0
-        for record_dict in self.records.values():
-            md_duplicates_removed += (
-                len([o for o in record_dict[Fields.ORIGIN] if not o.startswith("md_")])
-                - 1
-            )
-        return md_duplicates_removed
-
-    def _get_nr_incomplete(self) -> int:
-        """Get the number of incomplete records"""
-        return len(
-            [
-                x
-                for x in list(self.origin_states_dict.values())
-                if x
-                not in [
-                    RecordState.rev_synthesized,
-                    RecordState.rev_excluded,
-                    RecordState.rev_prescreen_excluded,
-                    RecordState.pdf_not_available,
-                ]
-            ]
-        )
-
     def _get_screening_statistics(self) -> dict:
-        screening_criteria = [
-            x[Fields.SCREENING_CRITERIA]
-            for x in self.records.values()
-            if x.get(Fields.SCREENING_CRITERIA, "") not in ["", "NA"]
-        ]
         criteria = list(self.review_manager.settings.screen.criteria.keys())
-        screening_statistics = {crit: 0 for crit in criteria}
-        for screening_case in screening_criteria:
-            for criterion in screening_case.split(";"):
-                criterion_name, decision = criterion.split("=")
-                if decision == "out":
-                    screening_statistics[criterion_name] += 1
-        return screening_statistics
+        return {
+            crit: self.aggregate.screening_exclusions.get(crit, 0) for crit in criteria
+        }
 
     def _get_completed_atomic_steps(self) -> int:
         """Get the number of completed atomic steps"""
         completed_steps = 0
-        for record_dict in self.records.values():
-            completed_steps += self.REQUIRED_ATOMIC_STEPS[record_dict[Fields.STATUS]]
+        for state, count in self.aggregate.state_counts.items():
+            completed_steps += self.REQUIRED_ATOMIC_STEPS[state] * count
         completed_steps += 4 * self.md_duplicates_removed
         completed_steps += self.currently.md_retrieved  # not in records
         return completed_steps
@@ -319,7 +409,7 @@ class StatusStatsParent:
         self.status_stats = status_stats
 
     def _get_freq(self, colrev_status: RecordState) -> int:
-        return len([x for x in self.status_stats.status_list if colrev_status == x])
+        return self.status_stats.aggregate.state_counts.get(colrev_status, 0)
 
 
 @dataclass
@@ -376,18 +466,8 @@ class StatusStatsCurrently(StatusStatsParent):
         self.pdf_needs_manual_preparation = self._get_freq(
             RecordState.pdf_needs_manual_preparation
         )
-        self.non_completed = len(
-            [
-                r
-                for r in status_stats.records.values()
-                if r[Fields.STATUS]
-                not in [
-                    RecordState.rev_synthesized,
-                    RecordState.rev_prescreen_excluded,
-                    RecordState.pdf_not_available,
-                    RecordState.rev_excluded,
-                ]
-            ]
+        self.non_completed = status_stats.aggregate.nr_records - sum(
+            self._get_freq(state) for state in StatusAggregate.COMPLETED_STATES
         )
 
 
@@ -406,7 +486,7 @@ class StatusStatsOverall(StatusStatsParent):
         super().__init__(status_stats=status_stats)
 
         self.md_retrieved = self._get_md_retrieved(status_stats)
-        self.md_imported = len(status_stats.records.values())
+        self.md_imported = status_stats.aggregate.nr_records
         self.md_prepared = self._get_cumulative_freq(RecordState.md_prepared)
         self.md_processed = self._get_cumulative_freq(RecordState.md_processed)
         self.rev_prescreen = self._get_cumulative_freq(RecordState.md_processed)
@@ -425,12 +505,9 @@ class StatusStatsOverall(StatusStatsParent):
         self.pdf_not_available = self._get_freq(RecordState.pdf_not_available)
 
     def _get_cumulative_freq(self, colrev_status: RecordState) -> int:
-        return len(
-            [
-                x
-                for x in self.status_stats.status_list
-                if x in RecordState.get_post_x_states(state=colrev_status)
-            ]
+        return sum(
+            self._get_freq(state)
+            for state in RecordState.get_post_x_states(state=colrev_status)
         )
 
     def _get_md_retrieved(self, status_stats: StatusStats) -> int:
@@ -2,6 +2,8 @@
 """Checker for inconsistent-with-doi-metadata."""
 from __future__ import annotations
 
+import typing
+
 from rapidfuzz import fuzz
 
 import colrev.exceptions as colrev_exceptions
@@ -32,10 +34,40 @@ class InconsistentWithDOIMetadataChecker:
     ) -> None:
         self.quality_model = quality_model
         self._etiquette = crossref_connector.CrossrefSearchSource.get_etiquette()
+        self._cached_records: typing.Mapping[str, colrev.record.record.Record] = {}
 
     def run(self, *, record: colrev.record.record.Record) -> None:
         """Run the inconsistent-with-doi-metadata checks"""
 
+        self._run(
+            record,
+            crossref_md=self._cached_records.get(record.data.get(Fields.DOI, "")),
+        )
+
+    def prefetch(self, *, records: list) -> None:
+        """Retrieve the cached DOI metadata of a batch of records (used by run)"""
+
+        # Note : the DOI metadata of the batch is retrieved from the cache at once
+        # (DOIs that are not cached are queried when the records are checked)
+        self._cached_records = (
+            crossref_connector.CrossrefSearchSource.get_cached_doi_records(
+                dois=[r.data[Fields.DOI] for r in records if Fields.DOI in r.data]
+            )
+        )
+
+    def run_batch(self, *, records: list) -> None:
+        """Run the inconsistent-with-doi-metadata checks for a batch of records"""
+
+        self.prefetch(records=records)
+        for record in records:
+            self.run(record=record)
+
+    def _run(
+        self,
+        record: colrev.record.record.Record,
+        *,
+        crossref_md: typing.Optional[colrev.record.record.Record] = None,
+    ) -> None:
         if Fields.DOI not in record.data or record.ignored_defect(
             key=Fields.DOI, defect=self.msg
         ):
@@ -44,18 +76,24 @@ class InconsistentWithDOIMetadataChecker:
         if "md_curated.bib" in record.get_field_provenance_source(Fields.DOI):
             return
 
-        if self._doi_metadata_conflicts(record=record):
+        if self._doi_metadata_conflicts(record=record, crossref_md=crossref_md):
             record.add_field_provenance_note(key=Fields.DOI, note=self.msg)
         else:
             record.remove_field_provenance_note(key=Fields.DOI, note=self.msg)
 
-    def _doi_metadata_conflicts(self, *, record: colrev.record.record.Record) -> bool:
+    def _doi_metadata_conflicts(
+        self,
+        *,
+        record: colrev.record.record.Record,
+        crossref_md: typing.Optional[colrev.record.record.Record] = None,
+    ) -> bool:
         record_copy = record.copy_prep_rec()
 
         try:
-            crossref_md = crossref_connector.CrossrefSearchSource.query_doi(
-                doi=record_copy.data[Fields.DOI], etiquette=self._etiquette
-            )
+            if crossref_md is None:
+                crossref_md = crossref_connector.CrossrefSearchSource.query_doi_cached(
+                    doi=record_copy.data[Fields.DOI], etiquette=self._etiquette
+                )
 
             for key in crossref_md.data.keys():
                 if key not in self._fields_to_check:
@@ -2,6 +2,8 @@
 """Checker for record-not-in-toc."""
 from __future__ import annotations
 
+import typing
+
 import colrev.env.local_index
 import colrev.exceptions as colrev_exceptions
 import colrev.record.qm.quality_model
@@ -22,6 +24,8 @@ class RecordNotInTOCChecker:
     ) -> None:
         self.quality_model = quality_model
         self.local_index = colrev.env.local_index.LocalIndex(verbose_mode=False)
+        self._checked_toc_keys: typing.Set[str] = set()
+        self._indexed_toc_keys: typing.Set[str] = set()
 
     def run(self, *, record: colrev.record.record.Record) -> None:
         """Run the record-not-in-toc checks"""
@@ -44,8 +48,45 @@ class RecordNotInTOCChecker:
                 record.remove_field_provenance_note(key=Fields.BOOKTITLE, note=self.msg)
             return
 
+    def prefetch(self, *, records: list) -> None:
+        """Determine which TOCs of a batch of records are indexed (used by run)"""
+
+        # Note : a single query determines which TOCs of the batch are indexed.
+        # Only records with an indexed TOC need to be retrieved from the TOC.
+        toc_keys = set()
+        for record in records:
+            toc_key = self._get_toc_key(record)
+            if toc_key:
+                toc_keys.add(toc_key)
+        self._indexed_toc_keys = self.local_index.get_indexed_toc_keys(list(toc_keys))
+        self._checked_toc_keys = toc_keys
+
+    def run_batch(self, *, records: list) -> None:
+        """Run the record-not-in-toc checks for a batch of records"""
+
+        self.prefetch(records=records)
+        for record in records:
+            self.run(record=record)
+
+    @staticmethod
+    def _get_toc_key(record: colrev.record.record.Record) -> str:
+        if record.data[Fields.ENTRYTYPE] not in [
+            ENTRYTYPES.ARTICLE,
+            ENTRYTYPES.INPROCEEDINGS,
+        ]:
+            return ""
+        try:
+            return record.get_toc_key()
+        except colrev_exceptions.NotTOCIdentifiableException:
+            return ""
+
     def _is_in_toc(self, record: colrev.record.record.Record) -> bool:
 
+        # Records without an indexed TOC cannot be checked
+        toc_key = self._get_toc_key(record)
+        if toc_key in self._checked_toc_keys and toc_key not in self._indexed_toc_keys:
+            return True
+
         try:
             self.quality_model.local_index_lock.acquire(timeout=60)
             # Search within the table-of-content in local_index
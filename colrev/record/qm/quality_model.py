@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import importlib
+import time
+import typing
 from multiprocessing import Lock
 from pathlib import Path
 
@@ -11,6 +13,47 @@ import colrev.record.record
 from colrev.constants import Fields
 
 
+# Note : the checker modules are imported once per process (keyed by pdf_mode)
+_CHECKER_MODULES: typing.Dict[bool, list] = {}
+
+
+def _get_checker_modules(*, pdf_mode: bool) -> list:
+    """Get the checker modules from the checker directory"""
+
+    if pdf_mode in _CHECKER_MODULES:
+        return _CHECKER_MODULES[pdf_mode]
+
+    if pdf_mode:
+        module_path = "colrev.record.qm.pdf_checkers."
+    else:
+        module_path = "colrev.record.qm.checkers."
+
+    if pdf_mode:
+        checker_path = Path(__file__).parent / Path("pdf_checkers/")
+    else:
+        checker_path = Path(__file__).parent / Path("checkers")
+
+    checker_modules = []
+    for filename in sorted(checker_path.glob("*.py")):
+        if "__init__" in str(filename):
+            continue
+
+        try:
+            module = importlib.import_module(module_path + filename.stem)
+        except ValueError as exc:  # pragma: no cover
+            print(f"Problem with filepath for module import {filename}: {exc}")
+        except ImportError as exc:  # pragma: no cover
+            print(f"Problem importing module {filename}: {exc}")
+        else:
+            if hasattr(module, "register"):
+                checker_modules.append(module)
+            else:  # pragma: no cover
+                print(f"Module {filename} does not have a register function")
+
+    _CHECKER_MODULES[pdf_mode] = checker_modules
+    return checker_modules
+
+
 class QualityModel:
     """The quality model for records"""
 
@@ -26,6 +69,8 @@ class QualityModel:
         self.defects_to_ignore = defects_to_ignore
         self._register_checkers()
         self.local_index_lock = Lock()
+        self.checker_timings: typing.Dict[str, float] = {}
+        """Time spent in each checker (in seconds, keyed by the defect code)"""
 
     def _register_checkers(self) -> None:
         """Register checkers from the checker directory, looking for a
@@ -33,31 +78,8 @@ class QualityModel:
         """
 
         self.checkers = []
-        if self.pdf_mode:
-            module_path = "colrev.record.qm.pdf_checkers."
-        else:
-            module_path = "colrev.record.qm.checkers."
-
-        if self.pdf_mode:
-            checker_path = Path(__file__).parent / Path("pdf_checkers/")
-        else:
-            checker_path = Path(__file__).parent / Path("checkers")
-
-        for filename in checker_path.glob("*.py"):
-            if "__init__" in str(filename):
-                continue
-
-            try:
-                module = importlib.import_module(module_path + filename.stem)
-            except ValueError as exc:  # pragma: no cover
-                print(f"Problem with filepath for module import {filename}: {exc}")
-            except ImportError as exc:  # pragma: no cover
-                print(f"Problem importing module {filename}: {exc}")
-            else:
-                if hasattr(module, "register"):
-                    module.register(self)
-                else:  # pragma: no cover
-                    print(f"Module {filename} does not have a register function")
+        for module in _get_checker_modules(pdf_mode=self.pdf_mode):
+            module.register(self)
 
     def register_checker(self, checker) -> None:  # type: ignore
         """Register a checker"""
@@ -84,8 +106,52 @@ class QualityModel:
         for checker in self.checkers:
             if checker.msg in self.defects_to_ignore:
                 continue
+            start = time.perf_counter()
             checker.run(record=record)
+            self._add_checker_timing(checker, time.perf_counter() - start)
 
         if self.pdf_mode:
             record.data.pop(Fields.TEXT_FROM_PDF, None)
             record.data.pop(Fields.NR_PAGES_IN_FILE, None)
+
+    def prefetch(self, *, records: list) -> None:
+        """Retrieve the local data that the checkers require for a batch of records
+        (e.g., cached metadata) at once. Checkers that implement a prefetch method
+        use the data when they are subsequently run for the individual records."""
+
+        if self.pdf_mode:
+            return
+
+        for checker in self.checkers:
+            if checker.msg in self.defects_to_ignore:
+                continue
+            if hasattr(checker, "prefetch"):
+                checker.prefetch(records=records)
+
+    def run_batch(self, *, records: list) -> None:
+        """Run the checkers for a batch of records
+
+        Checkers can implement a run_batch method to evaluate the records
+        at once (e.g., with a single query). Otherwise, they are applied
+        to each record."""
+
+        if self.pdf_mode:
+            for record in records:
+                self.run(record=record)
+            return
+
+        for checker in self.checkers:
+            if checker.msg in self.defects_to_ignore:
+                continue
+            start = time.perf_counter()
+            if hasattr(checker, "run_batch"):
+                checker.run_batch(records=records)
+            else:
+                for record in records:
+                    checker.run(record=record)
+            self._add_checker_timing(checker, time.perf_counter() - start)
+
+    def _add_checker_timing(self, checker, duration: float) -> None:  # type: ignore
+        self.checker_timings[checker.msg] = (
+            self.checker_timings.get(checker.msg, 0.0) + duration
+        )
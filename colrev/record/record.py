@@ -664,6 +664,36 @@ class Record:
         # Apply the checkers (including field key requirements etc.)
         quality_model.run(record=self)
 
+        self._set_status_after_quality_model(set_prepared=set_prepared)
+
+    @staticmethod
+    def run_quality_model_batch(
+        records: list,
+        quality_model: colrev.record.qm.quality_model.QualityModel,
+        *,
+        set_prepared: bool = False,
+    ) -> None:
+        """Update the masterdata provenance of a batch of records"""
+
+        records_to_check = []
+        for record in records:
+            record.require_prov()
+            record.is_retracted()
+
+            if record.masterdata_is_curated():
+                if set_prepared:
+                    record.set_status(RecordState.md_prepared)
+                continue
+            records_to_check.append(record)
+
+        # Apply the checkers (including field key requirements etc.)
+        quality_model.run_batch(records=records_to_check)
+
+        for record in records_to_check:
+            # pylint: disable=protected-access
+            record._set_status_after_quality_model(set_prepared=set_prepared)
+
+    def _set_status_after_quality_model(self, *, set_prepared: bool) -> None:
         if (
             Fields.STATUS in self.data
             and self.data[Fields.STATUS] == RecordState.rev_prescreen_excluded
@@ -0,0 +1,177 @@
+#! /usr/bin/env python
+"""Index of the record versions in the history of the records file."""
+from __future__ import annotations
+
+import hashlib
+import io
+import sqlite3
+import typing
+from pathlib import Path
+
+import colrev.loader.load_utils
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import git
+    import git.objects.commit
+
+
+def get_record_offsets(file: typing.BinaryIO) -> typing.List[tuple]:
+    """Get the (ID, start, end) byte offsets of the records in a bib file"""
+    offsets = []
+    current_id, start = None, 0
+    seekpos = file.tell()
+    line = file.readline()
+    while line:
+        if b"@" in line[:3]:
+            if current_id is not None:
+                offsets.append((current_id, start, seekpos))
+            current_id = line[line.find(b"{") + 1 : line.rfind(b",")].decode("utf-8")
+            start = seekpos
+        seekpos += len(line)
+        line = file.readline()
+    if current_id is not None:
+        offsets.append((current_id, start, seekpos))
+    return offsets
+
+
+class RecordHistory:
+    """The RecordHistory indexes the record versions in the history of the records file
+
+    The index is content-addressed (blob sha -> record ID, record hash, offsets)
+    and built incrementally when the blobs are first accessed.
+    Record versions are only parsed when they are needed (e.g., when they changed)."""
+
+    # Note : the index is stored in the git directory (never committed)
+    RECORD_HISTORY_FILE = Path("colrev/record_history.db")
+    CREATE_TABLE_QUERIES = [
+        "CREATE TABLE IF NOT EXISTS blobs (blob_sha TEXT PRIMARY KEY)",
+        "CREATE TABLE IF NOT EXISTS record_offsets (blob_sha TEXT, record_id TEXT, "
+        "record_hash TEXT, start INTEGER, end INTEGER, "
+        "PRIMARY KEY (blob_sha, record_id)) WITHOUT ROWID",
+    ]
+
+    def __init__(
+        self,
+        *,
+        review_manager: colrev.review_manager.ReviewManager,
+        git_repo: git.Repo,
+    ) -> None:
+        self.review_manager = review_manager
+        self._git_repo = git_repo
+        self._records_file = review_manager.paths.RECORDS_FILE_GIT
+        self._connection: typing.Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            db_path = Path(self._git_repo.git_dir) / self.RECORD_HISTORY_FILE
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(db_path), timeout=30)
+            for query in self.CREATE_TABLE_QUERIES:
+                self._connection.execute(query)
+            self._connection.commit()
+        return self._connection
+
+    def get_commits(self) -> typing.List[git.objects.commit.Commit]:
+        """Get the commits that changed the records file (latest first)"""
+        return list(self._git_repo.iter_commits(paths=self._records_file))
+
+    def _get_blob_sha(self, commit: git.objects.commit.Commit) -> str:
+        return (commit.tree / self._records_file).hexsha
+
+    def _read_blob(self, blob_sha: str) -> bytes:
+        return self._git_repo.odb.stream(bytes.fromhex(blob_sha)).read()
+
+    def _index_blob(self, blob_sha: str) -> None:
+        connection = self._get_connection()
+        if connection.execute(
+            "SELECT 1 FROM blobs WHERE blob_sha = ?", (blob_sha,)
+        ).fetchone():
+            return
+
+        content = self._read_blob(blob_sha)
+        offsets = get_record_offsets(io.BytesIO(content))
+        connection.executemany(
+            "INSERT OR REPLACE INTO record_offsets VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    blob_sha,
+                    record_id,
+                    hashlib.sha1(content[start:end], usedforsecurity=False).hexdigest(),
+                    start,
+                    end,
+                )
+                for record_id, start, end in offsets
+            ),
+        )
+        connection.execute("INSERT INTO blobs VALUES (?)", (blob_sha,))
+        connection.commit()
+
+    def get_record_hashes(self, commit: git.objects.commit.Commit) -> dict:
+        """Get the hashes of the record versions in a commit (keyed by record ID)"""
+        blob_sha = self._get_blob_sha(commit)
+        self._index_blob(blob_sha)
+        return dict(
+            self._get_connection()
+            .execute(
+                "SELECT record_id, record_hash FROM record_offsets "
+                "WHERE blob_sha = ? ORDER BY record_id",
+                (blob_sha,),
+            )
+            .fetchall()
+        )
+
+    def get_record_hash(
+        self, commit: git.objects.commit.Commit, record_id: str
+    ) -> typing.Optional[str]:
+        """Get the hash of a record version in a commit
+        (None if the record is not in the commit)"""
+        blob_sha = self._get_blob_sha(commit)
+        self._index_blob(blob_sha)
+        row = (
+            self._get_connection()
+            .execute(
+                "SELECT record_hash FROM record_offsets "
+                "WHERE blob_sha = ? AND record_id = ?",
+                (blob_sha, record_id),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def load_records(
+        self,
+        commit: git.objects.commit.Commit,
+        *,
+        record_ids: typing.Optional[typing.Iterable[str]] = None,
+    ) -> dict:
+        """Load the records of a commit (only the selected record_ids if provided)"""
+        blob_sha = self._get_blob_sha(commit)
+        self._index_blob(blob_sha)
+        offsets = (
+            self._get_connection()
+            .execute(
+                "SELECT record_id, start, end FROM record_offsets "
+                "WHERE blob_sha = ? ORDER BY start",
+                (blob_sha,),
+            )
+            .fetchall()
+        )
+        if record_ids is not None:
+            selected_ids = set(record_ids)
+            offsets = [x for x in offsets if x[0] in selected_ids]
+        if not offsets:
+            return {}
+
+        content = self._read_blob(blob_sha)
+        load_string = b"".join(content[start:end] for _, start, end in offsets)
+        return colrev.loader.load_utils.loads(
+            load_string=load_string.decode("utf-8", "replace"),
+            implementation="bib",
+            logger=self.review_manager.logger,
+        )
+
+    def close(self) -> None:
+        """Close the connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+"""Allocation of unique record IDs."""
+from __future__ import annotations
+
+import collections
+import string
+import typing
+
+_LETTERS = string.ascii_lowercase
+
+
+def get_suffix(index: int) -> str:
+    """Get the suffix at the index of the sequence a, b, ..., z, aa, ab, ..."""
+    order = 1
+    while index >= len(_LETTERS) ** order:
+        index -= len(_LETTERS) ** order
+        order += 1
+    suffix = ""
+    for _ in range(order):
+        index, remainder = divmod(index, len(_LETTERS))
+        suffix = _LETTERS[remainder] + suffix
+    return suffix
+
+
+def get_suffix_index(suffix: str) -> int:
+    """Get the index of a suffix in the sequence a, b, ..., z, aa, ab, ..."""
+    index = sum(len(_LETTERS) ** order for order in range(1, len(suffix)))
+    value = 0
+    for letter in suffix:
+        value = value * len(_LETTERS) + _LETTERS.index(letter)
+    return index + value
+
+
+class IDAllocator:
+    """The IDAllocator keeps track of the IDs that are taken and allocates unique IDs
+
+    IDs are compared case-insensitively (they are used as file names).
+    Duplicates of an ID are resolved by appending suffixes (a, b, ..., z, aa, ab, ...).
+    The next suffix to try is stored per stem, i.e., allocating n IDs
+    with the same stem does not check the n previous candidates again."""
+
+    def __init__(self, ids: typing.Iterable[str] = ()) -> None:
+        self._ids: typing.Counter[str] = collections.Counter(x.lower() for x in ids)
+        # Note : all candidates before the next suffix (index) of a stem are taken
+        self._next_suffix: typing.Dict[str, int] = {}
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id.lower() in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, record_id: str) -> None:
+        """Mark the ID as taken"""
+        self._ids[record_id.lower()] += 1
+
+    def remove(self, record_id: str) -> None:
+        """Release the ID (if it was added more than once, it remains taken)"""
+        key = record_id.lower()
+        if key not in self._ids:
+            return
+        self._ids[key] -= 1
+        if self._ids[key] > 0:
+            return
+        del self._ids[key]
+
+        # The released ID may be a candidate (stem + suffix) that can be allocated again
+        split = len(key)
+        while split > 1 and key[split - 1] in _LETTERS:
+            split -= 1
+            stem = key[:split]
+            if stem in self._next_suffix:
+                self._next_suffix[stem] = min(
+                    self._next_suffix[stem], get_suffix_index(key[split:])
+                )
+
+    def get_unique_id(self, temp_id: str) -> str:
+        """Get the first candidate (temp_id or temp_id with a suffix) that is not taken"""
+        if temp_id.lower() not in self._ids:
+            return temp_id
+        stem = temp_id.lower()
+        index = self._next_suffix.get(stem, 0)
+        while stem + get_suffix(index) in self._ids:
+            index += 1
+        self._next_suffix[stem] = index
+        return temp_id + get_suffix(index)
+
+    def allocate(self, temp_id: str) -> str:
+        """Get a unique ID (see get_unique_id) and mark it as taken"""
+        record_id = self.get_unique_id(temp_id)
+        self.add(record_id)
+        return record_id
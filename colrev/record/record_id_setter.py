@@ -2,10 +2,8 @@
 """Functionality for record ID setting."""
 from __future__ import annotations
 
-import itertools
 import logging
 import re
-import string
 import typing
 
 from tqdm import tqdm
@@ -16,6 +14,8 @@ import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.process.operation
 import colrev.record.record
+import colrev.record.record_id_allocator
+import colrev.record.record_prep
 from colrev.constants import Fields
 from colrev.constants import FieldValues
 from colrev.constants import IDPattern
@@ -87,31 +87,13 @@ class IDSetter:
             temp_id = temp_id.capitalize()
         return temp_id
 
-    def _make_id_unique(
-        self,
-        temp_id: str,
-        *,
-        existing_ids: list,
-    ) -> str:
-        """Get the next unique ID"""
-
-        order = 0
-        letters = list(string.ascii_lowercase)
-        next_unique_id = temp_id
-        appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
-            if len(appends) == 0:
-                order += 1
-                appends = list(itertools.product(letters, repeat=order))
-            next_unique_id = temp_id + "".join(list(appends.pop(0)))
-        temp_id = next_unique_id
-        return temp_id
-
     def _generate_id(
         self,
         record_dict: dict,
         *,
-        existing_ids: typing.Optional[list] = None,
+        id_allocator: typing.Optional[
+            colrev.record.record_id_allocator.IDAllocator
+        ] = None,
     ) -> str:
         """Generate a blacklist to avoid setting duplicate IDs"""
 
@@ -127,11 +109,8 @@ class IDSetter:
             ):
                 temp_id = self._generate_id_from_pattern(record_dict)
 
-        if existing_ids:
-            temp_id = self._make_id_unique(
-                temp_id,
-                existing_ids=existing_ids,
-            )
+        if id_allocator is not None:
+            temp_id = id_allocator.get_unique_id(temp_id)
 
         return temp_id
 
@@ -140,7 +119,7 @@ class IDSetter:
     ) -> dict:
         """Set the IDs for the records in the dataset"""
 
-        id_list = list(records.keys())
+        id_allocator = colrev.record.record_id_allocator.IDAllocator(records.keys())
 
         for record_id in tqdm(list(records.keys())):
             record_dict = records[record_id]
@@ -164,10 +143,9 @@ class IDSetter:
             if record_dict[Fields.STATUS] not in RecordState.get_post_x_states(
                 state=RecordState.md_processed
             ):
-                new_id = self._generate_id(
-                    record_dict,
-                    existing_ids=[x for x in id_list if x != record_id],
-                )
+                id_allocator.remove(record_id)
+                new_id = self._generate_id(record_dict, id_allocator=id_allocator)
+                id_allocator.add(new_id)
 
             if selected_ids:
                 record = colrev.record.record.Record(record_dict)
@@ -175,7 +153,6 @@ class IDSetter:
 
             self._update_id(
                 records,
-                id_list=id_list,
                 record_dict=record_dict,
                 old_id=old_id,
                 new_id=new_id,
@@ -183,17 +160,14 @@ class IDSetter:
 
         return records
 
-    # pylint: disable=too-many-arguments
     def _update_id(
         self,
         records: dict,
         *,
-        id_list: list,
         record_dict: dict,
         old_id: str,
         new_id: str,
     ) -> None:
-        id_list.append(new_id)
         if old_id != new_id:
             # We need to insert the a new element into records
             # to make sure that the IDs are actually saved
@@ -201,5 +175,3 @@ class IDSetter:
             records[new_id] = record_dict
             del records[old_id]
             self.logger.info(f"set_ids({old_id}) to {new_id}")
-            if old_id in id_list:
-                id_list.remove(old_id)
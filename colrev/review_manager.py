@@ -77,6 +77,11 @@ class ReviewManager:
 
         self.exact_call = exact_call
 
+        self._quality_models: typing.Dict[
+            typing.Tuple[typing.Tuple[str, ...], bool],
+            colrev.record.qm.quality_model.QualityModel,
+        ] = {}
+
         try:
             if self.paths.settings.is_file():
                 self.paths.data.mkdir(parents=True, exist_ok=True)
@@ -247,11 +252,16 @@ class ReviewManager:
         return sharing_advice
 
     def update_status_yaml(
-        self, *, add_to_git: bool = True, records: typing.Optional[dict] = None
+        self,
+        *,
+        add_to_git: bool = True,
+        records: typing.Optional[dict] = None,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
     ) -> None:
         """Update the STATUS_FILE"""
 
-        status_stats = self.get_status_stats(records=records)
+        if status_stats is None:
+            status_stats = self.get_status_stats(records=records)
         exported_dict = asdict(status_stats)
         with open(self.paths.status, "w", encoding="utf8") as file:
             yaml.dump(exported_dict, file, allow_unicode=True)
@@ -298,11 +308,23 @@ class ReviewManager:
 
         return colrev.ops.checker.Checker(review_manager=self)
 
+    def _get_shared_qm(
+        self, *, defects_to_ignore: list, pdf_mode: bool
+    ) -> colrev.record.qm.quality_model.QualityModel:
+        # Note : quality models are shared per set of defects_to_ignore
+        # (instantiating the checkers is expensive)
+        key = (tuple(sorted(defects_to_ignore)), pdf_mode)
+        if key not in self._quality_models:
+            self._quality_models[key] = colrev.record.qm.quality_model.QualityModel(
+                defects_to_ignore=list(key[0]), pdf_mode=pdf_mode
+            )
+        return self._quality_models[key]
+
     def get_qm(self) -> colrev.record.qm.quality_model.QualityModel:  # pragma: no cover
         """Get the quality model"""
 
-        return colrev.record.qm.quality_model.QualityModel(
-            defects_to_ignore=self.settings.prep.defects_to_ignore
+        return self._get_shared_qm(
+            defects_to_ignore=self.settings.prep.defects_to_ignore, pdf_mode=False
         )
 
     def get_pdf_qm(
@@ -310,7 +332,7 @@ class ReviewManager:
     ) -> colrev.record.qm.quality_model.QualityModel:  # pragma: no cover
         """Get the PDF quality model"""
 
-        return colrev.record.qm.quality_model.QualityModel(
+        return self._get_shared_qm(
             defects_to_ignore=self.settings.pdf_get.defects_to_ignore, pdf_mode=True
         )
 
@@ -321,10 +343,16 @@ class ReviewManager:
 
         import colrev.process.status
 
-        colrev.ops.check.CheckOperation(self)
-
         if records is None:
-            records = self.dataset.load_records_dict()
+            colrev.ops.check.CheckOperation(self)
+            # Note : the status statistics only require the record header items
+            # and the status aggregate (which is maintained incrementally)
+            records_headers = self.dataset.load_records_dict(header_only=True)
+            return colrev.process.status.StatusStats(
+                review_manager=self,
+                records=records_headers,
+                aggregate=self.dataset.get_status_aggregate(),
+            )
         return colrev.process.status.StatusStats(review_manager=self, records=records)
 
     def get_completeness_condition(self) -> bool:
@@ -428,6 +456,7 @@ class ReviewManager:
         polish: bool = False,
         cpu: int = 4,
         debug: bool = False,
+        engine: str = "thread",
     ) -> colrev.ops.prep.Prep:  # pragma: no cover
         """Get a prep operation object"""
         if debug:
@@ -446,6 +475,7 @@ class ReviewManager:
             notify_state_transition_operation=notify_state_transition_operation,
             polish=polish,
             cpu=cpu,
+            engine=engine,
         )
 
     def get_prep_man_operation(
@@ -15,21 +15,9 @@ from pathlib import Path
 
 import click
 import click_completion.core
-import click_repl
-import pandas as pd
-from git.exc import GitCommandError
 
-import colrev.env.local_index
-import colrev.env.local_index_builder
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.check
 import colrev.package_manager.package_manager
-import colrev.record.record
-import colrev.review_manager
-import colrev.ui_cli.add_package_to_settings
-import colrev.ui_cli.cli_status_printer
-import colrev.ui_cli.cli_validation
-import colrev.ui_cli.dedupe_errors
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
@@ -73,6 +61,8 @@ click_completion.init()
 
 def get_search_files() -> list:
     """Get the search files (for click choices)"""
+    import colrev.review_manager
+
     # Take the filenames from sources because there may be API searches
     # without files (yet)
     try:
@@ -82,6 +72,27 @@ def get_search_files() -> list:
         return []
 
 
+class LazyChoice(click.Choice):
+    """Choice whose options are only determined when they are needed
+    (e.g., when the option is used, not when the cli is loaded)"""
+
+    def __init__(self, get_choices: typing.Callable[[], list]) -> None:
+        super().__init__([])
+        self._get_choices = get_choices
+        self._choices: typing.Optional[tuple] = None
+
+    @property  # type: ignore
+    def choices(self) -> tuple:  # type: ignore
+        """The choices"""
+        if self._choices is None:
+            self._choices = tuple(self._get_choices())
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices: tuple) -> None:
+        self._choices = tuple(choices)
+
+
 class SpecialHelpOrder(click.Group):
     """Order for cli commands in help page overview"""
 
@@ -160,12 +171,13 @@ def main(ctx: click.core.Context) -> None:
 
     Documentation:  https://colrev.readthedocs.io/
     """
+    if ctx.invoked_subcommand == "shell":
+        import colrev.review_manager
 
-    try:
-        if ctx.invoked_subcommand == "shell":
+        try:
             ctx.obj = {"review_manager": colrev.review_manager.ReviewManager()}
-    except colrev.exceptions.RepoSetupError:
-        pass
+        except colrev.exceptions.RepoSetupError:
+            pass
 
 
 def get_review_manager(
@@ -176,6 +188,7 @@ def get_review_manager(
     the given parameters. If params requires review_manager to be reloaded, will
     reload it
     """
+    import colrev.review_manager
 
     review_manager_params["exact_call"] = ctx.command_path
     try:
@@ -210,6 +223,7 @@ def shell(
     ctx: click.core.Context,
 ) -> None:
     """Starts a interactive terminal"""
+    import click_repl
     from prompt_toolkit.history import FileHistory
 
     print(f"CoLRev version {colrev.__version__}")
@@ -233,6 +247,8 @@ def exit(
     """Starts a interactive terminal"""
     import inspect
 
+    import click_repl
+
     curframe = inspect.currentframe()
     calframe = inspect.getouterframes(curframe, 2)
     if calframe[7].function == "shell":
@@ -298,19 +314,40 @@ def init(
     default=False,
     help="Verbose: printing more infos",
 )
+@click.option(
+    "--verify",
+    is_flag=True,
+    default=False,
+    help="Verify the status statistics against a full recomputation",
+)
+@click.option(
+    "--export-analytics",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Export the status analytics timeline (.csv or .parquet)",
+)
 @click.pass_context
 @catch_exception(handle=(colrev_exceptions.CoLRevException))
 def status(
     ctx: click.core.Context,
     verbose: bool,
+    verify: bool,
+    export_analytics: Path,
 ) -> None:
     """Show status"""
+    import colrev.ui_cli.cli_status_printer
+
     try:
         review_manager = get_review_manager(
             ctx,
             {"force_mode": False, "verbose_mode": verbose, "exact_call": EXACT_CALL},
         )
         status_operation = review_manager.get_status_operation()
+        if export_analytics:
+            status_operation.export_analytics(export_analytics)
+            print(f"Exported status analytics to {export_analytics}")
+            return
+        if verify:
+            status_operation.verify_status_aggregate()
         colrev.ui_cli.cli_status_printer.print_project_status(status_operation)
 
     except KeyboardInterrupt:
@@ -445,7 +482,7 @@ def retrieve(
 @click.option(
     "-s",
     "--selected",
-    type=click.Choice(get_search_files()),
+    type=LazyChoice(get_search_files),
     help="Only retrieve search results for selected sources",
 )
 @click.option(
@@ -671,6 +708,12 @@ def load(
     type=int,
     help="Number of cpus (parallel processes)",
 )
+@click.option(
+    "--engine",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    help="Run the preparation in threads (default) or in processes (for CPU-bound prep rounds)",
+)
 @click.option(
     "-scs",
     "--setup_custom_script",
@@ -702,6 +745,7 @@ def prep(
     polish: bool,
     debug: str,
     cpu: int,
+    engine: str,
     setup_custom_script: bool,
     verbose: bool,
     force: bool,
@@ -710,6 +754,7 @@ def prep(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     try:
         review_manager = get_review_manager(
@@ -727,7 +772,9 @@ def prep(
             debug_prep_operation.run_debug(debug_ids=debug)  # type: ignore
             return
 
-        prep_operation = review_manager.get_prep_operation(polish=polish, cpu=cpu)
+        prep_operation = review_manager.get_prep_operation(
+            polish=polish, cpu=cpu, engine=engine
+        )
         if setup_custom_script:
             prep_operation.setup_custom_script()
             print("Activated custom_prep_script.py.")
@@ -810,6 +857,7 @@ def prep_man(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -927,6 +975,8 @@ def dedupe(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_retrieval/dedupe.html
     """
+    import colrev.ui_cli.add_package_to_settings
+    import colrev.ui_cli.dedupe_errors
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -1096,9 +1146,10 @@ def prescreen(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/metadata_prescreen/prescreen.html
     """
-
     # pylint: disable=too-many-locals
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -1251,6 +1302,7 @@ def screen(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_screen/screen.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
@@ -1498,6 +1550,7 @@ def pdf_get(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_get.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -1594,6 +1647,9 @@ def pdf_get_man(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_get.html
     """
+    import pandas as pd
+
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -1751,6 +1807,7 @@ def pdf_prep(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     # pylint: disable=import-outside-toplevel
 
@@ -1793,6 +1850,8 @@ def pdf_prep(
 def _delete_first_pages_cli(
     pdf_prep_man_operation: colrev.ops.pdf_prep_man.PDFPrepMan, record_id: str
 ) -> None:
+    import colrev.record.record
+
     records = pdf_prep_man_operation.review_manager.dataset.load_records_dict()
     while True:
         if record_id in records:
@@ -1888,6 +1947,7 @@ def pdf_prep_man(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/pdf_retrieval/pdf_prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -1981,6 +2041,7 @@ def data(
 
     Docs: https://colrev.readthedocs.io/en/latest/manual/data/data.html
     """
+    import colrev.ui_cli.add_package_to_settings
 
     review_manager = get_review_manager(
         ctx,
@@ -2095,6 +2156,7 @@ def validate(
     - HEAD~4 for commit 4 before HEAD
     - A contributor name
     """
+    import colrev.ui_cli.cli_validation
 
     review_manager = get_review_manager(
         ctx,
@@ -2269,6 +2331,12 @@ def _print_environment_status(
 @click.option(
     "-i", "--index", is_flag=True, default=False, help="Create the LocalIndex"
 )
+@click.option(
+    "--reinitialize",
+    is_flag=True,
+    default=False,
+    help="Rebuild the LocalIndex from scratch (instead of updating changed repositories)",
+)
 @click.option(
     "--install",
     help="Install a new resource providing its url "
@@ -2278,6 +2346,23 @@ def _print_environment_status(
 @click.option(
     "-s", "--status", is_flag=True, default=False, help="Print environment status"
 )
+@click.option(
+    "--search",
+    "search_query",
+    help="Keyword search in the LocalIndex (ranked full-text search)",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=20,
+    help="Maximum number of search results",
+)
+@click.option(
+    "--offset",
+    type=int,
+    default=0,
+    help="Number of search results to skip (pagination)",
+)
 @click.option(
     "-r",
     "--register",
@@ -2308,18 +2393,26 @@ def _print_environment_status(
 def env(
     ctx: click.core.Context,
     index: bool,
+    reinitialize: bool,
     install: str,
     pull: bool,
     status: bool,
+    search_query: str,
+    limit: int,
+    offset: int,
     register: bool,
     unregister: bool,
     update_package_list: bool,
     verbose: bool,
 ) -> None:
     """Manage the environment"""
-
     # pylint: disable=too-many-branches
 
+    from git.exc import GitCommandError
+
+    import colrev.env.local_index
+    import colrev.env.local_index_builder
+
     if update_package_list:
         if "y" != input(
             "The following process instantiates objects listed in the "
@@ -2337,10 +2430,18 @@ def env(
         local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder(
             verbose_mode=verbose
         )
-        local_index_builder.index()
+        local_index_builder.index(reinitialize=reinitialize)
         local_index_builder.index_journal_rankings()
         return
 
+    if search_query:
+        local_index = colrev.env.local_index.LocalIndex(verbose_mode=verbose)
+        for record in local_index.fulltext_search(
+            search_query, limit=limit, offset=offset
+        ):
+            record.print_citation_format()
+        return
+
     # The following options may need a review_manager
 
     review_manager = get_review_manager(
@@ -2672,7 +2773,7 @@ def show(  # type: ignore
     callback=_validate_show,
 ) -> None:
     """Show aspects (sample, ...)"""
-
+    import colrev.ops.check
     import colrev.process.operation
     import colrev.ui_cli.show_printer
 
@@ -2801,6 +2902,7 @@ def upgrade(
     force: bool,
 ) -> None:
     """Upgrade to the latest CoLRev project version."""
+    import colrev.review_manager
 
     if disable_auto:
         review_manager = colrev.review_manager.ReviewManager(
@@ -2943,6 +3045,7 @@ def merge(
     force: bool,
 ) -> None:
     """Merge git branches."""
+    import colrev.ops.check
 
     review_manager = get_review_manager(
         ctx,
@@ -2983,6 +3086,7 @@ def undo(
     force: bool,
 ) -> None:
     """Undo operations."""
+    import colrev.ops.check
 
     review_manager = get_review_manager(
         ctx,
@@ -2,7 +2,7 @@
 """Convenience functions to write bib files"""
 from __future__ import annotations
 
-from copy import deepcopy
+import typing
 from pathlib import Path
 
 from colrev.constants import Fields
@@ -35,6 +35,7 @@ RECORDS_FIELD_ORDER = [
     Fields.URL,
     Fields.ABSTRACT,
 ]
+_ORDERED_FIELDS = set(RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE])
 
 
 def _save_field_dict(*, input_dict: dict, input_key: str) -> list:
@@ -57,20 +58,19 @@ def _save_field_dict(*, input_dict: dict, input_key: str) -> list:
 
 
 def _get_stringified_record(*, record_dict: dict) -> dict:
-    data_copy = deepcopy(record_dict)
+    # Note : a shallow copy suffices because the values are replaced (not modified)
+    data_copy = dict(record_dict)
 
     def list_to_str(*, val: list) -> str:
         return ("\n" + " " * 36).join([f.rstrip() for f in val])
 
-    for key in [Fields.ORIGIN]:
-        if key in data_copy:
-            if key in [Fields.ORIGIN]:
-                data_copy[key] = sorted(list(set(data_copy[key])))
-            for ind, val in enumerate(data_copy[key]):
-                if len(val) > 0:
-                    if val[-1] != ";":
-                        data_copy[key][ind] = val + ";"
-            data_copy[key] = list_to_str(val=data_copy[key])
+    if Fields.ORIGIN in data_copy:
+        data_copy[Fields.ORIGIN] = list_to_str(
+            val=[
+                val + ";" if len(val) > 0 and val[-1] != ";" else val
+                for val in sorted(set(data_copy[Fields.ORIGIN]))
+            ]
+        )
 
     for key in [Fields.MD_PROV, Fields.D_PROV]:
         if key in data_copy:
@@ -84,45 +84,48 @@ def _get_stringified_record(*, record_dict: dict) -> dict:
     return data_copy
 
 
-def to_string(*, records_dict: dict) -> str:
-    """Convert a records dict to a bibtex string"""
-    # Note: we need a deepcopy because the parsing modifies dicts
-    recs_dict = deepcopy(records_dict)
+def _format_field(field: str, value: str) -> str:
+    padd = " " * max(0, 28 - len(field))
+    return f",\n   {field} {padd} = {{{value}}}"
+
 
-    def format_field(field: str, value: str) -> str:
-        padd = " " * max(0, 28 - len(field))
-        return f",\n   {field} {padd} = {{{value}}}"
+def _record_to_string(record_id: str, record_dict: dict) -> str:
+    record_dict = _get_stringified_record(record_dict=record_dict)
 
-    bibtex_str = ""
-    first = True
-    for record_id, record_dict in sorted(recs_dict.items()):
-        if not first:
-            bibtex_str += "\n"
-        first = False
+    items = [f"@{record_dict[Fields.ENTRYTYPE]}{{{record_id}"]
+    for ordered_field in RECORDS_FIELD_ORDER:
+        if ordered_field in record_dict:
+            if record_dict[ordered_field] == "":
+                continue
+            items.append(_format_field(ordered_field, record_dict[ordered_field]))
 
-        bibtex_str += f"@{record_dict[Fields.ENTRYTYPE]}{{{record_id}"
+    for key in sorted(record_dict.keys()):
+        if key in _ORDERED_FIELDS:
+            continue
+        items.append(_format_field(key, record_dict[key]))
 
-        record_dict = _get_stringified_record(record_dict=record_dict)
+    items.append(",\n}\n")
+    return "".join(items)
 
-        for ordered_field in RECORDS_FIELD_ORDER:
-            if ordered_field in record_dict:
-                if record_dict[ordered_field] == "":
-                    continue
-                bibtex_str += format_field(ordered_field, record_dict[ordered_field])
 
-        for key in sorted(record_dict.keys()):
-            if key in RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE]:
-                continue
+def to_stream(*, records_dict: dict, file: typing.IO[str]) -> None:
+    """Write the records (sorted by ID) to a (text) file object, one at a time"""
 
-            bibtex_str += format_field(key, record_dict[key])
+    for i, record_id in enumerate(sorted(records_dict)):
+        if i > 0:
+            file.write("\n")
+        file.write(_record_to_string(record_id, records_dict[record_id]))
 
-        bibtex_str += ",\n}\n"
 
-    return bibtex_str
+def to_string(*, records_dict: dict) -> str:
+    """Convert a records dict to a bibtex string"""
+    return "\n".join(
+        _record_to_string(record_id, records_dict[record_id])
+        for record_id in sorted(records_dict)
+    )
 
 
 def write_file(*, records_dict: dict, filename: Path) -> None:
     """Write a bib file from a records dict"""
-    bibtexstr = to_string(records_dict=records_dict)
     with open(filename, "w", encoding="utf-8") as file:
-        file.write(bibtexstr)
+        to_stream(records_dict=records_dict, file=file)
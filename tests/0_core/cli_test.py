@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""Test the startup of the colrev command-line interface"""
+import subprocess
+import sys
+
+# Note : generous budget (import time is ~0.1s; it was ~1.4s with eager imports)
+CLI_IMPORT_TIME_BUDGET_US = 700_000
+
+
+def test_cli_import_time() -> None:
+    """Test that the CLI entry point does not import the heavy dependencies"""
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, colrev.ui_cli.cli; "
+            "print(','.join(m for m in ['pandas', 'git', 'colrev.review_manager', "
+            "'click_repl', 'requests_cache', 'pybtex'] if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+    cumulative_times = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "[us]" not in line
+    }
+    assert cumulative_times["colrev.ui_cli.cli"] < CLI_IMPORT_TIME_BUDGET_US
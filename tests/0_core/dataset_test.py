@@ -1,16 +1,22 @@
 #!/usr/bin/env python
 """Tests for the dataset"""
+import os
+import stat
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.bib
 import colrev.review_manager
+import colrev.writer.bib
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import OperationsType
 from colrev.constants import RecordState
+from colrev.writer.write_utils import to_string
 
 # flake8: noqa: E501
 
@@ -304,6 +310,222 @@ def test_get_format_report(
     }
 
 
+def test_save_records_dict_partial(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the partial save (replacing and appending records)"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records = base_repo_review_manager.dataset.load_records_dict()
+    records_file_content = base_repo_review_manager.paths.records.read_text(
+        encoding="utf-8"
+    )
+    changed_id = list(records)[0]
+    records[changed_id][Fields.TITLE] = "An updated title"
+    new_record = {
+        Fields.ID: "NewRecord2024",
+        Fields.ENTRYTYPE: "article",
+        Fields.STATUS: RecordState.md_imported,
+        Fields.TITLE: "A new record",
+    }
+    base_repo_review_manager.dataset.save_records_dict(
+        {changed_id: records[changed_id], new_record[Fields.ID]: new_record},
+        partial=True,
+    )
+
+    records[new_record[Fields.ID]] = new_record
+    saved_records = base_repo_review_manager.dataset.load_records_dict()
+    assert saved_records[changed_id][Fields.TITLE] == "An updated title"
+    assert saved_records[new_record[Fields.ID]][Fields.TITLE] == "A new record"
+    assert set(saved_records) == set(records)
+    for record_id, record_dict in records.items():
+        assert saved_records[record_id] == record_dict
+
+    # Records that did not change remain byte-identical
+    updated_content = base_repo_review_manager.paths.records.read_text(encoding="utf-8")
+    for item in records_file_content.lstrip("@").split("\n@"):
+        if item[item.find("{") + 1 : item.find(",")] != changed_id:
+            assert item in updated_content
+    assert [
+        f.name
+        for f in base_repo_review_manager.paths.records.parent.iterdir()
+        if f.name.startswith(".records.bib")
+    ] == []
+
+
+def test_save_records_dict_atomic(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test that the records file is replaced atomically"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records = base_repo_review_manager.dataset.load_records_dict()
+    records_file = base_repo_review_manager.paths.records
+    records_file_content = records_file.read_text(encoding="utf-8")
+
+    # A failure while writing does not affect the records file
+    mocker.patch("colrev.writer.bib.to_stream", side_effect=OSError)
+    with pytest.raises(OSError):
+        base_repo_review_manager.dataset.save_records_dict(records)
+    assert records_file.read_text(encoding="utf-8") == records_file_content
+    assert not [
+        f for f in records_file.parent.iterdir() if f.name.startswith(".records.bib")
+    ]
+
+    mocker.stopall()
+    base_repo_review_manager.dataset.save_records_dict(records)
+    assert records_file.read_text(encoding="utf-8") == (
+        colrev.writer.bib.to_string(records_dict=records) + "\n"
+    )
+    assert base_repo_review_manager.dataset.load_records_dict() == records
+
+    # New records files are created with the default permissions
+    records_file.unlink()
+    base_repo_review_manager.dataset.save_records_dict(records)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(records_file.stat().st_mode) == 0o666 & ~umask
+
+
+def test_load_records_dict_header_only_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test the cache of record header items"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    dataset = base_repo_review_manager.dataset
+    records_file = base_repo_review_manager.paths.records
+    expected = colrev.loader.bib.BIBLoader(
+        filename=records_file,
+        logger=base_repo_review_manager.logger,
+        unique_id_field="ID",
+    ).get_record_header_items()
+
+    get_record_header_items = mocker.spy(
+        colrev.loader.bib.BIBLoader, "get_record_header_items"
+    )
+    assert dataset.load_records_dict(header_only=True) == expected
+    assert get_record_header_items.call_count <= 1
+    get_record_header_items.reset_mock()
+
+    # Unchanged (or touched) records files are not parsed again
+    assert dataset.load_records_dict(header_only=True) == expected
+    os.utime(records_file)
+    dataset._records_header_cache = None  # pylint: disable=protected-access
+    assert dataset.load_records_dict(header_only=True) == expected
+    assert dataset.get_origin_state_dict() == {
+        origin: item[Fields.STATUS]
+        for item in expected.values()
+        for origin in item[Fields.ORIGIN]
+    }
+    assert get_record_header_items.call_count == 0
+
+    # Saving the records caches a snapshot of their header items
+    records = dataset.load_records_dict()
+    changed_id = list(records)[0]
+    records[changed_id][Fields.STATUS] = RecordState.rev_synthesized
+    dataset.save_records_dict(records)
+    records[changed_id][Fields.ORIGIN].append("modified/after_saving")
+    header_items = dataset.load_records_dict(header_only=True)
+    assert header_items[changed_id][Fields.STATUS] == RecordState.rev_synthesized
+    assert get_record_header_items.call_count == 0
+    assert (
+        header_items
+        == colrev.loader.bib.BIBLoader(
+            filename=records_file,
+            logger=base_repo_review_manager.logger,
+            unique_id_field="ID",
+        ).get_record_header_items()
+    )
+
+
+def _legacy_save_record_list_by_id(records_file: Path, record_list: list) -> None:
+    # Note : the in-place rewrite that was replaced (for the benchmark)
+    current_id_str = "NOTSET"
+    with open(records_file, "r+b") as file:
+        seekpos = file.tell()
+        line = file.readline()
+        while line:
+            if b"@" in line[:3]:
+                current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
+                current_id_str = current_id.decode("utf-8")
+            if current_id_str in [x[Fields.ID] for x in record_list]:
+                replacement = [
+                    x["record"] for x in record_list if x[Fields.ID] == current_id_str
+                ][0]
+                record_list = [x for x in record_list if x[Fields.ID] != current_id_str]
+                line = file.readline()
+                while b"@" not in line[:3] and line:
+                    line = file.readline()
+                remaining = line + file.read()
+                file.seek(seekpos)
+                file.write(replacement.encode("utf-8"))
+                seekpos = file.tell()
+                file.flush()
+                os.fsync(file)
+                file.write(remaining)
+                file.truncate()
+                file.seek(seekpos)
+            seekpos = file.tell()
+            line = file.readline()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "nr_records, nr_updated", [(1_000, 100), (5_000, 500), (10_000, 1_000)]
+)
+def test_benchmark_save_records_dict_partial(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    nr_records: int,
+    nr_updated: int,
+) -> None:
+    """Benchmark the partial save against the in-place rewrite (run with --slow)"""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records_file = base_repo_review_manager.paths.records
+    records = {
+        f"ID{i:06}": {
+            Fields.ID: f"ID{i:06}",
+            Fields.ENTRYTYPE: "article",
+            Fields.STATUS: RecordState.md_processed,
+            Fields.TITLE: f"Title of record {i}",
+            Fields.AUTHOR: "Smith, Jane and Miller, John",
+            Fields.YEAR: "2020",
+        }
+        for i in range(nr_records)
+    }
+    updated = {
+        record_id: {**records[record_id], Fields.TITLE: "An updated title"}
+        for record_id in list(records)[:: nr_records // nr_updated]
+    }
+    bib_str = to_string(records_dict=records, implementation="bib") + "\n"
+
+    records_file.write_text(bib_str, encoding="utf-8")
+    record_list = [
+        {Fields.ID: record_id, "record": "@" + item + "\n"}
+        for record_id, item in zip(
+            updated,
+            to_string(records_dict=updated, implementation="bib")[1:].split("\n@"),
+        )
+    ]
+    start = time.perf_counter()
+    _legacy_save_record_list_by_id(records_file, record_list)
+    legacy_duration = time.perf_counter() - start
+    legacy_content = records_file.read_text(encoding="utf-8")
+
+    records_file.write_text(bib_str, encoding="utf-8")
+    start = time.perf_counter()
+    base_repo_review_manager.dataset.save_records_dict(updated, partial=True)
+    duration = time.perf_counter() - start
+
+    print(
+        f"\nPartial save of {nr_updated} / {nr_records} records: "
+        f"{legacy_duration:.3f}s (in-place rewrite) -> {duration:.3f}s (splice)"
+    )
+    assert records_file.read_text(encoding="utf-8") == legacy_content
+    assert duration < legacy_duration
+
+
 def test_get_commit_message(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
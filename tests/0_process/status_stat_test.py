@@ -24,6 +24,7 @@ def compare(
             "get_active_operations",
             "get_operation_in_progress",
             "records",
+            "aggregate",
             "origin_states_dict",
         ]:
             if getattr(expected_stats, attr) != getattr(given_stats, attr):
@@ -269,3 +270,35 @@ def test_get_transitioned_records(  # type: ignore
             "type": "invalid_transition",
         }
     ]
+
+
+def test_status_aggregate_duplicated_origin() -> None:
+    """Test that origins in more than one record are counted once"""
+
+    records = {
+        "Rec1": {
+            Fields.ID: "Rec1",
+            Fields.STATUS: RecordState.md_imported,
+            Fields.ORIGIN: ["test.bib/001", "test.bib/002"],
+        },
+        "Rec2": {
+            Fields.ID: "Rec2",
+            Fields.STATUS: RecordState.md_prepared,
+            Fields.ORIGIN: ["test.bib/002"],
+        },
+    }
+    aggregate = colrev.process.status.StatusAggregate.from_records(records)
+    assert aggregate.nr_incomplete == 2
+    assert (
+        colrev.process.status.StatusAggregate.from_dict(aggregate.to_dict())
+        == aggregate
+    )
+
+    aggregate.remove(records["Rec2"])
+    assert aggregate.nr_incomplete == 2
+    aggregate.remove(records["Rec1"])
+    records["Rec1"][Fields.STATUS] = RecordState.rev_excluded
+    aggregate.add(records["Rec1"])
+    assert aggregate.nr_incomplete == 0
+    aggregate.add(records["Rec2"])
+    assert aggregate.nr_incomplete == 1
@@ -1522,3 +1522,42 @@ def test_run_quality_model_curated(  # type: ignore
     v_t_record.run_quality_model(quality_model=quality_model, set_prepared=True)
 
     assert v_t_record.data[Fields.STATUS] == RecordState.md_prepared
+
+
+def test_run_quality_model_batch(  # type: ignore
+    v_t_record: colrev.record.record.Record,
+    book_record: colrev.record.record.Record,
+    quality_model: colrev.record.qm.quality_model.QualityModel,
+) -> None:
+    """Test that the batch evaluation corresponds to the per-record evaluation"""
+
+    record_dicts = [
+        v_t_record.copy().data,
+        {**v_t_record.copy().data, Fields.ID: "R2", Fields.TITLE: "EDITORIAL"},
+        {**v_t_record.copy().data, Fields.ID: "R3", Fields.AUTHOR: "Wagner, G."},
+        {**v_t_record.copy().data, Fields.ID: "R4", Fields.ENTRYTYPE: "inproceedings"},
+        book_record.copy().data,
+    ]
+    expected_records = [colrev.record.record.Record(r).copy() for r in record_dicts]
+    for record in expected_records:
+        record.run_quality_model(quality_model, set_prepared=True)
+
+    records = [colrev.record.record.Record(r).copy() for r in record_dicts]
+    colrev.record.record.Record.run_quality_model_batch(
+        records, quality_model, set_prepared=True
+    )
+    assert [r.data for r in records] == [r.data for r in expected_records]
+    assert records[1].has_quality_defects()
+
+    # Prefetched data is used when the records are evaluated individually
+    records = [colrev.record.record.Record(r).copy() for r in record_dicts]
+    quality_model.prefetch(records=records)
+    for record in records:
+        record.run_quality_model(quality_model, set_prepared=True)
+    assert [r.data for r in records] == [r.data for r in expected_records]
+
+    assert all(
+        checker.msg in quality_model.checker_timings
+        for checker in quality_model.checkers
+        if checker.msg not in quality_model.defects_to_ignore
+    )
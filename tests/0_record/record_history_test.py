@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Tests of the (indexed) record history"""
+import colrev.loader.load_utils
+import colrev.record.record_history
+import colrev.review_manager
+from colrev.constants import OperationsType
+
+
+def test_record_history(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test the record history index"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="data_commit")
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    record_history = base_repo_review_manager.dataset.get_record_history()
+    records_file = base_repo_review_manager.paths.RECORDS_FILE_GIT
+
+    commits = record_history.get_commits()
+    assert commits
+    for commit in commits:
+        expected = colrev.loader.load_utils.loads(
+            load_string=(commit.tree / records_file).data_stream.read().decode("utf-8"),
+            implementation="bib",
+        )
+        assert record_history.load_records(commit) == expected
+        assert set(record_history.get_record_hashes(commit)) == set(expected)
+        for record_id in expected:
+            assert record_history.load_records(commit, record_ids=[record_id]) == {
+                record_id: expected[record_id]
+            }
+        assert record_history.get_record_hash(commit, "NotInCommit") is None
+
+    # Indexed blobs are not read again
+    read_blob = mocker.spy(colrev.record.record_history.RecordHistory, "_read_blob")
+    assert record_history.get_record_hashes(commits[0])
+    assert read_blob.call_count == 0
+
+    # Only record versions that changed are parsed
+    loads = mocker.spy(colrev.loader.load_utils, "loads")
+    record_id = "SrivastavaShainesh2015"
+    nr_versions = len(
+        {
+            record_history.get_record_hash(commit, record_id)
+            for commit in commits
+            if record_history.get_record_hash(commit, record_id)
+        }
+    )
+    base_repo_review_manager.get_trace_operation().main(record_id=record_id)
+    assert loads.call_count <= nr_versions < len(commits)
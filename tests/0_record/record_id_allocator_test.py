@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""Tests of the record ID allocator"""
+import itertools
+import string
+import time
+
+import pytest
+
+import colrev.record.record_id_allocator
+import colrev.record.record_id_setter
+from colrev.constants import Fields
+from colrev.constants import IDPattern
+from colrev.constants import RecordState
+
+
+def _get_unique_id_by_scan(temp_id: str, existing_ids: list) -> str:
+    # Reference: list scan over the candidates (a, b, ..., z, aa, ab, ...)
+    candidates = itertools.chain(
+        [""],
+        (
+            "".join(x)
+            for order in itertools.count(1)
+            for x in itertools.product(string.ascii_lowercase, repeat=order)
+        ),
+    )
+    for suffix in candidates:
+        if (temp_id + suffix).lower() not in [i.lower() for i in existing_ids]:
+            return temp_id + suffix
+    raise AssertionError  # pragma: no cover
+
+
+def test_suffixes() -> None:
+    """Test the suffix sequence"""
+
+    suffixes = [colrev.record.record_id_allocator.get_suffix(i) for i in range(800)]
+    assert suffixes[:3] == ["a", "b", "c"]
+    assert suffixes[25:28] == ["z", "aa", "ab"]
+    assert suffixes[701:703] == ["zz", "aaa"]
+    for index, suffix in enumerate(suffixes):
+        assert colrev.record.record_id_allocator.get_suffix_index(suffix) == index
+
+
+def test_id_allocator() -> None:
+    """Test the IDAllocator against a list scan"""
+
+    existing_ids = ["Smith2020", "smith2020a", "Smith2020c", "Doe2021", "Doea2021"]
+    id_allocator = colrev.record.record_id_allocator.IDAllocator(existing_ids)
+    assert "SMITH2020" in id_allocator
+    assert len(id_allocator) == 5
+
+    for temp_id in ["Smith2020"] * 30 + ["Doe2021", "Doe2021", "Lee2022", "Lee2022"]:
+        expected = _get_unique_id_by_scan(temp_id, existing_ids)
+        assert id_allocator.allocate(temp_id) == expected
+        existing_ids.append(expected)
+
+    # Released IDs are allocated again
+    for released_id in ["Smith2020b", "Smith2020aa", "Smith2020"]:
+        id_allocator.remove(released_id)
+        existing_ids.remove(released_id)
+    for _ in range(4):
+        expected = _get_unique_id_by_scan("Smith2020", existing_ids)
+        assert id_allocator.allocate("Smith2020") == expected
+        existing_ids.append(expected)
+
+    # IDs added twice remain taken until they are removed twice
+    id_allocator.add("Lee2022")
+    id_allocator.remove("Lee2022")
+    assert id_allocator.get_unique_id("Lee2022") == "Lee2022b"
+    id_allocator.remove("Lee2022")
+    assert id_allocator.get_unique_id("Lee2022") == "Lee2022"
+    id_allocator.remove("NotAllocated2022")
+
+
+def _get_records(nr_records: int) -> dict:
+    return {
+        f"ID{i}": {
+            Fields.ID: f"ID{i}",
+            Fields.ENTRYTYPE: "article",
+            Fields.STATUS: RecordState.md_prepared,
+            Fields.AUTHOR: f"Author{i % (nr_records // 10)}, Jane",
+            Fields.YEAR: "2020",
+        }
+        for i in range(nr_records)
+    }
+
+
+def test_set_ids_unique() -> None:
+    """Test that set_ids assigns unique IDs and is idempotent"""
+
+    id_setter = colrev.record.record_id_setter.IDSetter(
+        id_pattern=IDPattern.first_author_year, skip_local_index=True
+    )
+    records = id_setter.set_ids(_get_records(200))
+    assert len(records) == 200
+    assert all(record_id == record[Fields.ID] for record_id, record in records.items())
+    assert "Author0a2020" not in records
+    assert {"Author02020", "Author02020a", "Author02020i"} <= set(records)
+
+    assert list(id_setter.set_ids(records)) == list(records)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("nr_records", [10_000, 100_000])
+def test_set_ids_benchmark(nr_records: int) -> None:
+    """Benchmark set_ids (ID assignment is linear in the number of records)"""
+
+    id_setter = colrev.record.record_id_setter.IDSetter(
+        id_pattern=IDPattern.first_author_year, skip_local_index=True
+    )
+    records = _get_records(nr_records)
+    start = time.perf_counter()
+    records = id_setter.set_ids(records)
+    duration = time.perf_counter() - start
+    print(f"set_ids ({nr_records} records): {duration:.2f}s")
+    assert len(records) == nr_records
+    assert duration < nr_records / 1_000
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 """Tests of record merger functionality"""
+import time
+
 import pytest
 
+import colrev.record.qm.quality_model
 import colrev.record.record_merger
 import colrev.record.record_prep
 from colrev.constants import ENTRYTYPES
@@ -439,3 +442,80 @@ def test_select_container_title(default: str, candidate: str, expected: str) ->
 
     actual = colrev.record.record_merger._select_container_title(default, candidate)
     assert actual == expected
+
+
+def test_shared_quality_model(base_repo_review_manager) -> None:  # type: ignore
+    """Test that quality models are shared instead of re-instantiated"""
+
+    assert (
+        colrev.record.record_merger._get_fusion_quality_model()
+        is colrev.record.record_merger._get_fusion_quality_model()
+    )
+    assert base_repo_review_manager.get_qm() is base_repo_review_manager.get_qm()
+    assert (
+        base_repo_review_manager.get_pdf_qm() is base_repo_review_manager.get_pdf_qm()
+    )
+    assert (
+        base_repo_review_manager.get_qm() is not base_repo_review_manager.get_pdf_qm()
+    )
+
+
+def _merge_duplicates(nr_merges: int) -> None:
+    for i in range(nr_merges):
+        main_record = colrev.record.record.Record(
+            {
+                Fields.ID: f"{i}a",
+                Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+                Fields.ORIGIN: [f"md_crossref.bib/{i}"],
+                Fields.AUTHOR: "Rai, Arun",
+                Fields.TITLE: "Editorial",
+                Fields.JOURNAL: "MIS Quarterly",
+                Fields.YEAR: "2020",
+            }
+        )
+        merging_record = colrev.record.record.Record(
+            {
+                Fields.ID: f"{i}b",
+                Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+                Fields.ORIGIN: [f"md_dblp.bib/{i}"],
+                Fields.AUTHOR: "Rai, A.",
+                Fields.TITLE: "Editorial",
+                Fields.JOURNAL: "MISQ",
+                Fields.YEAR: "2020",
+                Fields.VOLUME: "44",
+                Fields.NUMBER: "1",
+            }
+        )
+        colrev.record.record_merger.merge(
+            main_record,
+            merging_record,
+            default_source="ORIGINAL",
+            preferred_masterdata_source_prefixes=[],
+        )
+
+
+@pytest.mark.slow
+def test_benchmark_merge(mocker) -> None:  # type: ignore
+    """Benchmark merges with a shared/re-instantiated quality model (run with --slow)"""
+
+    nr_merges = 200
+    _merge_duplicates(1)
+    start = time.perf_counter()
+    _merge_duplicates(nr_merges)
+    shared_duration = time.perf_counter() - start
+
+    # Previously, a QualityModel was instantiated for every fused field
+    mocker.patch.object(
+        colrev.record.record_merger,
+        "_get_fusion_quality_model",
+        side_effect=colrev.record.record_merger._get_fusion_quality_model.__wrapped__,
+    )
+    start = time.perf_counter()
+    _merge_duplicates(nr_merges)
+    legacy_duration = time.perf_counter() - start
+
+    print(
+        f"\n{nr_merges} merges: {legacy_duration:.3f}s (new QualityModel per field) "
+        f"-> {shared_duration:.3f}s (shared QualityModel)"
+    )
+    assert shared_duration < legacy_duration
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Test the DOI metadata cache"""
+import sqlite3
+from datetime import timedelta
+from pathlib import Path
+
+import colrev.env.doi_metadata_cache
+from colrev.constants import Fields
+
+
+def test_doi_metadata_cache(tmp_path) -> None:  # type: ignore
+    """Test lookups, expiry and the size cap of the DOI metadata cache"""
+
+    cache = colrev.env.doi_metadata_cache.DOIMetadataCache(
+        cache_path=tmp_path / Path("doi_metadata_cache.db"), max_entries=3
+    )
+    assert cache.get("10.1234/0") is None
+    record_dict = {Fields.DOI: "10.1234/ABC", Fields.TITLE: "Title"}
+    cache.set("10.1234/abc", record_dict)
+    # DOIs are case-insensitive
+    assert cache.get(" 10.1234/ABC") == record_dict
+
+    for i in range(5):
+        cache.set(f"10.1234/{i}", {Fields.DOI: f"10.1234/{i}"})
+    cache.prune()
+    assert cache.get("10.1234/abc") is None
+    assert cache.get("10.1234/1") is None
+    assert cache.get("10.1234/4") == {Fields.DOI: "10.1234/4"}
+    cache.close()
+
+    # Entries expire after the ttl
+    cache = colrev.env.doi_metadata_cache.DOIMetadataCache(
+        cache_path=tmp_path / Path("doi_metadata_cache.db"), ttl=timedelta(0)
+    )
+    assert cache.get("10.1234/4") is None
+    cache.close()
+
+
+def test_doi_metadata_cache_not_found(tmp_path) -> None:  # type: ignore
+    """Test that DOIs that were not found are cached with their own ttl"""
+
+    cache = colrev.env.doi_metadata_cache.DOIMetadataCache(
+        cache_path=tmp_path / Path("doi_metadata_cache.db")
+    )
+    record_dict = {Fields.DOI: "10.1234/ABC", Fields.TITLE: "Title"}
+    cache.set("10.1234/abc", record_dict)
+    cache.set_not_found("10.1234/missing")
+    assert cache.get("10.1234/missing") == {}
+    assert cache.get_many(["10.1234/abc", "10.1234/missing", "10.1234/0"]) == {
+        "10.1234/abc": record_dict,
+        "10.1234/missing": {},
+    }
+    cache.close()
+
+    # Entries of DOIs that were not found expire after the not_found_ttl
+    cache = colrev.env.doi_metadata_cache.DOIMetadataCache(
+        cache_path=tmp_path / Path("doi_metadata_cache.db"),
+        not_found_ttl=timedelta(0),
+    )
+    assert cache.get("10.1234/missing") is None
+    assert cache.get_many(["10.1234/abc", "10.1234/missing"]) == {
+        "10.1234/abc": record_dict
+    }
+    cache.prune()
+    cache.close()
+    connection = sqlite3.connect(str(tmp_path / Path("doi_metadata_cache.db")))
+    assert connection.execute("SELECT doi FROM doi_metadata").fetchall() == [
+        ("10.1234/ABC",)
+    ]
+    connection.close()
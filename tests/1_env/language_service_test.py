@@ -185,3 +185,20 @@ def test_unify_to_iso_639_3_language_codes_missing(
     R1.data.pop(Fields.LANGUAGE, None)
     language_service.unify_to_iso_639_3_language_codes(record=R1)
     # No exception should be raised
+
+
+def test_language_detector_shared(
+    language_service: colrev.env.language_service.LanguageService,
+) -> None:
+    """Test that the language detector is built once and detections are cached"""
+    other_language_service = colrev.env.language_service.LanguageService()
+    assert (
+        other_language_service._lingua_language_detector
+        is language_service._lingua_language_detector
+    )
+
+    text = "Digital work in organizations: a framework"
+    language_service.compute_language(text=text)
+    hits = colrev.env.language_service._detect_language.cache_info().hits
+    assert other_language_service.compute_language(text=text) == "eng"
+    assert colrev.env.language_service._detect_language.cache_info().hits == hits + 1
@@ -2,4 +2,393 @@
 """Test the local_index"""
 # pylint: disable=line-too-long
 # flake8: noqa: E501
-# TODO
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+
+import git
+import pytest
+
+import colrev.env.local_index_builder
+import colrev.env.local_index_sqlite
+import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
+import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import LocalIndexFields
+from colrev.constants import OperationsType
+
+
+def _populate_record_index(db_path: Path, nr_rows: int) -> None:
+    # Note : creates a table of schema version 0 (without record_json)
+    keys = [
+        key
+        for key in colrev.env.local_index_sqlite.SQLiteIndexRecord.KEYS
+        if key != LocalIndexFields.RECORD_JSON
+    ]
+    connection = sqlite3.connect(str(db_path))
+    connection.execute(
+        f"CREATE TABLE record_index (id TEXT PRIMARY KEY,{','.join(keys[1:])})"
+    )
+    rows = (
+        {
+            **{key: "" for key in keys},
+            LocalIndexFields.ID: f"{i:064x}",
+            Fields.COLREV_ID: f"colrev_id1:|a|journal|{i}|1|2020|author|title-{i}",
+            Fields.DOI: f"10.1234/{i}",
+            Fields.TITLE: f"Title {i}",
+            LocalIndexFields.DBLP_KEY: f"https://dblp.org/rec/journals/test/{i}",
+            Fields.PDF_ID: f"cpid2:{i:0128x}",
+            Fields.URL: f"https://www.test.org/{i}",
+            LocalIndexFields.BIBTEX: f"@article{{ID{i},\n   doi = {{10.1234/{i}}},\n   title = {{Title {i}}}\n}}\n",
+        }
+        for i in range(nr_rows)
+    )
+    connection.executemany(
+        f"INSERT INTO record_index VALUES(:{', :'.join(keys)})", rows
+    )
+    connection.commit()
+    connection.close()
+
+
+def test_schema_migration(tmp_path, mocker) -> None:  # type: ignore
+    """Test the in-place migration of indexes without secondary indexes"""
+
+    db_path = tmp_path / Path("sqlite_index_legacy.db")
+    mocker.patch.object(colrev.constants.Filepaths, "LOCAL_INDEX_SQLITE_FILE", db_path)
+    _populate_record_index(db_path, 100)
+
+    # Readers do not migrate the schema
+    connection_pool = colrev.env.local_index_sqlite.SQLiteConnectionPool()
+    connection = connection_pool.get_connection()
+    assert colrev.env.local_index_sqlite.get_schema_version(connection) == 0
+    assert connection_pool.outdated_schema
+
+    colrev.env.local_index_sqlite.migrate_schema(connection)
+    assert (
+        colrev.env.local_index_sqlite.get_schema_version(connection)
+        == colrev.env.local_index_sqlite.SCHEMA_VERSION
+    )
+
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        connection_pool=connection_pool
+    )
+    for key in colrev.env.local_index_sqlite.SQLiteIndexRecord.GLOBAL_KEYS:
+        query_plan = connection.execute(
+            "EXPLAIN QUERY PLAN "
+            + colrev.env.local_index_sqlite.SQLiteIndexRecord.SELECT_KEY_QUERIES[key],
+            ("test",),
+        ).fetchall()
+        assert "USING INDEX" in str(query_plan)
+
+    cur = sqlite_index_record.connection.execute(
+        colrev.env.local_index_sqlite.SQLiteIndexRecord.SELECT_KEY_QUERIES[Fields.DOI],
+        ("10.1234/42",),
+    )
+    row = cur.fetchone()
+    assert row[LocalIndexFields.ID] == f"{42:064x}"
+    # The added record_json column is set based on the bibtex
+    expected = {
+        Fields.ID: "ID42",
+        Fields.ENTRYTYPE: "article",
+        Fields.DOI: "10.1234/42",
+        Fields.TITLE: "Title 42",
+    }
+    assert (
+        colrev.env.local_index_sqlite.record_from_json(
+            row[LocalIndexFields.RECORD_JSON]
+        )
+        == expected
+    )
+    assert sqlite_index_record.get(key=Fields.DOI, value="10.1234/42") == expected
+    assert not connection.execute(
+        "SELECT id FROM record_index WHERE record_json IS NULL OR record_json = ''"
+    ).fetchall()
+    # The full-text index is created and populated from the existing rows
+    assert [r[Fields.ID] for r in sqlite_index_record.fulltext_search('"42"')] == [
+        "ID42"
+    ]
+    assert len(sqlite_index_record.fulltext_search("title", limit=10)) == 10
+    connection_pool.close_all()
+
+
+def test_record_json(local_index) -> None:  # type: ignore
+    """Test that the stored record_json corresponds to the bibtex"""
+
+    connection = sqlite3.connect(
+        str(colrev.constants.Filepaths.LOCAL_INDEX_SQLITE_FILE)
+    )
+    rows = connection.execute("SELECT bibtex, record_json FROM record_index").fetchall()
+    connection.close()
+    assert rows
+    for bibtex, record_json in rows:
+        expected = list(
+            colrev.loader.load_utils.loads(
+                load_string=bibtex, implementation="bib", unique_id_field="ID"
+            ).values()
+        )[0]
+        assert expected == colrev.env.local_index_sqlite.record_from_json(record_json)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("nr_rows", [10_000, 100_000, 1_000_000])
+def test_benchmark_lookup_latency(tmp_path, mocker, nr_rows: int) -> None:  # type: ignore
+    """Benchmark lookup latency per key (run with --slow)"""
+
+    db_path = tmp_path / Path(f"sqlite_index_{nr_rows}.db")
+    mocker.patch.object(colrev.constants.Filepaths, "LOCAL_INDEX_SQLITE_FILE", db_path)
+    _populate_record_index(db_path, nr_rows)
+
+    values = {
+        Fields.COLREV_ID: f"colrev_id1:|a|journal|{nr_rows - 1}|1|2020|author|title-{nr_rows - 1}",
+        Fields.DOI: f"10.1234/{nr_rows - 1}",
+        Fields.DBLP_KEY: f"https://dblp.org/rec/journals/test/{nr_rows - 1}",
+        Fields.PDF_ID: f"cpid2:{nr_rows - 1:0128x}",
+        Fields.URL: f"https://www.test.org/{nr_rows - 1}",
+    }
+
+    def _lookup_latency(connection: sqlite3.Connection) -> dict:
+        latencies = {}
+        for key, value in values.items():
+            query = colrev.env.local_index_sqlite.SQLiteIndexRecord.SELECT_KEY_QUERIES[
+                key
+            ]
+            start = time.perf_counter()
+            for _ in range(10):
+                assert connection.execute(query, (value,)).fetchone()
+            latencies[key] = (time.perf_counter() - start) / 10
+        return latencies
+
+    connection = sqlite3.connect(str(db_path))
+    without_index = _lookup_latency(connection)
+    colrev.env.local_index_sqlite.SQLiteIndexRecord.create_secondary_indexes(connection)
+    with_index = _lookup_latency(connection)
+    connection.close()
+
+    print(f"\nLookup latency at {nr_rows} rows (ms): full scan -> indexed")
+    for key, latency in without_index.items():
+        print(f" {key:<25} {latency * 1000:10.3f} -> {with_index[key] * 1000:8.3f}")
+        assert with_index[key] < latency
+
+
+def test_insert_many(tmp_path, mocker) -> None:  # type: ignore
+    """Test the bulk insert (and the full-text index maintained by triggers)"""
+
+    db_path = tmp_path / Path("sqlite_index_bulk.db")
+    mocker.patch.object(colrev.constants.Filepaths, "LOCAL_INDEX_SQLITE_FILE", db_path)
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord(
+        reinitialize=True
+    )
+    items = [
+        {
+            **{key: "" for key in colrev.env.local_index_sqlite.SQLiteIndexRecord.KEYS},
+            LocalIndexFields.ID: f"{i:064x}",
+            Fields.TITLE: f"Digital platform {i}",
+            LocalIndexFields.RECORD_JSON: f'{{"ID": "ID{i}", "author": "Smith, Jane"}}',
+        }
+        for i in range(10)
+    ]
+    assert sqlite_index_record.insert_many(items) == 10
+    # Records that are already in the index are ignored
+    assert sqlite_index_record.insert_many(items[:5]) == 0
+    sqlite_index_record.commit()
+    assert sqlite_index_record.get_existing_ids(
+        [f"{i:064x}" for i in range(8, 12)]
+    ) == {f"{8:064x}", f"{9:064x}"}
+
+    assert len(sqlite_index_record.fulltext_search("platform")) == 10
+    assert len(sqlite_index_record.fulltext_search("smith")) == 10
+
+    sqlite_index_record.connection.execute(
+        "DELETE FROM record_index WHERE id = ?", (f"{3:064x}",)
+    )
+    assert [r[Fields.ID] for r in sqlite_index_record.fulltext_search('"3"')] == []
+    assert len(sqlite_index_record.fulltext_search("platform")) == 9
+    sqlite_index_record.close()
+
+
+def test_incremental_index(  # type: ignore
+    tmp_path, mocker, base_repo_review_manager
+) -> None:
+    """Test that only changed repositories/records are re-indexed"""
+    # pylint: disable=protected-access
+
+    db_path = tmp_path / Path("sqlite_index_incremental.db")
+    mocker.patch.object(colrev.constants.Filepaths, "LOCAL_INDEX_SQLITE_FILE", db_path)
+    repo_source_path = base_repo_review_manager.path
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    local_index_builder.reinitialize_sqlite_db()
+
+    def _get_indexed_citation_keys() -> list:
+        connection = sqlite3.connect(str(db_path))
+        rows = connection.execute(
+            "SELECT citation_key FROM record_index WHERE repo_source_path = ?",
+            (str(repo_source_path),),
+        ).fetchall()
+        connection.close()
+        return sorted(row[0] for row in rows)
+
+    local_index_builder.index_colrev_project(repo_source_path, incremental=True)
+    indexed_citation_keys = _get_indexed_citation_keys()
+    nr_indexed_records = local_index_builder.nr_indexed_records
+    assert indexed_citation_keys
+    assert nr_indexed_records == len(indexed_citation_keys)
+
+    # Unchanged repositories are skipped
+    local_index_builder.index_colrev_project(repo_source_path, incremental=True)
+    assert local_index_builder.nr_indexed_records == nr_indexed_records
+
+    # Only the changed records are replaced
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records = base_repo_review_manager.dataset.load_records_dict()
+    changed_id = indexed_citation_keys[0]
+    records[changed_id][Fields.TITLE] = "An updated title"
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.dataset.create_commit(msg="Update title")
+    local_index_builder.index_colrev_project(repo_source_path, incremental=True)
+    assert local_index_builder.nr_indexed_records == nr_indexed_records + 1
+    assert _get_indexed_citation_keys() == indexed_citation_keys
+    sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+    assert [
+        r[Fields.ID] for r in sqlite_index_record.fulltext_search('"updated title"')
+    ] == [changed_id]
+    sqlite_index_record.close()
+
+    # Failures do not remove the records of the repository
+    records[changed_id][Fields.TITLE] = "Another updated title"
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.dataset.create_commit(msg="Update title again")
+    indexed_states = local_index_builder._get_indexed_states()
+    mocker.patch.object(
+        local_index_builder,
+        "_index_records",
+        side_effect=colrev_exceptions.CoLRevException("indexing failed"),
+    )
+    local_index_builder.index_colrev_project(repo_source_path, incremental=True)
+    local_index_builder._get_sqlite_index_record().commit()
+    assert _get_indexed_citation_keys() == indexed_citation_keys
+    # Other exceptions are raised (after rolling back the changes)
+    mocker.patch.object(
+        local_index_builder, "_index_records", side_effect=KeyError("ID")
+    )
+    with pytest.raises(KeyError):
+        local_index_builder.index_colrev_project(repo_source_path, incremental=True)
+    local_index_builder._get_sqlite_index_record().commit()
+    assert _get_indexed_citation_keys() == indexed_citation_keys
+    assert local_index_builder._get_indexed_states() == indexed_states
+
+    local_index_builder._remove_repository(str(repo_source_path))
+    local_index_builder._get_sqlite_index_record().commit()
+    assert not _get_indexed_citation_keys()
+    assert not local_index_builder._get_sqlite_index_repository().get_states()
+
+
+def test_incremental_index_curated_repository(  # type: ignore
+    tmp_path, mocker, base_repo_review_manager
+) -> None:
+    """Test that repositories sharing records (curations) are re-indexed"""
+    # pylint: disable=protected-access
+    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-statements
+
+    db_path = tmp_path / Path("sqlite_index_curation.db")
+    mocker.patch.object(colrev.constants.Filepaths, "LOCAL_INDEX_SQLITE_FILE", db_path)
+    mocker.patch("colrev.env.local_index_builder.requests_cache.CachedSession")
+
+    review_managers = {}
+    for name in ["base", "curation"]:
+        repo_path = tmp_path / Path(name)
+        shutil.copytree(base_repo_review_manager.path, repo_path)
+        git.Repo(repo_path).head.reset(
+            base_repo_review_manager.data_commit, index=True, working_tree=True
+        )
+        review_managers[name] = colrev.review_manager.ReviewManager(
+            path_str=str(repo_path)
+        )
+        review_managers[name].notified_next_operation = OperationsType.check
+
+    # The curation amends the records of the base repository (same records)
+    curation_review_manager = review_managers["curation"]
+    curation_review_manager.settings.data.data_package_endpoints.append(
+        {
+            "endpoint": "colrev.colrev_curation",
+            "curation_url": "https://github.com/test/curation",
+            "curated_masterdata": False,
+            "masterdata_restrictions": {},
+            "curated_fields": ["literature_review"],
+        }
+    )
+    curation_review_manager.save_settings()
+    records = curation_review_manager.dataset.load_records_dict()
+    for record_dict in records.values():
+        record_dict["literature_review"] = "yes"
+    curation_review_manager.dataset.save_records_dict(records)
+    curation_review_manager.dataset.create_commit(msg="Curate records")
+
+    local_index_builder = colrev.env.local_index_builder.LocalIndexBuilder()
+    mocker.patch.object(local_index_builder, "_outlets_duplicated", return_value=False)
+    mocker.patch.object(
+        local_index_builder.environment_manager,
+        "local_repos",
+        return_value=[
+            {"repo_source_path": str(review_manager.path)}
+            for review_manager in review_managers.values()
+        ],
+    )
+
+    def _get_indexed_records() -> dict:
+        connection = sqlite3.connect(str(db_path))
+        rows = connection.execute(
+            "SELECT citation_key, repo_source_path, record_json FROM record_index"
+        ).fetchall()
+        connection.close()
+        return {
+            row[0]: (
+                Path(row[1]).name,
+                colrev.env.local_index_sqlite.record_from_json(row[2]),
+            )
+            for row in rows
+        }
+
+    local_index_builder.index()
+    indexed_records = _get_indexed_records()
+    assert indexed_records
+    assert {repo for repo, _ in indexed_records.values()} == {"base"}
+    assert all(
+        record_dict["literature_review"] == "yes"
+        for _, record_dict in indexed_records.values()
+    )
+    assert all(
+        state[LocalIndexFields.SHARED_RECORDS]
+        for state in local_index_builder._get_indexed_states().values()
+    )
+
+    # Changed records of the base repository are amended by the curation
+    base_review_manager = review_managers["base"]
+    records = base_review_manager.dataset.load_records_dict()
+    changed_id = sorted(indexed_records)[0]
+    records[changed_id][Fields.ABSTRACT] = "An updated abstract"
+    base_review_manager.dataset.save_records_dict(records)
+    base_review_manager.dataset.create_commit(msg="Update abstract")
+    local_index_builder.index()
+    indexed_records = _get_indexed_records()
+    assert indexed_records[changed_id][1][Fields.ABSTRACT] == "An updated abstract"
+    assert indexed_records[changed_id][1]["literature_review"] == "yes"
+
+    # Amendments are removed when the curation changes
+    records = curation_review_manager.dataset.load_records_dict()
+    records[changed_id].pop("literature_review")
+    curation_review_manager.dataset.save_records_dict(records)
+    curation_review_manager.dataset.create_commit(msg="Remove curated field")
+    local_index_builder.index()
+    assert "literature_review" not in _get_indexed_records()[changed_id][1]
+
+    # Records that are removed from the base repository are indexed
+    # from the curation
+    records = base_review_manager.dataset.load_records_dict()
+    records.pop(changed_id)
+    base_review_manager.dataset.save_records_dict(records)
+    base_review_manager.dataset.create_commit(msg="Remove record")
+    local_index_builder.index()
+    assert _get_indexed_records()[changed_id][0] == "curation"
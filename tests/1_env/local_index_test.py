@@ -213,3 +213,47 @@ def test_search(local_index) -> None:  # type: ignore
 # but if the PDF does not exist, the field is removed
 # del record_dict[Fields.FILE]
 # and the index_tei immediately returns.
+
+
+def test_connection_reuse(local_index) -> None:  # type: ignore
+    """Test that lookups reuse the pooled connection of the thread"""
+
+    record_dict = {
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.VOLUME: "42",
+        Fields.NUMBER: "2",
+    }
+    local_index.get_year_from_toc(record_dict=record_dict)
+    stats_before = local_index.get_connection_stats()
+
+    for _ in range(5):
+        local_index.get_year_from_toc(record_dict=record_dict)
+        local_index.search(query="title LIKE '%social media%'")
+
+    stats_after = local_index.get_connection_stats()
+    assert stats_after["connections_opened"] == stats_before["connections_opened"]
+    assert stats_after["queries"] > stats_before["queries"]
+    assert stats_after["query_time"] >= stats_before["query_time"]
+
+
+def test_fulltext_search(local_index) -> None:  # type: ignore
+    """Test fulltext_search()"""
+
+    actual = local_index.fulltext_search("social media")
+    assert [r.data[Fields.ID] for r in actual] == ["AbbasZhouDengEtAl2018"]
+    assert actual == local_index.search(query="title LIKE '%social media%'")
+
+    # Matches in the author field
+    actual = local_index.fulltext_search("Leidner")
+    assert "AlaviLeidner2001" in [r.data[Fields.ID] for r in actual]
+
+    # Pagination
+    all_results = local_index.fulltext_search("research", limit=None)
+    assert len(all_results) > 1
+    first_page = local_index.fulltext_search("research", limit=1)
+    second_page = local_index.fulltext_search("research", limit=1, offset=1)
+    assert first_page + second_page == all_results[:2]
+
+    assert [] == local_index.fulltext_search("nonexistingkeyword")
+    assert [] == local_index.fulltext_search('"')
@@ -1,5 +1,17 @@
 #!/usr/bin/env python
 """Tests for the colrev package manager"""
+# pylint: disable=protected-access
+import json
+from pathlib import Path
+
+import pytest
+
+import colrev.constants
+import colrev.exceptions as colrev_exceptions
+import colrev.package_manager.package
+import colrev.package_manager.package_manager
+from colrev.constants import EndpointType
+
 # @pytest.fixture
 # def settings() -> colrev.settings.Settings:
 #     """Fixture returning a settings object"""
@@ -362,3 +374,59 @@
 #     )
 #     print(cls)
 #     raise Exception
+
+
+def test_endpoint_registry(tmp_path, mocker) -> None:  # type: ignore
+    """Test the package endpoint registry"""
+
+    registry_path = tmp_path / Path("package_endpoint_registry.json")
+    mocker.patch.object(
+        colrev.constants.Filepaths, "PACKAGE_ENDPOINT_REGISTRY_FILE", registry_path
+    )
+    mocker.patch.dict(
+        colrev.package_manager.package_manager._ENDPOINT_REGISTRY, clear=True
+    )
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+
+    expected: dict = {endpoint_type: {} for endpoint_type in EndpointType}
+    for package_dir in package_manager._get_packages_dirs():
+        try:
+            colrev.package_manager.package.Package(
+                package_dir
+            ).add_to_type_identifier_endpoint_dict(expected)
+        except colrev_exceptions.MissingDependencyError:
+            continue
+    assert package_manager.load_type_identifier_endpoint_dict() == expected
+    assert registry_path.is_file()
+
+    # The registry is loaded without parsing the pyproject.toml files of the packages
+    colrev.package_manager.package_manager._ENDPOINT_REGISTRY.clear()
+    package_init = mocker.spy(colrev.package_manager.package.Package, "__init__")
+    assert package_manager.load_type_identifier_endpoint_dict() == expected
+    assert (
+        package_manager.get_package_endpoint_class(
+            package_type=EndpointType.search_source,
+            package_identifier="colrev.crossref",
+        ).__name__
+        == "CrossrefSearchSource"
+    )
+    assert package_init.call_count == 0
+
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        package_manager.get_package_endpoint_class(
+            package_type=EndpointType.prep,
+            package_identifier="colrev.not_a_package",
+        )
+    with pytest.raises(colrev_exceptions.MissingDependencyError):
+        package_manager.get_package_endpoint_class(
+            package_type=EndpointType.review_type,
+            package_identifier="colrev.crossref",
+        )
+
+    # Changed packages invalidate the registry
+    registry = json.loads(registry_path.read_text(encoding="utf-8"))
+    registry["package_mtimes"]["crossref"] = 0
+    registry_path.write_text(json.dumps(registry), encoding="utf-8")
+    colrev.package_manager.package_manager._ENDPOINT_REGISTRY.clear()
+    assert package_manager.load_type_identifier_endpoint_dict() == expected
+    assert package_init.call_count > 0
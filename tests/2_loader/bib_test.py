@@ -1,16 +1,25 @@
 #!/usr/bin/env python
 """Tests of the load utils for bib files"""
+import io
 import logging
 import os
+import random
+import time
+import tracemalloc
 from pathlib import Path
 
+import pybtex.errors
 import pytest
+from pybtex.database.input import bibtex
 
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.bib
 import colrev.loader.load_utils
 import colrev.review_manager
 import colrev.settings
+import colrev.writer.bib
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 def test_load(tmp_path, helpers) -> None:  # type: ignore
@@ -119,3 +128,170 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
     Path("data/search/bib_data2.unkonwn").write_text("This is not a bib file.")
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.get_nr_records(Path("data/search/bib_data2.unkonwn"))
+
+
+def _get_random_records(rand: random.Random, *, tex: bool) -> dict:
+    tokens = ["Smith", "van der", "J.", "Jean-Paul", "Jr.", "Anderson", "Ø", "ß"]
+    tokens += [" and ", " AND ", ",", ", ", "  ", "\n", "\t", "\xa0", ";", "; ", "="]
+    tokens += [",\n   ", "@", "%", "others"]
+    if tex:
+        tokens += ["{", "}", "{IEEE}", "~", "\\'e", "\n}\n", " = {"]
+
+    def value() -> str:
+        return "".join(rand.choice(tokens) for _ in range(rand.randint(0, 8)))
+
+    records = {}
+    for i in range(rand.randint(1, 4)):
+        record_id = f"R{i}" + rand.choice(["", "a", "X"])
+        record_dict = {
+            Fields.ID: record_id,
+            Fields.ENTRYTYPE: rand.choice(["article", "Book", "inproceedings"]),
+            Fields.ORIGIN: [f"a.bib/{i}", f"b.bib/{rand.randint(0, 9)}"],
+            Fields.STATUS: RecordState.md_imported,
+            Fields.MD_PROV: {"title": {"source": "a.bib/1", "note": "disagreement"}},
+        }
+        for field in ["author", "editor", "title", "abstract", "doi", "Author"]:
+            if rand.random() < 0.6:
+                record_dict[field] = value()
+        records[record_id] = record_dict
+    return records
+
+
+def test_canonical_parser() -> None:
+    """Test the parser of the canonical layout against pybtex"""
+    # pylint: disable=protected-access
+
+    pybtex.errors.set_strict_mode(False)
+    rand = random.Random(0)
+    nr_canonical = 0
+    for i in range(600):
+        bib_str = colrev.writer.bib.to_string(
+            records_dict=_get_random_records(rand, tex=i % 2 == 0)
+        )
+        bib_loader = colrev.loader.bib.BIBLoader(file_object=io.StringIO(bib_str))
+        records = bib_loader._parse_canonical_records(bib_str)
+        if records is None:
+            continue
+        nr_canonical += 1
+        expected = bib_loader._parse_records_dict(
+            records_dict=bibtex.Parser().parse_string(bib_str).entries
+        )
+        assert repr(records) == repr(expected)
+    assert nr_canonical > 250
+
+    # Other layouts are loaded with pybtex
+    bib_str = "@article{ID1,\n  title = {Title},\n}\n"
+    bib_loader = colrev.loader.bib.BIBLoader(file_object=io.StringIO(bib_str))
+    assert bib_loader._parse_canonical_records(bib_str) is None
+    assert colrev.loader.load_utils.loads(
+        load_string=bib_str, implementation="bib", unique_id_field="ID"
+    ) == {"ID1": {"ID": "ID1", "ENTRYTYPE": "article", "title": "Title"}}
+
+
+def test_canonical_round_trip(helpers, tmp_path) -> None:  # type: ignore
+    """Test loading records.bib files written by colrev.writer.bib"""
+    # pylint: disable=protected-access
+    os.chdir(tmp_path)
+    helpers.retrieve_test_file(
+        source=Path("data/dedupe/records.bib"), target=Path("dedupe.bib")
+    )
+    records = colrev.loader.load_utils.load(
+        filename=Path("dedupe.bib"), unique_id_field="ID"
+    )
+    colrev.writer.bib.write_file(records_dict=records, filename=Path("records.bib"))
+    bib_loader = colrev.loader.bib.BIBLoader(filename=Path("records.bib"))
+    assert (
+        bib_loader._parse_canonical_records(
+            Path("records.bib").read_text(encoding="utf-8")
+        )
+        is not None
+    )
+    assert (
+        colrev.loader.load_utils.load(
+            filename=Path("records.bib"), unique_id_field="ID"
+        )
+        == records
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("nr_records", [10_000, 100_000])
+def test_canonical_parser_benchmark(  # type: ignore
+    helpers, tmp_path, nr_records: int
+) -> None:
+    """Benchmark loading records.bib files (canonical layout)"""
+    os.chdir(tmp_path)
+    helpers.retrieve_test_file(
+        source=Path("data/dedupe/records.bib"), target=Path("dedupe.bib")
+    )
+    record_list = list(
+        colrev.loader.load_utils.load(
+            filename=Path("dedupe.bib"), unique_id_field="ID"
+        ).values()
+    )
+    records = {}
+    for i in range(nr_records):
+        record_dict = {**record_list[i % len(record_list)], Fields.ID: f"R{i:07d}"}
+        record_dict[Fields.ORIGIN] = [f"a.bib/{i}", f"b.bib/{i}"]
+        records[record_dict[Fields.ID]] = record_dict
+    colrev.writer.bib.write_file(records_dict=records, filename=Path("records.bib"))
+
+    start = time.perf_counter()
+    loaded_records = colrev.loader.load_utils.load(
+        filename=Path("records.bib"), unique_id_field="ID"
+    )
+    duration = time.perf_counter() - start
+    print(f"load records.bib ({nr_records} records): {duration:.2f}s")
+    assert len(loaded_records) == nr_records
+    assert duration < nr_records / 5_000
+
+
+def test_writer() -> None:
+    """Test that the bib writer does not modify the records"""
+
+    records = _get_random_records(random.Random(1), tex=False)
+    records_copy = {
+        record_id: {**record_dict, Fields.ORIGIN: list(record_dict[Fields.ORIGIN])}
+        for record_id, record_dict in records.items()
+    }
+    bib_str = colrev.writer.bib.to_string(records_dict=records)
+    assert repr(records) == repr(records_copy)
+
+    file = io.StringIO()
+    colrev.writer.bib.to_stream(records_dict=records, file=file)
+    assert file.getvalue() == bib_str
+    assert bib_str.count("\n@") == len(records) - 1
+    assert colrev.writer.bib.to_string(records_dict={}) == ""
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("nr_records", [10_000, 100_000])
+def test_writer_benchmark(tmp_path, nr_records: int) -> None:  # type: ignore
+    """Benchmark writing records.bib files (time and peak memory)"""
+    os.chdir(tmp_path)
+    records = {
+        f"R{i:07d}": {
+            Fields.ID: f"R{i:07d}",
+            Fields.ENTRYTYPE: "article",
+            Fields.STATUS: RecordState.md_processed,
+            Fields.ORIGIN: [f"a.bib/{i}", f"b.bib/{i}"],
+            Fields.MD_PROV: {Fields.TITLE: {"source": f"a.bib/{i}", "note": ""}},
+            Fields.TITLE: f"Title of record {i}",
+            Fields.AUTHOR: "Smith, Jane and Miller, John",
+            Fields.YEAR: "2020",
+        }
+        for i in range(nr_records)
+    }
+    tracemalloc.start()
+    start = time.perf_counter()
+    colrev.writer.bib.write_file(records_dict=records, filename=Path("records.bib"))
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = Path("records.bib").stat().st_size
+    print(
+        f"write records.bib ({nr_records} records): {duration:.2f}s, "
+        f"peak memory {peak / 2**20:.1f} MiB (file size {size / 2**20:.1f} MiB)"
+    )
+    # The file is written one record at a time
+    assert peak < size / 10
@@ -2,6 +2,7 @@
 """Tests of the load utils for bib files"""
 import logging
 import os
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ import pytest
 import colrev.loader.load_utils
 import colrev.review_manager
 import colrev.settings
+from colrev.constants import Fields
 
 
 def test_load(tmp_path, helpers) -> None:  # type: ignore
@@ -47,3 +49,37 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
 
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.loads(load_string="content...", implementation="xy")
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["bib_data.bib", "csv_data.csv", "ris_data.ris", "enl_data.enl", "nbib_data.nbib"],
+)
+def test_loads_in_memory(tmp_path, helpers, monkeypatch, filename) -> None:  # type: ignore
+    """Test that loads does not create (temporary) files"""
+    os.chdir(tmp_path)
+    helpers.retrieve_test_file(
+        source=Path(f"2_loader/data/{filename}"), target=Path(filename)
+    )
+
+    def entrytype_setter(record_dict: dict) -> None:
+        record_dict.setdefault(Fields.ENTRYTYPE, "misc")
+
+    load_kwargs = {
+        "entrytype_setter": entrytype_setter,
+        "unique_id_field": "ID" if filename.endswith(".bib") else "INCREMENTAL",
+    }
+    expected = colrev.loader.load_utils.load(filename=Path(filename), **load_kwargs)
+
+    temp_dir = tmp_path / "temp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+    files_before = set(tmp_path.rglob("*"))
+
+    records = colrev.loader.load_utils.loads(
+        load_string=Path(filename).read_text(encoding="utf-8"),
+        implementation=Path(filename).suffix[1:],
+        **load_kwargs,
+    )
+    assert repr(records) == repr(expected)
+    assert set(tmp_path.rglob("*")) == files_before
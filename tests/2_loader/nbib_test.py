@@ -116,3 +116,17 @@ def test_load_nbib_entries(tmp_path, helpers):  # type: ignore
     assert entries["000001"][Fields.ABSTRACT] == "Abstract ..."
     assert entries["000001"][Fields.ISSN] == "ISSN-1234-4567"
     assert entries["000001"][Fields.LANGUAGE] == "English"
+
+
+def test_load_nbib_without_trailing_newline() -> None:
+    """Test that the last record is loaded if the file does not end with a newline"""
+
+    nbib_str = "TI  - First title\nDP  - 2020\n\nTI  - Second title\nDP  - 2021"
+    records = colrev.loader.load_utils.loads(
+        load_string=nbib_str,
+        implementation="nbib",
+        unique_id_field="INCREMENTAL",
+        entrytype_setter=lambda x: x.update({Fields.ENTRYTYPE: ENTRYTYPES.MISC}),
+    )
+    assert records["000002"]["TI"] == "Second title"
+    assert records["000002"]["DP"] == "2021"
@@ -1,11 +1,18 @@
 #!/usr/bin/env python
 """Tests of the load utils for ris files"""
+import io
 import os
+import subprocess
+import sys
+import tracemalloc
 from pathlib import Path
 
 import pytest
 
 import colrev.loader.load_utils
+import colrev.loader.loader
+import colrev.loader.ris
+from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 
 
@@ -109,3 +116,129 @@ def test_load_ris_entries(tmp_path, helpers):  # type: ignore
 
     nr_records = colrev.loader.load_utils.get_nr_records(Path("ris_data.ris"))
     assert 2 == nr_records
+
+
+def _get_ris_string(nr_records: int) -> str:
+    return "".join(
+        f"TY  - JOUR\nAU  - Smith, Jane\nAU  - Miller, John\n"
+        f"TI  - Title of record {i}\nPY  - 2020\nDO  - 10.1234/{i}\nER  - \n\n"
+        for i in range(nr_records)
+    )
+
+
+def test_load_ris_batches(mocker) -> None:  # type: ignore
+    """Test that the records are loaded in batches"""
+
+    def entrytype_setter(record_dict: dict) -> None:
+        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.ARTICLE
+
+    ris_str = _get_ris_string(25)
+    loader = colrev.loader.ris.RISLoader(
+        file_object=io.StringIO("Provider: JSTOR http://www.jstor.org\n\n" + ris_str),
+        unique_id_field="INCREMENTAL",
+        entrytype_setter=entrytype_setter,
+        field_mapper=lambda x: x,
+        id_labeler=lambda x: x,
+    )
+    records = loader.iter_records()
+    assert next(records) == {
+        "TY": "JOUR",
+        "AU": ["Smith, Jane", "Miller, John"],
+        "TI": "Title of record 0",
+        "PY": "2020",
+        "DO": "10.1234/0",
+        "ER": "",
+    }
+
+    expected = colrev.loader.load_utils.loads(
+        load_string=ris_str,
+        implementation="ris",
+        unique_id_field="INCREMENTAL",
+        entrytype_setter=entrytype_setter,
+    )
+    mocker.patch.object(colrev.loader.loader.Loader, "BATCH_SIZE", 7)
+    assert (
+        colrev.loader.load_utils.loads(
+            load_string=ris_str,
+            implementation="ris",
+            unique_id_field="INCREMENTAL",
+            entrytype_setter=entrytype_setter,
+        )
+        == expected
+    )
+    assert list(expected) == [str(i).zfill(6) for i in range(1, 26)]
+
+    # The id_labeler is called once (with all records)
+    id_labeler = mocker.Mock(
+        side_effect=lambda records_list: [
+            record_dict.update(ID=f"ID{i}")
+            for i, record_dict in enumerate(records_list)
+        ]
+    )
+    assert list(
+        colrev.loader.load_utils.loads(
+            load_string=ris_str,
+            implementation="ris",
+            id_labeler=id_labeler,
+            entrytype_setter=entrytype_setter,
+        )
+    ) == [f"ID{i}" for i in range(25)]
+    id_labeler.assert_called_once()
+
+    # IDs must be unique across batches
+    with pytest.raises(AssertionError):
+        colrev.loader.load_utils.loads(
+            load_string=ris_str + ris_str.split("\n\n", maxsplit=1)[0],
+            implementation="ris",
+            unique_id_field="DO",
+            entrytype_setter=entrytype_setter,
+        )
+
+
+@pytest.mark.slow
+def test_load_ris_benchmark(tmp_path) -> None:  # type: ignore
+    """Benchmark loading a large ris file (500k records, peak memory)"""
+    os.chdir(tmp_path)
+    nr_records = 500_000
+    with open("large.ris", "w", encoding="utf-8") as file:
+        for start in range(0, nr_records, 10_000):
+            file.write(_get_ris_string(10_000).replace("10.1234/", f"10.1234/{start}-"))
+
+    # The records are parsed one line at a time
+    tracemalloc.start()
+    loader = colrev.loader.ris.RISLoader(
+        filename=Path("large.ris"),
+        unique_id_field="DO",
+        entrytype_setter=lambda x: x,
+        field_mapper=lambda x: x,
+        id_labeler=lambda x: x,
+    )
+    assert sum(1 for _ in loader.iter_records()) == nr_records
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 2**20
+
+    # Peak RSS of loading the records dict (in a separate process)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import resource, time; from pathlib import Path; "
+            "import colrev.loader.load_utils; start = time.perf_counter(); "
+            "records = colrev.loader.load_utils.load(filename=Path('large.ris'), "
+            "unique_id_field='DO', "
+            "entrytype_setter=lambda r: r.update(ENTRYTYPE='article')); "
+            "print(len(records), time.perf_counter() - start, "
+            "resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    nr_loaded, duration, max_rss_kib = result.stdout.split()
+    print(
+        f"load large.ris ({nr_records} records, "
+        f"{Path('large.ris').stat().st_size / 2**20:.0f} MiB): "
+        f"{float(duration):.1f}s, peak RSS {int(max_rss_kib) / 2**10:.0f} MiB"
+    )
+    assert int(nr_loaded) == nr_records
@@ -1,7 +1,10 @@
 import pytest
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.bib
+import colrev.loader.load_utils
 import colrev.ops.check
+import colrev.process.status
 from colrev.ops.commit import Commit
 
 
@@ -58,3 +61,26 @@ def test_create(commit_fixture, mocker):  # type: ignore
     commit_fixture.review_manager.force_mode = False
     commit_fixture.review_manager.force_mode = True
     commit_fixture.create()
+
+
+def test_create_single_snapshot(commit_fixture, mocker):  # type: ignore
+    """Test that a commit computes the status statistics once (without parsing)"""
+
+    review_manager = commit_fixture.review_manager
+    colrev.ops.check.CheckOperation(review_manager)
+    records = review_manager.dataset.load_records_dict()
+    records["SrivastavaShainesh2015"]["title"] = "test3"
+    review_manager.dataset.save_records_dict(records)
+
+    status_stats = mocker.spy(colrev.process.status.StatusStats, "__init__")
+    load = mocker.spy(colrev.loader.load_utils, "load")
+    get_record_header_items = mocker.spy(
+        colrev.loader.bib.BIBLoader, "get_record_header_items"
+    )
+    commit_fixture.skip_hooks = True
+    assert commit_fixture.create()
+
+    assert status_stats.call_count == 1
+    assert load.call_count == 0
+    assert get_record_header_items.call_count == 0
+    assert "Test commit" in review_manager.dataset.get_commit_message(commit_nr=0)
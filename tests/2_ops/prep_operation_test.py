@@ -1,6 +1,18 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prep operation"""
+import time
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
+import colrev.packages.crossref.src.crossref_search_source
+import colrev.record.record_prep
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import OperationsType
 
 
 def test_prep(  # type: ignore
@@ -46,3 +58,104 @@ def test_prep_with_polish_flag(  # type: ignore
     prep_operation.main()
 
     # Assertions can be added here based on expected outcomes
+
+
+def test_prep_process_engine(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the prep operation with the process engine"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+    prep_operation.main(keep_ids=True)
+    expected = base_repo_review_manager.paths.records.read_text(encoding="utf-8")
+
+    helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation(
+        cpu=2, engine="process"
+    )
+    prep_operation.main(keep_ids=True)
+    assert (
+        base_repo_review_manager.paths.records.read_text(encoding="utf-8") == expected
+    )
+    assert not prep_operation.current_temp_records.is_file()
+
+
+def test_prep_invalid_engine(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test prep with an invalid engine"""
+
+    with pytest.raises(colrev_exceptions.ParameterError):
+        base_repo_review_manager.get_prep_operation(engine="gpu")
+
+
+def test_prep_process_engine_feed(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test that the process engine does not lose records of the prep feeds"""
+
+    def crossref_query(**kwargs) -> list:  # type: ignore
+        record = kwargs["record_input"]
+        retrieved_record = colrev.record.record_prep.PrepRecord(
+            {
+                Fields.ID: record.data[Fields.ID],
+                Fields.ENTRYTYPE: record.data[Fields.ENTRYTYPE],
+                Fields.DOI: f"10.1234/{record.data[Fields.ID]}".upper(),
+                Fields.TITLE: record.data.get(Fields.TITLE, ""),
+                Fields.AUTHOR: record.data.get(Fields.AUTHOR, ""),
+                Fields.YEAR: record.data.get(Fields.YEAR, ""),
+            }
+        )
+        # Note : concurrent updates of the feed are more likely
+        time.sleep(0.05)
+        return [retrieved_record]
+
+    crossref_search_source = (
+        colrev.packages.crossref.src.crossref_search_source.CrossrefSearchSource
+    )
+    mocker.patch.object(crossref_search_source, "check_availability")
+    mocker.patch.object(
+        crossref_search_source,
+        "query_doi_cached",
+        side_effect=colrev_exceptions.RecordNotFoundInPrepSourceException(msg=""),
+    )
+    mocker.patch.object(
+        crossref_search_source, "crossref_query", side_effect=crossref_query
+    )
+    mocker.patch(
+        "colrev.record.record_similarity.matches",
+        return_value=True,
+    )
+
+    helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    base_repo_review_manager.settings.prep.prep_rounds[0].prep_package_endpoints = [
+        {"endpoint": "colrev.crossref"},
+    ]
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    record_dict = list(base_repo_review_manager.dataset.load_records_dict().values())[0]
+    records = {}
+    for i in range(40):
+        record_id = f"Record{i:02}"
+        records[record_id] = {
+            **deepcopy(record_dict),
+            Fields.ID: record_id,
+            Fields.TITLE: f"{record_dict[Fields.TITLE]} {i}",
+            Fields.ORIGIN: [f"test.bib/{i:06}"],
+        }
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.dataset.create_commit(msg="Add records")
+    prep_operation = base_repo_review_manager.get_prep_operation(
+        cpu=4, engine="process"
+    )
+    prep_operation.main(keep_ids=True)
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    feed_records = colrev.loader.load_utils.load(
+        filename=base_repo_review_manager.path / Path("data/search/md_crossref.bib"),
+        logger=base_repo_review_manager.logger,
+    )
+    assert len(feed_records) == len(records)
+    feed_origins = {f"md_crossref.bib/{feed_id}" for feed_id in feed_records}
+    for record_dict in records.values():
+        assert any(origin in feed_origins for origin in record_dict[Fields.ORIGIN])
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import logging
+import time
 import typing
 from copy import deepcopy
 from pathlib import Path
 
 import pytest
 
+import colrev.exceptions
 import colrev.record.record
 import colrev.review_manager
 import colrev.settings
@@ -493,3 +495,169 @@ def test_search_feed_prep_mode(search_feed, caplog) -> None:  # type: ignore
     )
     assert record_dict[Fields.ORIGIN] == ["test.bib/000001"]
     search_feed.prep_mode = False
+
+
+def test_search_feed_indexes(search_feed) -> None:  # type: ignore
+    """Test the lookups of feed records and main records (hash-indexed)"""
+    # pylint: disable=protected-access
+
+    for i, file in enumerate(["data/pdfs/a.pdf", "data/pdfs/b.pdf", "data/pdfs/c.pdf"]):
+        search_feed.add_update_record(
+            retrieved_record=colrev.record.record.Record(
+                {
+                    Fields.ID: "0001",
+                    Fields.ENTRYTYPE: "article",
+                    Fields.DOI: f"10.111/{i}",
+                    Fields.FILE: file,
+                    "md_string": "same" if i < 2 else "other",
+                }
+            )
+        )
+    assert [
+        r[Fields.ID]
+        for r in search_feed.get_feed_records(
+            key=Fields.FILE, value=Path("data/pdfs/b.pdf")
+        )
+    ] == ["000002"]
+    assert [
+        r[Fields.ID]
+        for r in search_feed.get_feed_records(key="md_string", value="same")
+    ] == ["000001", "000002"]
+
+    # Updated feed records are reindexed
+    search_feed.add_update_record(
+        retrieved_record=colrev.record.record.Record(
+            {
+                Fields.ID: "0001",
+                Fields.ENTRYTYPE: "article",
+                Fields.DOI: "10.111/1",
+                Fields.FILE: "data/pdfs/d.pdf",
+                "md_string": "other",
+            }
+        )
+    )
+    assert not search_feed.get_feed_records(key=Fields.FILE, value="data/pdfs/b.pdf")
+    assert search_feed.get_feed_records(key=Fields.FILE, value="data/pdfs/d.pdf")
+    assert len(search_feed.get_feed_records(key="md_string", value="other")) == 2
+
+    # Feed records can be modified directly
+    search_feed.feed_records["000001"].pop("md_string")
+    assert not search_feed.get_feed_records(key="md_string", value="same")
+    search_feed.feed_records["000003"][Fields.FILE] = "data/pdfs/e.pdf"
+    search_feed.save()
+    assert search_feed.get_feed_records(key=Fields.FILE, value="data/pdfs/e.pdf")
+
+    # Main records are retrieved based on their origins
+    search_feed.records = {
+        "Rec1": {Fields.ID: "Rec1", Fields.ORIGIN: ["test.bib/000001", "x.bib/1"]},
+        "Rec2": {Fields.ID: "Rec2", Fields.ORIGIN: ["test.bib/000002"]},
+    }
+    assert search_feed._get_main_record("test.bib/000002").data[Fields.ID] == "Rec2"
+    search_feed.records["Rec3"] = {
+        Fields.ID: "Rec3",
+        Fields.ORIGIN: ["test.bib/000003"],
+    }
+    assert search_feed._get_main_record("test.bib/000003").data[Fields.ID] == "Rec3"
+    # Misses on an up-to-date index are not found (without rebuilding the index)
+    with pytest.raises(colrev.exceptions.RecordNotFoundException):
+        search_feed._get_main_record("test.bib/000004")
+    # Origins that moved to another record (e.g., merged) are found
+    # when the records are set
+    search_feed.records["Rec1"][Fields.ORIGIN].append("test.bib/000004")
+    search_feed.records["Rec3"][Fields.ORIGIN] = ["test.bib/000003", "x.bib/3"]
+    search_feed.records = search_feed.records
+    assert search_feed._get_main_record("x.bib/3").data[Fields.ID] == "Rec3"
+    assert search_feed._get_main_record("test.bib/000004").data[Fields.ID] == "Rec1"
+    # Outdated hits are not returned
+    search_feed.records["Rec2"][Fields.ORIGIN] = ["x.bib/2"]
+    with pytest.raises(colrev.exceptions.RecordNotFoundException):
+        search_feed._get_main_record("test.bib/000002")
+    # Records replaced in place (the same number of records) are found
+    search_feed.records.pop("Rec3")
+    search_feed.records["Rec4"] = {
+        Fields.ID: "Rec4",
+        Fields.ORIGIN: ["test.bib/000005"],
+    }
+    search_feed.records = search_feed.records
+    assert search_feed._get_main_record("test.bib/000005").data[Fields.ID] == "Rec4"
+
+
+@pytest.mark.slow
+def test_search_feed_rerun_benchmark(search_feed) -> None:  # type: ignore
+    """Benchmark rerunning a search with a large feed (50k records)"""
+    # pylint: disable=protected-access
+
+    nr_records = 50_000
+    record_dicts = [
+        {
+            Fields.ID: f"{i + 1:06}",
+            Fields.ENTRYTYPE: "article",
+            Fields.TITLE: f"Title of record {i}",
+            Fields.AUTHOR: "Smith, Jane and Miller, John",
+            Fields.YEAR: "2020",
+            Fields.DOI: f"10.111/{i}",
+            Fields.FILE: f"data/pdfs/{i}.pdf",
+        }
+        for i in range(nr_records)
+    ]
+    search_feed.feed_records = {r[Fields.ID]: deepcopy(r) for r in record_dicts}
+    search_feed._available_ids = {r[Fields.DOI]: r[Fields.ID] for r in record_dicts}
+    search_feed._next_incremental_id = nr_records + 1
+    search_feed.records = {
+        f"Rec{r[Fields.ID]}": {
+            **deepcopy(r),
+            Fields.ID: f"Rec{r[Fields.ID]}",
+            Fields.ORIGIN: [f"test.bib/{r[Fields.ID]}"],
+        }
+        for r in record_dicts
+    }
+
+    start = time.perf_counter()
+    for record_dict in reversed(record_dicts):
+        assert search_feed.get_feed_records(
+            key=Fields.FILE, value=record_dict[Fields.FILE]
+        )
+        search_feed.add_update_record(
+            retrieved_record=colrev.record.record.Record(deepcopy(record_dict))
+        )
+    duration = time.perf_counter() - start
+    print(f"Rerun with {nr_records} feed records: {duration:.1f}s")
+    assert len(search_feed.feed_records) == nr_records
+    assert duration < nr_records / 500
+
+
+@pytest.mark.slow
+def test_search_feed_rerun_new_records_benchmark(search_feed) -> None:  # type: ignore
+    """Benchmark rerunning a search that retrieves new records (30k main records)"""
+    # pylint: disable=protected-access
+
+    nr_records, nr_new_records = 30_000, 1_000
+    search_feed.records = {
+        f"Rec{i:06}": {
+            Fields.ID: f"Rec{i:06}",
+            Fields.ENTRYTYPE: "article",
+            Fields.TITLE: f"Title of record {i}",
+            Fields.ORIGIN: [f"other.bib/{i:06}"],
+        }
+        for i in range(nr_records)
+    }
+
+    start = time.perf_counter()
+    for i in range(nr_new_records):
+        search_feed.add_update_record(
+            retrieved_record=colrev.record.record.Record(
+                {
+                    Fields.ID: "new",
+                    Fields.ENTRYTYPE: "article",
+                    Fields.TITLE: f"Title of new record {i}",
+                    Fields.AUTHOR: "Smith, Jane",
+                    Fields.YEAR: "2020",
+                    Fields.DOI: f"10.222/{i}",
+                }
+            )
+        )
+    duration = time.perf_counter() - start
+    print(f"Rerun adding {nr_new_records} records: {duration:.1f}s")
+    assert search_feed._nr_added == nr_new_records
+    assert len(search_feed.records) == nr_records
+    assert duration < nr_new_records / 250
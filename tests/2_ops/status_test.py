@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 """Tests of the CoLRev status operation"""
+import csv
 from pathlib import Path
 
+import colrev.loader.bib
 import colrev.ops.check
+import colrev.ops.status
+import colrev.process.status
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 def test_get_analytics(  # type: ignore
@@ -64,6 +70,40 @@ def test_get_analytics(  # type: ignore
     }
 
 
+def test_get_analytics_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    helpers,
+    mocker,
+    tmp_path,
+) -> None:
+    """Test the cache of the status analytics and the timeline export"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="dedupe_commit")
+
+    status_operation = base_repo_review_manager.get_status_operation()
+    expected = status_operation.get_analytics()
+
+    # Only the status files of commits that are not cached are read
+    get_analytics_entry = mocker.spy(colrev.ops.status.Status, "_get_analytics_entry")
+    assert status_operation.get_analytics() == expected
+    assert get_analytics_entry.call_count == 0
+
+    helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    analytics = status_operation.get_analytics()
+    assert get_analytics_entry.call_count == 0
+    assert list(analytics) == [3, 2, 1]
+    assert analytics[3] == expected[3]
+
+    timeline_path = tmp_path / Path("timeline.csv")
+    status_operation.export_analytics(timeline_path)
+    with open(timeline_path, encoding="utf-8") as file:
+        timeline = list(csv.DictReader(file))
+    assert [row["commit_id"] for row in timeline] == [
+        analytics[i]["commit_id"] for i in [1, 2, 3]
+    ]
+    assert timeline[-1]["completed_atomic_steps"] == "2"
+
+
 def test_status_stats(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
 ) -> None:
@@ -74,6 +114,71 @@ def test_status_stats(  # type: ignore
     print(status_stats)
     assert status_stats.atomic_steps == 9
 
+    # The status statistics based on the record header items are identical
+    header_status_stats = base_repo_review_manager.get_status_stats()
+    for attribute in ["overall", "currently", "completeness_condition", "atomic_steps"]:
+        assert getattr(header_status_stats, attribute) == getattr(
+            status_stats, attribute
+        )
+    assert header_status_stats.nr_curated_records == status_stats.nr_curated_records
+    assert header_status_stats.screening_statistics == status_stats.screening_statistics
+
+
+def test_status_aggregate(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test the incremental updates of the status aggregate"""
+
+    colrev.ops.check.CheckOperation(base_repo_review_manager)
+    dataset = base_repo_review_manager.dataset
+    status_operation = base_repo_review_manager.get_status_operation()
+    assert status_operation.verify_status_aggregate() == []
+
+    # Partial saves update the status aggregate (without parsing the records file)
+    records = dataset.load_records_dict()
+    changed_id = list(records)[0]
+    records[changed_id][Fields.STATUS] = RecordState.rev_excluded
+    records[changed_id][Fields.SCREENING_CRITERIA] = "focus=out"
+    new_record = {
+        **records[changed_id],
+        Fields.ID: "NewRecord2024",
+        Fields.ORIGIN: ["test.bib/001", "test.bib/002"],
+        Fields.STATUS: RecordState.md_imported,
+    }
+    new_record.pop(Fields.SCREENING_CRITERIA)
+    assert dataset.get_status_aggregate()
+    get_record_header_items = mocker.spy(
+        colrev.loader.bib.BIBLoader, "get_record_header_items"
+    )
+    dataset.save_records_dict(
+        {changed_id: records[changed_id], "NewRecord2024": new_record}, partial=True
+    )
+    aggregate = dataset.get_status_aggregate()
+    assert get_record_header_items.call_count == 0
+    assert aggregate == colrev.process.status.StatusAggregate.from_records(
+        dataset.load_records_dict()
+    )
+    assert aggregate.state_counts[RecordState.rev_excluded] == 1
+    assert aggregate.screening_exclusions == {"focus": 1}
+    assert aggregate.md_duplicates_removed == 1
+    assert status_operation.verify_status_aggregate() == []
+
+    # Inconsistencies are reported (and the aggregate is recomputed)
+    aggregate.remove(new_record)
+    aggregate_dict = aggregate.to_dict()
+    # pylint: disable=protected-access
+    dataset._records_header_cache["status_aggregate"] = aggregate_dict
+    assert status_operation.verify_status_aggregate() == [
+        "nr_records: 1 (expected: 2)",
+        "state_counts: {'rev_excluded': 1} "
+        "(expected: {'md_imported': 1, 'rev_excluded': 1})",
+        "nr_origins: 1 (expected: 3)",
+        "md_duplicates_removed: 0 (expected: 1)",
+        "nr_incomplete: 0 (expected: 2)",
+        "incomplete_origins: {} (expected: {'test.bib/001': 1, 'test.bib/002': 1})",
+    ]
+    assert status_operation.verify_status_aggregate() == []
+
 
 def test_get_review_status_report(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
@@ -3,8 +3,10 @@
 from pathlib import Path
 
 import pytest
+import requests
 import requests_mock
 
+import colrev.exceptions as colrev_exceptions
 import colrev.ops.prep
 import colrev.packages.crossref.src.crossref_search_source
 from colrev.constants import SearchType
@@ -160,3 +162,61 @@ def test_crossref_query(  # type: ignore
         expected = colrev.record.record_prep.PrepRecord(expected_dict)
 
         assert actual.data == expected.data
+
+
+def test_crossref_query_doi_cached(  # type: ignore
+    crossref_search_source: colrev.packages.crossref.src.crossref_search_source.CrossrefSearchSource,
+    mocker,
+) -> None:
+    """Test the crossref query_doi_cached()"""
+    etiquette = crossref_search_source.get_etiquette()
+    doi = "10.1177/02683962211048201"
+    query_doi = mocker.patch.object(
+        colrev.packages.crossref.src.crossref_search_source.CrossrefSearchSource,
+        "query_doi",
+        return_value=colrev.record.record_prep.PrepRecord(
+            {"ENTRYTYPE": "article", "doi": doi, "title": "Artificial intelligence"}
+        ),
+    )
+
+    actual = crossref_search_source.query_doi_cached(doi=doi, etiquette=etiquette)
+    assert actual.data["title"] == "Artificial intelligence"
+    actual = crossref_search_source.query_doi_cached(doi=doi, etiquette=etiquette)
+    assert actual.data["title"] == "Artificial intelligence"
+    assert query_doi.call_count == 1
+
+    # In offline mode, only cached records are returned
+    actual = crossref_search_source.query_doi_cached(
+        doi=doi, etiquette=etiquette, offline=True
+    )
+    assert actual.data["doi"] == doi
+    with pytest.raises(colrev_exceptions.RecordNotFoundInPrepSourceException):
+        crossref_search_source.query_doi_cached(
+            doi="10.1234/not-cached", etiquette=etiquette, offline=True
+        )
+    assert query_doi.call_count == 1
+
+    # DOIs that were not found are cached (failed requests are not)
+    query_doi.side_effect = colrev_exceptions.RecordNotFoundInPrepSourceException(
+        msg="Record not found in crossref (based on doi)"
+    )
+    for _ in range(2):
+        with pytest.raises(colrev_exceptions.RecordNotFoundInPrepSourceException):
+            crossref_search_source.query_doi_cached(
+                doi="10.1234/not-found", etiquette=etiquette
+            )
+    assert query_doi.call_count == 2
+    assert not crossref_search_source.get_cached_doi_records(dois=["10.1234/not-found"])
+
+    def _raise_request_failure(**kwargs):  # type: ignore
+        raise colrev_exceptions.RecordNotFoundInPrepSourceException(
+            msg="Record not found in crossref (based on doi)"
+        ) from requests.exceptions.Timeout()
+
+    query_doi.side_effect = _raise_request_failure
+    for _ in range(2):
+        with pytest.raises(colrev_exceptions.RecordNotFoundInPrepSourceException):
+            crossref_search_source.query_doi_cached(
+                doi="10.1234/timeout", etiquette=etiquette
+            )
+    assert query_doi.call_count == 4
@@ -10,10 +10,12 @@ from pathlib import Path
 import git
 import pytest
 
+import colrev.env.doi_metadata_cache
 import colrev.env.local_index
 import colrev.env.local_index_builder
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.init
+import colrev.packages.crossref.src.crossref_search_source
 import colrev.record.record_pdf
 import colrev.review_manager
 from colrev.constants import ENTRYTYPES
@@ -97,6 +99,21 @@ def run_around_tests(  # type: ignore
     helpers.reset_commit(base_repo_review_manager, commit="data_commit")
 
 
+@pytest.fixture(autouse=True)
+def doi_metadata_cache(mocker, tmp_path):  # type: ignore
+    """Fixture providing an empty DOI metadata cache for each test"""
+    cache = colrev.env.doi_metadata_cache.DOIMetadataCache(
+        cache_path=tmp_path / Path("doi_metadata_cache.db")
+    )
+    mocker.patch.object(
+        colrev.packages.crossref.src.crossref_search_source,
+        "_DOI_METADATA_CACHE",
+        cache,
+    )
+    yield cache
+    cache.close()
+
+
 @pytest.fixture(scope="session", name="test_local_index_dir")
 def get_test_local_index_dir(tmp_path_factory):  # type: ignore
     """Fixture returning the test_local_index_dir"""